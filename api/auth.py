@@ -5,7 +5,7 @@ import hmac
 import os
 import secrets
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import AsyncGenerator, Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
@@ -110,10 +110,19 @@ def decode_token(token: str) -> Optional[TokenData]:
         return None
 
 
-def get_db() -> Database:
-    """Get database instance (singleton)."""
+async def get_db() -> AsyncGenerator[Database, None]:
+    """Get database instance (singleton).
+    
+    Releases the request's scoped session once the request is done.
+    Declared async so setup and teardown run on the same thread as the
+    async route handlers that share the session.
+    """
     from api.main import get_database
-    return get_database()
+    db = get_database()
+    try:
+        yield db
+    finally:
+        db.remove_session()
 
 
 async def get_current_user(
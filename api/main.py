@@ -43,7 +43,7 @@ async def lifespan(app: FastAPI):
     """Application lifespan handler - runs on startup and shutdown."""
     # Startup: ensure database tables exist
     db = get_database()
-    db.create_tables()
+    db.ensure_schema()
     yield
     # Shutdown: nothing to clean up for SQLite
 
@@ -33,10 +33,7 @@ async def create_prediction(
             )
         
         # Check if user already has a prediction for this fight
-        existing = db.get_user_prediction_for_fight(
-            session, user.id, prediction_data.fight_id
-        )
-        if existing:
+        if db.has_user_prediction_for_fight(session, user.id, prediction_data.fight_id):
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="You have already submitted a prediction for this fight. Predictions cannot be changed.",
@@ -50,10 +50,7 @@ async def create_scorecard(
             )
         
         # Check if user already has a scorecard for this fight
-        existing = db.get_user_scorecard_for_fight(
-            session, user.id, scorecard_data.fight_id
-        )
-        if existing:
+        if db.has_user_scorecard_for_fight(session, user.id, scorecard_data.fight_id):
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="You have already submitted a scorecard for this fight. Scorecards cannot be changed.",
@@ -1,16 +1,21 @@
 """Database operations for MMA scraper and scoring app."""
 
+import threading
+import time
+from collections import Counter, OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Tuple
 
 
 def utc_now() -> datetime:
     """Get current UTC datetime (timezone-aware)."""
     return datetime.now(timezone.utc)
 
-from sqlalchemy import create_engine, select, func
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import bindparam, create_engine, delete, event, insert, select, update, func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Row, RowMapping
+from sqlalchemy.orm import Session, sessionmaker, scoped_session, selectinload, Load
 from rich.console import Console
 
 from .models import (
@@ -21,6 +26,44 @@ from .models import (
 
 console = Console()
 
+# How long aggregated crowd-wisdom stats are served from memory
+STATS_CACHE_TTL_SECONDS = 30
+
+# Most (kind, fight_id) entries kept in the stats cache; the oldest go first
+STATS_CACHE_MAX_ENTRIES = 2048
+
+# WAL pages written before SQLite checkpoints automatically
+WAL_AUTOCHECKPOINT_PAGES = 1000
+
+# Page cache per connection, in KiB (negative cache_size means KiB, not pages)
+SQLITE_CACHE_SIZE_KIB = 64000
+
+# Bytes of the database file memory-mapped per connection (reads skip a copy)
+SQLITE_MMAP_SIZE_BYTES = 256 * 1024 * 1024
+
+# Session.info key for (database, fight_id, kind) stats to drop after commit
+STALE_STATS_INFO_KEY = "stale_stats"
+
+# Modes accepted by PRAGMA wal_checkpoint
+CHECKPOINT_MODES = ("PASSIVE", "FULL", "RESTART", "TRUNCATE")
+
+# Names per IN (...) lookup in get_or_create_fighters
+FIGHTER_LOOKUP_CHUNK = 500
+
+# Stored in PRAGMA user_version once create_tables has run; bump it whenever
+# a table or index is added to the models so ensure_schema creates it
+SCHEMA_VERSION = 1
+
+# Fight columns refreshed when a scraped matchup already exists
+FIGHT_UPSERT_COLUMNS = ("card_type", "weight_class", "rounds", "scheduled_time", "fight_order")
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_stats(session: Session) -> None:
+    """Drop the stats cache entries queued by writes in the committed transaction."""
+    for db, fight_id, kind in session.info.pop(STALE_STATS_INFO_KEY, ()):
+        db.invalidate_stats_cache(fight_id, kind)
+
 
 class Database:
     """Database manager for MMA scraper data."""
@@ -33,16 +76,131 @@ class Database:
         """
         self.db_path = Path(db_path)
         self.engine = create_engine(f"sqlite:///{db_path}", echo=False)
+        event.listen(self.engine, "connect", self._on_connect)
+        event.listen(self.engine, "close", self._on_close)
         self.SessionLocal = sessionmaker(bind=self.engine)
+        # Thread-local session registry so repeated get_session() calls on the
+        # same thread reuse one Session (and its pooled connection)
+        self.ScopedSession = scoped_session(self.SessionLocal)
+        # In-process stats cache: {(kind, fight_id): (expires_at, stats)}, in
+        # insertion order - with one TTL for all entries that is expiry order too
+        self._stats_cache: OrderedDict[Tuple[str, int], Tuple[float, Dict[str, Any]]] = OrderedDict()
+        self._stats_cache_lock = threading.Lock()
+        
+    @staticmethod
+    def _on_connect(dbapi_connection, connection_record) -> None:
+        """Apply per-connection SQLite settings."""
+        cursor = dbapi_connection.cursor()
+        # Needed for ON DELETE CASCADE; SQLite leaves FK enforcement off by default
+        cursor.execute("PRAGMA foreign_keys=ON")
+        # WAL: readers don't block the writer, and with synchronous=NORMAL a
+        # commit appends to the -wal file without an fsync (fsyncs happen at
+        # checkpoints). Creates -wal/-shm files next to the database.
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute(f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KIB}")
+        cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE_BYTES}")
+        cursor.execute(f"PRAGMA wal_autocheckpoint={WAL_AUTOCHECKPOINT_PAGES}")
+        cursor.close()
+    
+    @staticmethod
+    def _on_close(dbapi_connection, connection_record) -> None:
+        """Refresh query planner statistics before a connection is closed.
+        
+        PRAGMA optimize only analyzes tables whose queries on this connection
+        would benefit, so it is usually a no-op.
+        """
+        dbapi_connection.execute("PRAGMA optimize")
+    
+    def checkpoint(self, mode: str = "PASSIVE") -> None:
+        """Checkpoint the write-ahead log into the main database file.
         
+        Args:
+            mode: One of CHECKPOINT_MODES. TRUNCATE also shrinks the -wal
+                file back to zero bytes, which is useful after big batches.
+        """
+        mode = mode.upper()
+        if mode not in CHECKPOINT_MODES:
+            raise ValueError(f"Invalid checkpoint mode: {mode}")
+        with self.engine.connect() as conn:
+            conn.exec_driver_sql(f"PRAGMA wal_checkpoint({mode})")
+    
     def create_tables(self) -> None:
         """Create all database tables."""
         Base.metadata.create_all(self.engine)
         console.print("[green]✓[/green] Database tables created/verified")
     
+    def ensure_schema(self) -> None:
+        """Create tables unless the database is already at SCHEMA_VERSION.
+        
+        A database that is up to date costs one PRAGMA read instead of the
+        per-table checks create_all runs.
+        """
+        with self.engine.connect() as conn:
+            version = conn.exec_driver_sql("PRAGMA user_version").scalar()
+        if version == SCHEMA_VERSION:
+            return
+        self.create_tables()
+        with self.engine.connect() as conn:
+            conn.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    
     def get_session(self) -> Session:
-        """Get a new database session."""
-        return self.SessionLocal()
+        """Get the current thread's database session."""
+        return self.ScopedSession()
+    
+    def remove_session(self) -> None:
+        """Close and discard the current thread's session."""
+        self.ScopedSession.remove()
+    
+    # Stats cache
+    def _get_cached_stats(self, kind: str, fight_id: int) -> Optional[Dict[str, Any]]:
+        """Return cached stats for a fight if they haven't expired."""
+        with self._stats_cache_lock:
+            entry = self._stats_cache.get((kind, fight_id))
+            if entry is None:
+                return None
+            expires_at, stats = entry
+            if time.monotonic() > expires_at:
+                del self._stats_cache[(kind, fight_id)]
+                return None
+            return stats
+    
+    def _set_cached_stats(self, kind: str, fight_id: int, stats: Dict[str, Any]) -> None:
+        """Store stats for a fight for STATS_CACHE_TTL_SECONDS.
+        
+        Expired entries and anything over STATS_CACHE_MAX_ENTRIES are evicted
+        oldest first, so fights read once don't stay in memory.
+        """
+        now = time.monotonic()
+        with self._stats_cache_lock:
+            self._stats_cache.pop((kind, fight_id), None)
+            self._stats_cache[(kind, fight_id)] = (now + STATS_CACHE_TTL_SECONDS, stats)
+            while self._stats_cache:
+                expires_at, _ = next(iter(self._stats_cache.values()))
+                if expires_at >= now and len(self._stats_cache) <= STATS_CACHE_MAX_ENTRIES:
+                    break
+                self._stats_cache.popitem(last=False)
+    
+    def invalidate_stats_cache(self, fight_id: int, kind: Optional[str] = None) -> None:
+        """Drop cached stats for a fight.
+        
+        Args:
+            fight_id: Fight whose stats changed.
+            kind: "predictions" or "scorecards"; None drops both.
+        """
+        kinds = [kind] if kind else ["predictions", "scorecards"]
+        with self._stats_cache_lock:
+            for k in kinds:
+                self._stats_cache.pop((k, fight_id), None)
+    
+    def _invalidate_stats_cache_on_commit(self, session: Session, fight_id: int, kind: str) -> None:
+        """Drop cached stats for a fight once the session commits.
+        
+        Dropping them at flush time would let a concurrent read cache the
+        old committed stats again until the TTL runs out.
+        """
+        session.info.setdefault(STALE_STATS_INFO_KEY, set()).add((self, fight_id, kind))
     
     # Fighter operations
     def get_or_create_fighter(
@@ -69,6 +227,7 @@ class Database:
         losses_submission: Optional[int] = None,
         losses_decision: Optional[int] = None,
         profile_scraped: bool = False,
+        cache: Optional[Dict[str, Fighter]] = None,
     ) -> Fighter:
         """Get existing fighter or create new one.
         
@@ -81,13 +240,19 @@ class Database:
             draws: Number of draws.
             profile_url: URL to fighter's profile.
             + extended stats
+            cache: Optional name -> Fighter dict (see get_fighters_by_names);
+                hits skip the SELECT, and the result is stored back.
             
         Returns:
             Fighter instance.
         """
         # Try to find existing fighter by name
-        stmt = select(Fighter).where(Fighter.name == name)
-        fighter = session.execute(stmt).scalar_one_or_none()
+        fighter = cache.get(name) if cache is not None else None
+        if fighter is None:
+            stmt = select(Fighter).where(Fighter.name == name)
+            fighter = session.execute(stmt).scalar_one_or_none()
+        if cache is not None and fighter is not None:
+            cache[name] = fighter
         
         if fighter:
             # Update record if it changed
@@ -159,16 +324,131 @@ class Database:
         )
         session.add(fighter)
         session.flush()  # Get the ID
+        if cache is not None:
+            cache[name] = fighter
         return fighter
     
-    def get_fighters_without_profiles(self, session: Session) -> List[Fighter]:
-        """Get fighters that haven't had their profiles scraped yet."""
-        stmt = select(Fighter).where(Fighter.profile_scraped == False)
-        return list(session.execute(stmt).scalars().all())
+    def get_fighters_by_names(self, session: Session, names: Iterable[str]) -> Dict[str, Fighter]:
+        """Load fighters for many names with chunked IN queries.
+        
+        Args:
+            session: Database session.
+            names: Fighter names; duplicates are ignored.
+            
+        Returns:
+            Mapping of name to Fighter for the names that exist.
+        """
+        fighters: Dict[str, Fighter] = {}
+        names = list(dict.fromkeys(names))
+        for start in range(0, len(names), FIGHTER_LOOKUP_CHUNK):
+            stmt = select(Fighter).where(Fighter.name.in_(names[start:start + FIGHTER_LOOKUP_CHUNK]))
+            for fighter in session.execute(stmt).scalars():
+                fighters.setdefault(fighter.name, fighter)
+        return fighters
+    
+    def get_or_create_fighters(
+        self, session: Session, fighters: List[Dict[str, Any]]
+    ) -> Dict[str, int]:
+        """Get or create many fighters with one lookup and one bulk insert.
+        
+        Existing fighters are updated with the same rules as
+        get_or_create_fighter. Entries repeating a name are merged in order,
+        so the last record wins and a country/profile_url seen earlier is kept.
+        
+        Args:
+            session: Database session.
+            fighters: Dicts with name, country, wins, losses, draws, profile_url.
+            
+        Returns:
+            Mapping of fighter name to fighter ID.
+        """
+        by_name: Dict[str, Dict[str, Any]] = {}
+        for data in fighters:
+            previous = by_name.get(data["name"])
+            if previous:
+                data = {
+                    **data,
+                    "country": data["country"] or previous["country"],
+                    "profile_url": data["profile_url"] or previous["profile_url"],
+                }
+            by_name[data["name"]] = data
+        
+        ids: Dict[str, int] = {}
+        for name, fighter in self.get_fighters_by_names(session, by_name).items():
+            data = by_name[name]
+            if (fighter.wins != data["wins"] or fighter.losses != data["losses"] or
+                fighter.draws != data["draws"]):
+                fighter.wins = data["wins"]
+                fighter.losses = data["losses"]
+                fighter.draws = data["draws"]
+                fighter.updated_at = utc_now()
+            if data["country"] and fighter.country != data["country"]:
+                fighter.country = data["country"]
+            if data["profile_url"] and fighter.profile_url != data["profile_url"]:
+                fighter.profile_url = data["profile_url"]
+            ids[name] = fighter.id
+        
+        new_rows = [data for name, data in by_name.items() if name not in ids]
+        if new_rows:
+            result = session.execute(insert(Fighter).returning(Fighter.id, Fighter.name), new_rows)
+            ids.update({name: fighter_id for fighter_id, name in result})
+        return ids
+    
+    def get_fighters_without_profiles(
+        self, session: Session, limit: Optional[int] = None
+    ) -> List[Row]:
+        """Get fighters that haven't had their profiles scraped yet.
+        
+        Only the id and name are loaded, as plain rows; the profile is
+        written back with update_fighters.
+        
+        Args:
+            session: Database session.
+            limit: Maximum number of fighters to load (None = all).
+        """
+        stmt = select(Fighter.id, Fighter.name).where(Fighter.profile_scraped == False)
+        if limit:
+            stmt = stmt.limit(limit)
+        return list(session.execute(stmt).all())
+    
+    def update_fighters(self, session: Session, rows: List[Dict[str, Any]]) -> int:
+        """Update many fighters by primary key in one executemany statement.
+        
+        Runs as a Core UPDATE, skipping the ORM bulk-update bookkeeping;
+        Fighter objects already in the session are not refreshed.
+        
+        Args:
+            session: Database session.
+            rows: Dicts with the fighter "id" and the columns to set; all
+                rows must set the same columns.
+            
+        Returns:
+            Number of fighters updated.
+        """
+        if not rows:
+            return 0
+        table = Fighter.__table__
+        stmt = update(table).where(table.c.id == bindparam("fighter_id"))
+        params = [
+            {"fighter_id": row["id"], **{k: v for k, v in row.items() if k != "id"}}
+            for row in rows
+        ]
+        session.execute(stmt, params)
+        return len(rows)
     
     def get_fighter_by_name(self, session: Session, name: str) -> Optional[Fighter]:
-        """Get fighter by name."""
-        stmt = select(Fighter).where(Fighter.name == name)
+        """Get fighter by name, ignoring case.
+        
+        Uses idx_fighter_name_lower. SQLite's lower() only folds ASCII, so
+        Cyrillic names still need matching case. An exact-case match wins
+        if several names differ only in case.
+        """
+        stmt = (
+            select(Fighter)
+            .where(func.lower(Fighter.name) == func.lower(name))
+            .order_by((Fighter.name == name).desc())
+            .limit(1)
+        )
         return session.execute(stmt).scalar_one_or_none()
     
     def get_fighter_by_id(self, session: Session, fighter_id: int) -> Optional[Fighter]:
@@ -242,7 +522,11 @@ class Database:
     
     def get_event_by_slug(self, session: Session, slug: str) -> Optional[Event]:
         """Get event by slug."""
-        stmt = select(Event).where(Event.slug == slug)
+        stmt = (
+            select(Event)
+            .where(Event.slug == slug)
+            .options(selectinload(Event.fights).selectinload(Fight.result))
+        )
         return session.execute(stmt).scalar_one_or_none()
     
     def get_upcoming_events(self, session: Session) -> List[Event]:
@@ -251,12 +535,17 @@ class Database:
             select(Event)
             .where(Event.is_upcoming == True)
             .order_by(Event.event_date)
+            .options(selectinload(Event.fights))
         )
         return list(session.execute(stmt).scalars().all())
     
     def get_all_events(self, session: Session) -> List[Event]:
         """Get all events."""
-        stmt = select(Event).order_by(Event.event_date.desc())
+        stmt = (
+            select(Event)
+            .order_by(Event.event_date.desc())
+            .options(selectinload(Event.fights))
+        )
         return list(session.execute(stmt).scalars().all())
     
     # Fight operations
@@ -288,39 +577,76 @@ class Database:
         Returns:
             Fight instance.
         """
-        # Check for existing fight
+        fighter1_id = fighter1.id if fighter1 else None
+        fighter2_id = fighter2.id if fighter2 else None
+        values = {
+            "card_type": card_type,
+            "weight_class": weight_class,
+            "rounds": rounds,
+            "scheduled_time": scheduled_time,
+            "fight_order": fight_order,
+        }
+        
+        if fighter1_id is not None and fighter2_id is not None:
+            # Single-statement upsert on uq_fight_matchup
+            stmt = (
+                sqlite_insert(Fight)
+                .values(event_id=event.id, fighter1_id=fighter1_id, fighter2_id=fighter2_id, **values)
+                .on_conflict_do_update(
+                    index_elements=["event_id", "fighter1_id", "fighter2_id"],
+                    set_={**values, "updated_at": utc_now()},
+                )
+                .returning(Fight)
+            )
+            return session.execute(
+                stmt, execution_options={"populate_existing": True}
+            ).scalar_one()
+        
+        # NULLs never conflict in a unique index, so TBA matchups need a lookup
         stmt = select(Fight).where(
             Fight.event_id == event.id,
-            Fight.fighter1_id == (fighter1.id if fighter1 else None),
-            Fight.fighter2_id == (fighter2.id if fighter2 else None),
+            Fight.fighter1_id == fighter1_id,
+            Fight.fighter2_id == fighter2_id,
         )
         fight = session.execute(stmt).scalar_one_or_none()
         
         if fight:
             # Update existing fight
-            fight.card_type = card_type
-            fight.weight_class = weight_class
-            fight.rounds = rounds
-            fight.scheduled_time = scheduled_time
-            fight.fight_order = fight_order
+            for key, value in values.items():
+                setattr(fight, key, value)
             fight.updated_at = utc_now()
             return fight
         
         # Create new fight
-        fight = Fight(
-            event_id=event.id,
-            fighter1_id=fighter1.id if fighter1 else None,
-            fighter2_id=fighter2.id if fighter2 else None,
-            card_type=card_type,
-            weight_class=weight_class,
-            rounds=rounds,
-            scheduled_time=scheduled_time,
-            fight_order=fight_order,
-        )
+        fight = Fight(event_id=event.id, fighter1_id=fighter1_id, fighter2_id=fighter2_id, **values)
         session.add(fight)
         session.flush()
         return fight
     
+    def create_fights(self, session: Session, fights: List[Dict[str, Any]]) -> int:
+        """Upsert many fights in one executemany statement.
+        
+        Args:
+            session: Database session.
+            fights: Dicts with event_id, fighter1_id, fighter2_id and the
+                create_fight fields; may span several events.
+            
+        Returns:
+            Number of fights written.
+        """
+        if not fights:
+            return 0
+        stmt = sqlite_insert(Fight)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["event_id", "fighter1_id", "fighter2_id"],
+            set_={
+                **{key: stmt.excluded[key] for key in FIGHT_UPSERT_COLUMNS},
+                "updated_at": utc_now(),
+            },
+        )
+        session.execute(stmt, fights)
+        return len(fights)
+    
     def get_fights_for_event(self, session: Session, event_id: int) -> List[Fight]:
         """Get all fights for an event."""
         stmt = (
@@ -336,11 +662,19 @@ class Database:
         Returns:
             Number of fights deleted.
         """
-        fights = self.get_fights_for_event(session, event_id)
-        count = len(fights)
-        for fight in fights:
-            session.delete(fight)
-        return count
+        return self.clear_fights_for_events(session, [event_id])
+    
+    def clear_fights_for_events(self, session: Session, event_ids: List[int]) -> int:
+        """Delete all fights for several events in one statement.
+        
+        Returns:
+            Number of fights deleted.
+        """
+        if not event_ids:
+            return 0
+        # Children go with the fights via ON DELETE CASCADE
+        result = session.execute(delete(Fight).where(Fight.event_id.in_(event_ids)))
+        return result.rowcount
     
     # Statistics
     def get_stats(self, session: Session) -> dict:
@@ -388,31 +722,26 @@ class Database:
         Returns:
             User instance.
         """
-        stmt = select(User).where(User.telegram_id == telegram_id)
-        user = session.execute(stmt).scalar_one_or_none()
-        
-        if user:
-            # Update user info
-            user.username = username
-            user.first_name = first_name
-            user.last_name = last_name
-            user.photo_url = photo_url
-            user.auth_date = auth_date
-            user.updated_at = utc_now()
-            return user
-        
-        # Create new user
-        user = User(
-            telegram_id=telegram_id,
-            username=username,
-            first_name=first_name,
-            last_name=last_name,
-            photo_url=photo_url,
-            auth_date=auth_date,
+        profile = {
+            "username": username,
+            "first_name": first_name,
+            "last_name": last_name,
+            "photo_url": photo_url,
+            "auth_date": auth_date,
+        }
+        # Single-statement upsert on the unique telegram_id
+        stmt = (
+            sqlite_insert(User)
+            .values(telegram_id=telegram_id, **profile)
+            .on_conflict_do_update(
+                index_elements=["telegram_id"],
+                set_={**profile, "updated_at": utc_now()},
+            )
+            .returning(User)
         )
-        session.add(user)
-        session.flush()
-        return user
+        return session.execute(
+            stmt, execution_options={"populate_existing": True}
+        ).scalar_one()
     
     def get_user_by_telegram_id(self, session: Session, telegram_id: int) -> Optional[User]:
         """Get user by Telegram ID."""
@@ -451,8 +780,7 @@ class Database:
             ValueError: If prediction already exists.
         """
         # Check if prediction already exists
-        existing = self.get_user_prediction_for_fight(session, user_id, fight_id)
-        if existing:
+        if self.has_user_prediction_for_fight(session, user_id, fight_id):
             raise ValueError("Prediction already exists for this fight. Predictions cannot be changed.")
         
         prediction = Prediction(
@@ -464,6 +792,7 @@ class Database:
         )
         session.add(prediction)
         session.flush()
+        self._invalidate_stats_cache_on_commit(session, fight_id, "predictions")
         return prediction
     
     def get_user_prediction_for_fight(
@@ -476,24 +805,84 @@ class Database:
         )
         return session.execute(stmt).scalar_one_or_none()
     
+    def has_user_prediction_for_fight(
+        self, session: Session, user_id: int, fight_id: int
+    ) -> bool:
+        """Check whether a user has already predicted a fight."""
+        stmt = select(1).where(
+            Prediction.user_id == user_id,
+            Prediction.fight_id == fight_id,
+        ).limit(1)
+        return session.execute(stmt).scalar() is not None
+    
     def get_predictions_for_fight(self, session: Session, fight_id: int) -> List[Prediction]:
-        """Get all predictions for a fight."""
+        """Get all predictions for a fight, with users loaded.
+        
+        Other relationships raise on access instead of lazy-loading per row.
+        """
         stmt = (
             select(Prediction)
             .where(Prediction.fight_id == fight_id)
-            .order_by(Prediction.created_at.desc())
+            .order_by(Prediction.created_at.desc(), Prediction.id.desc())
+            .options(
+                selectinload(Prediction.user),
+                Load(Prediction).raiseload("*"),
+            )
         )
         return list(session.execute(stmt).scalars().all())
     
     def get_user_predictions(self, session: Session, user_id: int) -> List[Prediction]:
-        """Get all predictions by a user."""
+        """Get all predictions by a user, with fights loaded.
+        
+        Other relationships raise on access instead of lazy-loading per row.
+        """
         stmt = (
             select(Prediction)
             .where(Prediction.user_id == user_id)
-            .order_by(Prediction.created_at.desc())
+            .order_by(Prediction.created_at.desc(), Prediction.id.desc())
+            .options(
+                selectinload(Prediction.fight).options(
+                    selectinload(Fight.event), selectinload(Fight.result)
+                ),
+                Load(Prediction).raiseload("*"),
+            )
         )
         return list(session.execute(stmt).scalars().all())
     
+    # Columns returned by the lightweight *_rows listing methods
+    _PREDICTION_ROW_COLUMNS = (
+        Prediction.id,
+        Prediction.user_id,
+        Prediction.fight_id,
+        Prediction.predicted_winner,
+        Prediction.win_method,
+        Prediction.confidence,
+        Prediction.created_at,
+        Prediction.is_correct,
+        Prediction.resolved_at,
+    )
+    
+    def get_predictions_for_fight_rows(self, session: Session, fight_id: int) -> List[RowMapping]:
+        """Get all predictions for a fight as plain column mappings.
+        
+        Skips ORM hydration; use when relationships aren't needed.
+        """
+        stmt = (
+            select(*self._PREDICTION_ROW_COLUMNS)
+            .where(Prediction.fight_id == fight_id)
+            .order_by(Prediction.created_at.desc(), Prediction.id.desc())
+        )
+        return list(session.execute(stmt).mappings().all())
+    
+    def get_user_predictions_rows(self, session: Session, user_id: int) -> List[RowMapping]:
+        """Get all predictions by a user as plain column mappings."""
+        stmt = (
+            select(*self._PREDICTION_ROW_COLUMNS)
+            .where(Prediction.user_id == user_id)
+            .order_by(Prediction.created_at.desc(), Prediction.id.desc())
+        )
+        return list(session.execute(stmt).mappings().all())
+    
     # Scorecard operations
     def create_scorecard(
         self,
@@ -517,14 +906,17 @@ class Database:
             ValueError: If scorecard already exists.
         """
         # Check if scorecard already exists
-        existing = self.get_user_scorecard_for_fight(session, user_id, fight_id)
-        if existing:
+        if self.has_user_scorecard_for_fight(session, user_id, fight_id):
             raise ValueError("Scorecard already exists for this fight. Scorecards cannot be changed.")
         
         scorecard = Scorecard(
             user_id=user_id,
             fight_id=fight_id,
         )
+        scorecard.set_totals(
+            sum(rs["fighter1_score"] for rs in round_scores),
+            sum(rs["fighter2_score"] for rs in round_scores),
+        )
         session.add(scorecard)
         session.flush()
         
@@ -539,6 +931,7 @@ class Database:
             session.add(round_score)
         
         session.flush()
+        self._invalidate_stats_cache_on_commit(session, fight_id, "scorecards")
         return scorecard
     
     def get_user_scorecard_for_fight(
@@ -551,33 +944,108 @@ class Database:
         )
         return session.execute(stmt).scalar_one_or_none()
     
+    def has_user_scorecard_for_fight(
+        self, session: Session, user_id: int, fight_id: int
+    ) -> bool:
+        """Check whether a user has already scored a fight."""
+        stmt = select(1).where(
+            Scorecard.user_id == user_id,
+            Scorecard.fight_id == fight_id,
+        ).limit(1)
+        return session.execute(stmt).scalar() is not None
+    
     def get_scorecards_for_fight(self, session: Session, fight_id: int) -> List[Scorecard]:
-        """Get all scorecards for a fight."""
+        """Get all scorecards for a fight, with users and round scores loaded.
+        
+        Other relationships raise on access instead of lazy-loading per row.
+        """
         stmt = (
             select(Scorecard)
             .where(Scorecard.fight_id == fight_id)
-            .order_by(Scorecard.created_at.desc())
+            .order_by(Scorecard.created_at.desc(), Scorecard.id.desc())
+            .options(
+                selectinload(Scorecard.user),
+                selectinload(Scorecard.round_scores),
+                Load(Scorecard).raiseload("*"),
+            )
         )
         return list(session.execute(stmt).scalars().all())
     
     def get_user_scorecards(self, session: Session, user_id: int) -> List[Scorecard]:
-        """Get all scorecards by a user."""
+        """Get all scorecards by a user, with fights and round scores loaded.
+        
+        Other relationships raise on access instead of lazy-loading per row.
+        """
         stmt = (
             select(Scorecard)
             .where(Scorecard.user_id == user_id)
-            .order_by(Scorecard.created_at.desc())
+            .order_by(Scorecard.created_at.desc(), Scorecard.id.desc())
+            .options(
+                selectinload(Scorecard.round_scores),
+                selectinload(Scorecard.fight).options(
+                    selectinload(Fight.event), selectinload(Fight.result)
+                ),
+                Load(Scorecard).raiseload("*"),
+            )
         )
         return list(session.execute(stmt).scalars().all())
     
+    _SCORECARD_ROW_COLUMNS = (
+        Scorecard.id,
+        Scorecard.user_id,
+        Scorecard.fight_id,
+        Scorecard.created_at,
+        Scorecard.correct_rounds,
+        Scorecard.total_rounds,
+        Scorecard.resolved_at,
+    )
+    
+    def get_scorecards_for_fight_rows(self, session: Session, fight_id: int) -> List[RowMapping]:
+        """Get all scorecards for a fight as plain column mappings (no round scores)."""
+        stmt = (
+            select(*self._SCORECARD_ROW_COLUMNS)
+            .where(Scorecard.fight_id == fight_id)
+            .order_by(Scorecard.created_at.desc(), Scorecard.id.desc())
+        )
+        return list(session.execute(stmt).mappings().all())
+    
+    def get_user_scorecards_rows(self, session: Session, user_id: int) -> List[RowMapping]:
+        """Get all scorecards by a user as plain column mappings (no round scores)."""
+        stmt = (
+            select(*self._SCORECARD_ROW_COLUMNS)
+            .where(Scorecard.user_id == user_id)
+            .order_by(Scorecard.created_at.desc(), Scorecard.id.desc())
+        )
+        return list(session.execute(stmt).mappings().all())
+    
     # Aggregation / Crowd Wisdom
     def get_fight_prediction_stats(self, session: Session, fight_id: int) -> Dict[str, Any]:
         """Get aggregated prediction statistics for a fight.
         
+        Results are cached per fight for STATS_CACHE_TTL_SECONDS and
+        invalidated when a new prediction is committed.
+        
         Returns:
             Dict with prediction counts and percentages.
         """
-        predictions = self.get_predictions_for_fight(session, fight_id)
-        total = len(predictions)
+        cached = self._get_cached_stats("predictions", fight_id)
+        if cached is not None:
+            return cached
+        
+        stats = self._compute_fight_prediction_stats(session, fight_id)
+        self._set_cached_stats("predictions", fight_id, stats)
+        return stats
+    
+    def _compute_fight_prediction_stats(self, session: Session, fight_id: int) -> Dict[str, Any]:
+        """Aggregate prediction statistics for a fight from the database."""
+        # Grouped counts straight from idx_prediction_fight_cover (index-only scan)
+        stmt = (
+            select(Prediction.predicted_winner, Prediction.win_method, func.count())
+            .where(Prediction.fight_id == fight_id)
+            .group_by(Prediction.predicted_winner, Prediction.win_method)
+        )
+        counts = Counter({(winner, method): n for winner, method, n in session.execute(stmt)})
+        total = sum(counts.values())
         
         if total == 0:
             return {
@@ -589,17 +1057,17 @@ class Database:
                 "methods": {},
             }
         
-        fighter1_picks = sum(1 for p in predictions if p.predicted_winner == PredictedWinner.FIGHTER1)
+        fighter1_picks = sum(v for (winner, _), v in counts.items() if winner == PredictedWinner.FIGHTER1)
         fighter2_picks = total - fighter1_picks
         
         # Count by method
-        methods: Dict[str, Dict[str, int]] = {}
-        for method in WinMethod:
-            method_preds = [p for p in predictions if p.win_method == method]
-            methods[method.value] = {
-                "fighter1": sum(1 for p in method_preds if p.predicted_winner == PredictedWinner.FIGHTER1),
-                "fighter2": sum(1 for p in method_preds if p.predicted_winner == PredictedWinner.FIGHTER2),
+        methods: Dict[str, Dict[str, int]] = {
+            method.value: {
+                "fighter1": counts.get((PredictedWinner.FIGHTER1, method), 0),
+                "fighter2": counts.get((PredictedWinner.FIGHTER2, method), 0),
             }
+            for method in WinMethod
+        }
         
         return {
             "total_predictions": total,
@@ -613,11 +1081,41 @@ class Database:
     def get_fight_scorecard_stats(self, session: Session, fight_id: int) -> Dict[str, Any]:
         """Get aggregated scorecard statistics for a fight.
         
+        Results are cached per fight for STATS_CACHE_TTL_SECONDS and
+        invalidated when a new scorecard is committed.
+        
         Returns:
             Dict with average scores per round and winner consensus.
         """
-        scorecards = self.get_scorecards_for_fight(session, fight_id)
-        total = len(scorecards)
+        cached = self._get_cached_stats("scorecards", fight_id)
+        if cached is not None:
+            return cached
+        
+        stats = self._compute_fight_scorecard_stats(session, fight_id)
+        self._set_cached_stats("scorecards", fight_id, stats)
+        return stats
+    
+    def _compute_fight_scorecard_stats(self, session: Session, fight_id: int) -> Dict[str, Any]:
+        """Aggregate scorecard statistics for a fight from the database."""
+        # Winner counts and score totals come from the materialized columns
+        winner_stmt = (
+            select(
+                Scorecard.winner,
+                func.count(Scorecard.id),
+                func.sum(Scorecard.total_fighter1),
+                func.sum(Scorecard.total_fighter2),
+            )
+            .where(Scorecard.fight_id == fight_id)
+            .group_by(Scorecard.winner)
+        )
+        winner_counts: Dict[Optional[str], int] = {}
+        sum_total_f1 = 0
+        sum_total_f2 = 0
+        for winner, count, t1, t2 in session.execute(winner_stmt):
+            winner_counts[winner] = count
+            sum_total_f1 += t1 or 0
+            sum_total_f2 += t2 or 0
+        total = sum(winner_counts.values())
         
         if total == 0:
             return {
@@ -637,15 +1135,21 @@ class Database:
         num_rounds = fight.rounds or 3
         
         # Aggregate round scores
+        round_stmt = (
+            select(RoundScore.round_number, RoundScore.fighter1_score, RoundScore.fighter2_score)
+            .join(Scorecard, RoundScore.scorecard_id == Scorecard.id)
+            .where(
+                Scorecard.fight_id == fight_id,
+                RoundScore.round_number.between(1, num_rounds),
+            )
+        )
+        scores_by_round: Dict[int, List[Tuple[int, int]]] = {}
+        for round_num, f1_score, f2_score in session.execute(round_stmt):
+            scores_by_round.setdefault(round_num, []).append((f1_score, f2_score))
+        
         rounds: Dict[int, Dict[str, float]] = {}
         for round_num in range(1, num_rounds + 1):
-            round_scores = []
-            for sc in scorecards:
-                for rs in sc.round_scores:
-                    if rs.round_number == round_num:
-                        round_scores.append((rs.fighter1_score, rs.fighter2_score))
-                        break
-            
+            round_scores = scores_by_round.get(round_num)
             if round_scores:
                 avg_f1 = sum(s[0] for s in round_scores) / len(round_scores)
                 avg_f2 = sum(s[1] for s in round_scores) / len(round_scores)
@@ -656,14 +1160,13 @@ class Database:
                     "fighter2_round_wins": sum(1 for s in round_scores if s[1] > s[0]),
                 }
         
-        # Count overall winners
-        fighter1_wins = sum(1 for sc in scorecards if sc.winner == "fighter1")
-        fighter2_wins = sum(1 for sc in scorecards if sc.winner == "fighter2")
-        draws = sum(1 for sc in scorecards if sc.winner == "draw")
+        fighter1_wins = winner_counts.get("fighter1", 0)
+        fighter2_wins = winner_counts.get("fighter2", 0)
+        draws = winner_counts.get("draw", 0)
         
         # Average totals
-        avg_total_f1 = sum(sc.total_fighter1 for sc in scorecards) / total
-        avg_total_f2 = sum(sc.total_fighter2 for sc in scorecards) / total
+        avg_total_f1 = sum_total_f1 / total
+        avg_total_f2 = sum_total_f2 / total
         
         return {
             "total_scorecards": total,
@@ -679,14 +1182,15 @@ class Database:
     
     def get_user_stats(self, session: Session, user_id: int) -> Dict[str, Any]:
         """Get user statistics."""
-        predictions = self.get_user_predictions(session, user_id)
-        scorecards = self.get_user_scorecards(session, user_id)
+        predictions = self.get_user_predictions_rows(session, user_id)
+        scorecards = self.get_user_scorecards_rows(session, user_id)
+        method_counts = Counter(p["win_method"] for p in predictions)
         
         return {
             "total_predictions": len(predictions),
             "total_scorecards": len(scorecards),
             "predictions_by_method": {
-                method.value: sum(1 for p in predictions if p.win_method == method)
+                method.value: method_counts.get(method, 0)
                 for method in WinMethod
             },
         }
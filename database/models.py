@@ -12,6 +12,7 @@ def utc_now() -> datetime:
 from sqlalchemy import (
     String,
     Integer,
+    Float,
     BigInteger,
     DateTime,
     Date,
@@ -20,14 +21,23 @@ from sqlalchemy import (
     UniqueConstraint,
     Index,
     Enum as SQLEnum,
+    select,
+    func,
+    text,
 )
 from sqlalchemy.orm import (
     DeclarativeBase,
     Mapped,
     mapped_column,
+    column_property,
     relationship,
 )
 
+# Insert timestamp default: UTC like CURRENT_TIMESTAMP, but with milliseconds,
+# so rows created in the same second still sort by created_at (and alongside
+# older Python-stamped rows, which carry microseconds)
+NOW_SUBSECOND = text("(strftime('%Y-%m-%d %H:%M:%f', 'now'))")
+
 
 class WinMethod(str, Enum):
     """Possible methods of victory."""
@@ -51,6 +61,14 @@ class FightWinner(str, Enum):
     NO_CONTEST = "no_contest"
 
 
+def _enum_column(enum_cls: type) -> SQLEnum:
+    """Enum column type: a native ENUM on Postgres, a CHECK-constrained VARCHAR on SQLite.
+    
+    String values are validated against the enum members on bind as well.
+    """
+    return SQLEnum(enum_cls, native_enum=True, create_constraint=True, validate_strings=True)
+
+
 class Base(DeclarativeBase):
     """Base class for all models."""
     pass
@@ -72,7 +90,7 @@ class Fighter(Base):
     # Physical stats
     age: Mapped[Optional[int]] = mapped_column(Integer)
     height_cm: Mapped[Optional[int]] = mapped_column(Integer)
-    weight_kg: Mapped[Optional[float]] = mapped_column(Integer)  # Stored as int, exposed as float
+    weight_kg: Mapped[Optional[float]] = mapped_column(Float)
     reach_cm: Mapped[Optional[int]] = mapped_column(Integer)
     
     # Fighting info
@@ -94,9 +112,11 @@ class Fighter(Base):
     profile_url: Mapped[Optional[str]] = mapped_column(String(500))
     profile_scraped: Mapped[bool] = mapped_column(default=False)
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
+    # Insert timestamps come from the database (NOW_SUBSECOND, UTC) and are
+    # read back via RETURNING; only updates are stamped from Python
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=NOW_SUBSECOND)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=utc_now, onupdate=utc_now
+        DateTime, server_default=NOW_SUBSECOND, onupdate=utc_now
     )
     
     # Relationships
@@ -110,6 +130,10 @@ class Fighter(Base):
     # Create index on name for faster lookups
     __table_args__ = (
         Index("idx_fighter_name", "name"),
+        # Case-insensitive lookups: lower(name) = lower(?)
+        Index("idx_fighter_name_lower", func.lower(name)),
+        # Pending profile scrapes in id order; empties out as profiles are filled
+        Index("idx_fighter_unscraped", "id", sqlite_where=text("profile_scraped = 0")),
     )
     
     @property
@@ -135,19 +159,21 @@ class Event(Base):
     url: Mapped[str] = mapped_column(String(500), nullable=False, unique=True)
     slug: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
     is_upcoming: Mapped[bool] = mapped_column(default=True)
-    scraped_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
+    scraped_at: Mapped[datetime] = mapped_column(DateTime, server_default=NOW_SUBSECOND)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=utc_now, onupdate=utc_now
+        DateTime, server_default=NOW_SUBSECOND, onupdate=utc_now
     )
     
     # Relationships
     fights: Mapped[List["Fight"]] = relationship(
-        "Fight", back_populates="event", cascade="all, delete-orphan"
+        "Fight", back_populates="event", cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     
     __table_args__ = (
         Index("idx_event_date", "event_date"),
-        Index("idx_event_org", "organization"),
+        # Per-organization listings ordered by date; also serves organization-only filters
+        Index("idx_event_org_date", "organization", "event_date"),
     )
     
     def __repr__(self) -> str:
@@ -160,7 +186,7 @@ class Fight(Base):
     __tablename__ = "fights"
     
     id: Mapped[int] = mapped_column(primary_key=True)
-    event_id: Mapped[int] = mapped_column(ForeignKey("events.id"), nullable=False)
+    event_id: Mapped[int] = mapped_column(ForeignKey("events.id", ondelete="CASCADE"), nullable=False)
     fighter1_id: Mapped[Optional[int]] = mapped_column(ForeignKey("fighters.id"))
     fighter2_id: Mapped[Optional[int]] = mapped_column(ForeignKey("fighters.id"))
     card_type: Mapped[str] = mapped_column(String(50), default="main")  # main/prelim
@@ -168,18 +194,21 @@ class Fight(Base):
     rounds: Mapped[Optional[int]] = mapped_column(Integer)
     scheduled_time: Mapped[Optional[str]] = mapped_column(String(10))
     fight_order: Mapped[Optional[int]] = mapped_column(Integer)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=NOW_SUBSECOND)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=utc_now, onupdate=utc_now
+        DateTime, server_default=NOW_SUBSECOND, onupdate=utc_now
     )
     
     # Relationships
     event: Mapped["Event"] = relationship("Event", back_populates="fights")
+    # Fighters are needed whenever a fight is displayed, so load them in bulk
     fighter1: Mapped[Optional["Fighter"]] = relationship(
-        "Fighter", foreign_keys=[fighter1_id], back_populates="fights_as_fighter1"
+        "Fighter", foreign_keys=[fighter1_id], back_populates="fights_as_fighter1",
+        lazy="selectin",
     )
     fighter2: Mapped[Optional["Fighter"]] = relationship(
-        "Fighter", foreign_keys=[fighter2_id], back_populates="fights_as_fighter2"
+        "Fighter", foreign_keys=[fighter2_id], back_populates="fights_as_fighter2",
+        lazy="selectin",
     )
     
     __table_args__ = (
@@ -192,13 +221,16 @@ class Fight(Base):
     
     # Relationships for scoring
     predictions: Mapped[List["Prediction"]] = relationship(
-        "Prediction", back_populates="fight", cascade="all, delete-orphan"
+        "Prediction", back_populates="fight", cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     scorecards: Mapped[List["Scorecard"]] = relationship(
-        "Scorecard", back_populates="fight", cascade="all, delete-orphan"
+        "Scorecard", back_populates="fight", cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     result: Mapped[Optional["FightResult"]] = relationship(
-        "FightResult", back_populates="fight", uselist=False, cascade="all, delete-orphan"
+        "FightResult", back_populates="fight", uselist=False, cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     
     def __repr__(self) -> str:
@@ -219,17 +251,19 @@ class User(Base):
     last_name: Mapped[Optional[str]] = mapped_column(String(255))
     photo_url: Mapped[Optional[str]] = mapped_column(String(500))
     auth_date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=NOW_SUBSECOND)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=utc_now, onupdate=utc_now
+        DateTime, server_default=NOW_SUBSECOND, onupdate=utc_now
     )
     
     # Relationships
     predictions: Mapped[List["Prediction"]] = relationship(
-        "Prediction", back_populates="user", cascade="all, delete-orphan"
+        "Prediction", back_populates="user", cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     scorecards: Mapped[List["Scorecard"]] = relationship(
-        "Scorecard", back_populates="user", cascade="all, delete-orphan"
+        "Scorecard", back_populates="user", cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     
     __table_args__ = (
@@ -256,14 +290,14 @@ class Prediction(Base):
     __tablename__ = "predictions"
     
     id: Mapped[int] = mapped_column(primary_key=True)
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
-    fight_id: Mapped[int] = mapped_column(ForeignKey("fights.id"), nullable=False)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    fight_id: Mapped[int] = mapped_column(ForeignKey("fights.id", ondelete="CASCADE"), nullable=False)
     predicted_winner: Mapped[PredictedWinner] = mapped_column(
-        SQLEnum(PredictedWinner), nullable=False
+        _enum_column(PredictedWinner), nullable=False
     )
-    win_method: Mapped[WinMethod] = mapped_column(SQLEnum(WinMethod), nullable=False)
+    win_method: Mapped[WinMethod] = mapped_column(_enum_column(WinMethod), nullable=False)
     confidence: Mapped[Optional[int]] = mapped_column(Integer)  # 1-5 confidence level
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=NOW_SUBSECOND)
     
     # Resolution fields
     is_correct: Mapped[Optional[bool]] = mapped_column(default=None)
@@ -275,9 +309,10 @@ class Prediction(Base):
     
     __table_args__ = (
         # One prediction per user per fight
+        # Also serves user_id lookups (leading column), so no separate user index
         UniqueConstraint("user_id", "fight_id", name="uq_user_fight_prediction"),
-        Index("idx_prediction_fight", "fight_id"),
-        Index("idx_prediction_user", "user_id"),
+        # Covers the per-fight winner/method aggregate without touching the table
+        Index("idx_prediction_fight_cover", "fight_id", "predicted_winner", "win_method"),
     )
     
     def __repr__(self) -> str:
@@ -290,9 +325,14 @@ class Scorecard(Base):
     __tablename__ = "scorecards"
     
     id: Mapped[int] = mapped_column(primary_key=True)
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
-    fight_id: Mapped[int] = mapped_column(ForeignKey("fights.id"), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    fight_id: Mapped[int] = mapped_column(ForeignKey("fights.id", ondelete="CASCADE"), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=NOW_SUBSECOND)
+    
+    # Totals materialized at insert time from the round scores
+    total_fighter1: Mapped[int] = mapped_column(Integer, default=0)
+    total_fighter2: Mapped[int] = mapped_column(Integer, default=0)
+    winner: Mapped[Optional[str]] = mapped_column(String(8))  # fighter1/fighter2/draw
     
     # Resolution fields
     correct_rounds: Mapped[int] = mapped_column(Integer, default=0)
@@ -303,34 +343,28 @@ class Scorecard(Base):
     user: Mapped["User"] = relationship("User", back_populates="scorecards")
     fight: Mapped["Fight"] = relationship("Fight", back_populates="scorecards")
     round_scores: Mapped[List["RoundScore"]] = relationship(
-        "RoundScore", back_populates="scorecard", cascade="all, delete-orphan"
+        "RoundScore", back_populates="scorecard", cascade="all, delete-orphan",
+        passive_deletes=True, lazy="selectin",
     )
     
     __table_args__ = (
         # One scorecard per user per fight
+        # Also serves user_id lookups (leading column), so no separate user index
         UniqueConstraint("user_id", "fight_id", name="uq_user_fight_scorecard"),
-        Index("idx_scorecard_fight", "fight_id"),
-        Index("idx_scorecard_user", "user_id"),
+        # Covers the per-fight winner/totals aggregate without touching the table
+        Index("idx_scorecard_fight_cover", "fight_id", "winner", "total_fighter1", "total_fighter2"),
     )
     
-    @property
-    def total_fighter1(self) -> int:
-        """Calculate total score for fighter 1."""
-        return sum(rs.fighter1_score for rs in self.round_scores)
-    
-    @property
-    def total_fighter2(self) -> int:
-        """Calculate total score for fighter 2."""
-        return sum(rs.fighter2_score for rs in self.round_scores)
-    
-    @property
-    def winner(self) -> Optional[str]:
-        """Determine the winner based on scores."""
-        if self.total_fighter1 > self.total_fighter2:
-            return "fighter1"
-        elif self.total_fighter2 > self.total_fighter1:
-            return "fighter2"
-        return "draw"
+    def set_totals(self, total_fighter1: int, total_fighter2: int) -> None:
+        """Store score totals and the winner they imply."""
+        self.total_fighter1 = total_fighter1
+        self.total_fighter2 = total_fighter2
+        if total_fighter1 > total_fighter2:
+            self.winner = "fighter1"
+        elif total_fighter2 > total_fighter1:
+            self.winner = "fighter2"
+        else:
+            self.winner = "draw"
     
     def __repr__(self) -> str:
         return f"<Scorecard(id={self.id}, user={self.user_id}, fight={self.fight_id}, score={self.total_fighter1}-{self.total_fighter2})>"
@@ -342,7 +376,7 @@ class RoundScore(Base):
     __tablename__ = "round_scores"
     
     id: Mapped[int] = mapped_column(primary_key=True)
-    scorecard_id: Mapped[int] = mapped_column(ForeignKey("scorecards.id"), nullable=False)
+    scorecard_id: Mapped[int] = mapped_column(ForeignKey("scorecards.id", ondelete="CASCADE"), nullable=False)
     round_number: Mapped[int] = mapped_column(Integer, nullable=False)  # 1, 2, 3, 4, or 5
     fighter1_score: Mapped[int] = mapped_column(Integer, nullable=False)  # 7-10
     fighter2_score: Mapped[int] = mapped_column(Integer, nullable=False)  # 7-10
@@ -369,21 +403,22 @@ class FightResult(Base):
     __tablename__ = "fight_results"
     
     id: Mapped[int] = mapped_column(primary_key=True)
-    fight_id: Mapped[int] = mapped_column(ForeignKey("fights.id"), nullable=False, unique=True)
-    winner: Mapped[FightWinner] = mapped_column(SQLEnum(FightWinner), nullable=False)
-    method: Mapped[WinMethod] = mapped_column(SQLEnum(WinMethod), nullable=False)
+    fight_id: Mapped[int] = mapped_column(ForeignKey("fights.id", ondelete="CASCADE"), nullable=False, unique=True)
+    winner: Mapped[FightWinner] = mapped_column(_enum_column(FightWinner), nullable=False)
+    method: Mapped[WinMethod] = mapped_column(_enum_column(WinMethod), nullable=False)
     finish_round: Mapped[Optional[int]] = mapped_column(Integer)  # Round when fight ended (for finishes)
     finish_time: Mapped[Optional[str]] = mapped_column(String(10))  # Time in round (e.g., "2:34")
     is_resolved: Mapped[bool] = mapped_column(default=False)  # Whether predictions/scorecards have been resolved
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=NOW_SUBSECOND)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=utc_now, onupdate=utc_now
+        DateTime, server_default=NOW_SUBSECOND, onupdate=utc_now
     )
     
     # Relationships
     fight: Mapped["Fight"] = relationship("Fight", back_populates="result")
     official_scorecards: Mapped[List["OfficialScorecard"]] = relationship(
-        "OfficialScorecard", back_populates="fight_result", cascade="all, delete-orphan"
+        "OfficialScorecard", back_populates="fight_result", cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     
     __table_args__ = (
@@ -400,29 +435,23 @@ class OfficialScorecard(Base):
     __tablename__ = "official_scorecards"
     
     id: Mapped[int] = mapped_column(primary_key=True)
-    fight_result_id: Mapped[int] = mapped_column(ForeignKey("fight_results.id"), nullable=False)
+    fight_result_id: Mapped[int] = mapped_column(ForeignKey("fight_results.id", ondelete="CASCADE"), nullable=False)
     judge_name: Mapped[str] = mapped_column(String(255), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=NOW_SUBSECOND)
     
     # Relationships
     fight_result: Mapped["FightResult"] = relationship("FightResult", back_populates="official_scorecards")
     round_scores: Mapped[List["OfficialRoundScore"]] = relationship(
-        "OfficialRoundScore", back_populates="official_scorecard", cascade="all, delete-orphan"
+        "OfficialRoundScore", back_populates="official_scorecard", cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     
     __table_args__ = (
         Index("idx_official_scorecard_result", "fight_result_id"),
     )
     
-    @property
-    def total_fighter1(self) -> int:
-        """Calculate total score for fighter 1."""
-        return sum(rs.fighter1_score for rs in self.round_scores)
-    
-    @property
-    def total_fighter2(self) -> int:
-        """Calculate total score for fighter 2."""
-        return sum(rs.fighter2_score for rs in self.round_scores)
+    # total_fighter1/total_fighter2 are SQL-side aggregates over round scores,
+    # attached below once OfficialRoundScore is defined
     
     def __repr__(self) -> str:
         return f"<OfficialScorecard(id={self.id}, judge='{self.judge_name}', score={self.total_fighter1}-{self.total_fighter2})>"
@@ -434,7 +463,7 @@ class OfficialRoundScore(Base):
     __tablename__ = "official_round_scores"
     
     id: Mapped[int] = mapped_column(primary_key=True)
-    official_scorecard_id: Mapped[int] = mapped_column(ForeignKey("official_scorecards.id"), nullable=False)
+    official_scorecard_id: Mapped[int] = mapped_column(ForeignKey("official_scorecards.id", ondelete="CASCADE"), nullable=False)
     round_number: Mapped[int] = mapped_column(Integer, nullable=False)  # 1, 2, 3, 4, or 5
     fighter1_score: Mapped[int] = mapped_column(Integer, nullable=False)  # 7-10
     fighter2_score: Mapped[int] = mapped_column(Integer, nullable=False)  # 7-10
@@ -451,3 +480,19 @@ class OfficialRoundScore(Base):
     def __repr__(self) -> str:
         return f"<OfficialRoundScore(round={self.round_number}, score={self.fighter1_score}-{self.fighter2_score})>"
 
+
+# Official totals are summed by SQLite as part of the scorecard SELECT,
+# so reading them never lazy-loads round_scores
+OfficialScorecard.total_fighter1 = column_property(
+    select(func.coalesce(func.sum(OfficialRoundScore.fighter1_score), 0))
+    .where(OfficialRoundScore.official_scorecard_id == OfficialScorecard.id)
+    .correlate_except(OfficialRoundScore)
+    .scalar_subquery()
+)
+OfficialScorecard.total_fighter2 = column_property(
+    select(func.coalesce(func.sum(OfficialRoundScore.fighter2_score), 0))
+    .where(OfficialRoundScore.official_scorecard_id == OfficialScorecard.id)
+    .correlate_except(OfficialRoundScore)
+    .scalar_subquery()
+)
+
@@ -4,10 +4,129 @@
 Удаляет слова "Победа", "Поражение", "Pound", методы побед и другие артефакты.
 """
 
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import Callable, List, Sequence
 from database.db import Database
 from database.models import Fighter
+from sqlalchemy import func, select
 
+# Размер пачки для массового обновления
+BATCH_SIZE = 500
+
+# Выполняется напрямую через курсор DBAPI
+UPDATE_NAME_SQL = "UPDATE fighters SET name = ? WHERE id = ?"
+
+# Стратегия очистки: пачка имен -> очищенные имена в том же порядке
+NameStrategy = Callable[[Sequence[str]], List[str]]
+
+# Сколько раз fix_fighter_names_all.py повторяет цепочку стратегий в поисках
+# неподвижной точки; отдельные скрипты применяют свою стратегию один раз
+MAX_STRATEGY_ROUNDS = 3
+
+# Настройки SQLite для массовой записи: WAL и один fsync на транзакцию,
+# временные данные в памяти, кэш страниц ~200 МБ
+BULK_WRITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-200000",
+)
+
+# Список артефактов для удаления (фрагменты регулярных выражений)
+ARTIFACT_PATTERNS = [
+    # Результаты боев
+    r'\bПобеда\b',
+    r'\bПоражение\b',
+    r'\bWin\b',
+    r'\bLoss\b',
+    r'\bDraw\b',
+    r'\bНичья\b',
+    
+    # Методы побед
+    r'\bKO\b',
+    r'\bTKO\b',
+    r'\bSubmission\b',
+    r'\bDecision\b',
+    r'\bРЕШЕНИЕ\b',
+    r'\bСАБ\b',
+    r'\bUnanimous\b',
+    r'\bSplit\b',
+    r'\bMajority\b',
+    r'\bPound\b',
+    r'\bDQ\b',
+    r'\bDisqualification\b',
+    r'\bNo Contest\b',
+    r'\bNC\b',
+    
+    # Детали остановки боя
+    r'\bElbows from Back Mount\b',
+    r'\bFlying Knee\b',
+    r'\bKnee to the Body\b',
+    # Целиком: иначе "Straight Right" съест начало "Right Hand" и оставит "Hand"
+    r'\bStraight Right Hand\b',
+    r'\bStraight Left Hand\b',
+    r'\bRight Hand\b',
+    r'\bLeft Hand\b',
+    r'\bRight Hook\b',
+    r'\bLeft Hook\b',
+    r'\bBody Shot\b',
+    r'\bHead Kick\b',
+    r'\bStraight Right\b',
+    r'\bStraight Left\b',
+    r'\bStraight\b',
+    r'\bPunches\b',
+    r'\bKicks\b',
+    r'\bKick\b',
+    r'\bElbows\b',
+    r'\bElbow\b',
+    r'\bChoke\b',
+    r'\bRight\b',
+    r'\bLeft\b',
+    r'\bCross\b',
+    r'\bJab\b',
+    r'\bHook\b',
+    r'\bUppercut\b',
+    r'\bKnee\b',
+    r'\bDoctor Stoppage\b',
+    r'\bCorner Stoppage\b',
+    r'\bTechnical\b',
+    r'\bRetirement\b',
+    r'\bInjury\b',
+    r'\bStoppage\b',
+    r'\bTKO/KO\b',
+    
+    # Раунды
+    r'\bRound\b',
+    r'\bR\d+\b',
+    
+    # Другие артефакты
+    r'\bArce\b',  # Часто встречается в начале
+    r'\bвес\b',
+    r'\bкг\b',
+    r'\bRef\b',
+    r'\bReferee\b',
+    r'\bTD\b',
+]
+
+# Фрагменты без \b, длинные первыми - "Straight Right" и "TKO/KO" должны
+# совпадать раньше своих префиксов "Straight" и "TKO". Это решает только
+# совпадения с одного места; перекрытия со сдвигом ("Straight Right" и
+# "Right Hand") покрыты составными артефактами вроде "Straight Right Hand".
+# В отличие от прежних проходов по одному шаблону, "TKO/KO" удаляется
+# целиком, а не оставляет "/"
+_ARTIFACT_TOKENS = sorted(
+    {p.replace(r'\b', '') for p in ARTIFACT_PATTERNS},
+    key=lambda token: (-len(token), token),
+)
+
+# Все артефакты в одном регулярном выражении - одна проверка строки вместо ~60
+_ARTIFACT_RE = re.compile(r'\b(?:' + '|'.join(_ARTIFACT_TOKENS) + r')\b', re.IGNORECASE)
+
+
+@lru_cache(maxsize=100_000)
 def clean_fighter_name(name: str) -> str:
     """
     Очистить имя бойца от артефактов парсинга.
@@ -20,82 +139,8 @@ def clean_fighter_name(name: str) -> str:
     """
     original = name
     
-    # Список артефактов для удаления
-    artifacts = [
-        # Результаты боев
-        r'\bПобеда\b',
-        r'\bПоражение\b',
-        r'\bWin\b',
-        r'\bLoss\b',
-        r'\bDraw\b',
-        r'\bНичья\b',
-        
-        # Методы побед
-        r'\bKO\b',
-        r'\bTKO\b',
-        r'\bSubmission\b',
-        r'\bDecision\b',
-        r'\bРЕШЕНИЕ\b',
-        r'\bСАБ\b',
-        r'\bUnanimous\b',
-        r'\bSplit\b',
-        r'\bMajority\b',
-        r'\bPound\b',
-        r'\bDQ\b',
-        r'\bDisqualification\b',
-        r'\bNo Contest\b',
-        r'\bNC\b',
-        
-        # Детали остановки боя
-        r'\bElbows from Back Mount\b',
-        r'\bFlying Knee\b',
-        r'\bKnee to the Body\b',
-        r'\bRight Hand\b',
-        r'\bLeft Hand\b',
-        r'\bRight Hook\b',
-        r'\bLeft Hook\b',
-        r'\bBody Shot\b',
-        r'\bHead Kick\b',
-        r'\bStraight Right\b',
-        r'\bStraight Left\b',
-        r'\bStraight\b',
-        r'\bPunches\b',
-        r'\bKicks\b',
-        r'\bKick\b',
-        r'\bElbows\b',
-        r'\bElbow\b',
-        r'\bChoke\b',
-        r'\bRight\b',
-        r'\bLeft\b',
-        r'\bCross\b',
-        r'\bJab\b',
-        r'\bHook\b',
-        r'\bUppercut\b',
-        r'\bKnee\b',
-        r'\bDoctor Stoppage\b',
-        r'\bCorner Stoppage\b',
-        r'\bTechnical\b',
-        r'\bRetirement\b',
-        r'\bInjury\b',
-        r'\bStoppage\b',
-        r'\bTKO/KO\b',
-        
-        # Раунды
-        r'\bRound\b',
-        r'\bR\d+\b',
-        
-        # Другие артефакты
-        r'\bArce\b',  # Часто встречается в начале
-        r'\bвес\b',
-        r'\bкг\b',
-        r'\bRef\b',
-        r'\bReferee\b',
-        r'\bTD\b',
-    ]
-    
     # Удалить артефакты
-    for artifact in artifacts:
-        name = re.sub(artifact, '', name, flags=re.IGNORECASE)
+    name = _ARTIFACT_RE.sub('', name)
     
     # Удалить лишние пробелы
     name = ' '.join(name.split())
@@ -110,63 +155,200 @@ def clean_fighter_name(name: str) -> str:
     return name
 
 
-def fix_all_fighter_names(dry_run: bool = True):
+def clean_fighter_names(names: Sequence[str]) -> List[str]:
     """
-    Исправить имена всех бойцов в базе данных.
+    Очистить пачку имен одним проходом регулярного выражения.
+    
+    Имена склеиваются через перевод строки, артефакты удаляются одним
+    вызовом _ARTIFACT_RE.sub по всему блоку, затем блок разбивается обратно.
+    Результат совпадает с clean_fighter_name для каждого имени.
+    
+    Args:
+        names: Исходные имена с артефактами
+        
+    Returns:
+        Очищенные имена в том же порядке
+    """
+    # Перевод строки внутри имени сломал бы разбиение блока
+    if any('\n' in name for name in names):
+        return [clean_fighter_name(name) for name in names]
+    
+    stripped = _ARTIFACT_RE.sub('', '\n'.join(names)).split('\n')
+    
+    cleaned = []
+    for original, name in zip(names, stripped):
+        name = ' '.join(name.split())
+        # Если имя стало пустым или слишком коротким, оставить оригинал
+        cleaned.append(name if len(name) >= 3 else original)
+    return cleaned
+
+
+def apply_strategies(
+    strategies: Sequence[NameStrategy],
+    names: Sequence[str],
+    rounds: int = 1,
+) -> List[str]:
+    """
+    Применить стратегии очистки по очереди; при rounds > 1 повторять цепочку,
+    пока имена не перестанут меняться.
     
     Args:
+        strategies: Стратегии очистки пачки имен
+        names: Исходные имена
+        rounds: Наибольшее число повторов цепочки стратегий
+        
+    Returns:
+        Очищенные имена в том же порядке
+    """
+    current = list(names)
+    for _ in range(rounds):
+        cleaned = current
+        for strategy in strategies:
+            cleaned = strategy(cleaned)
+        if cleaned == current:
+            break
+        current = cleaned
+    return current
+
+
+def fix_names_with_strategies(
+    strategies: Sequence[NameStrategy],
+    dry_run: bool = True,
+    batch_size: int = BATCH_SIZE,
+    name_filter=None,
+    preview: int = 10,
+    script: str = "fix_fighter_names.py",
+    workers: int = 1,
+    rounds: int = 1,
+):
+    """
+    Исправить имена бойцов за один проход по базе данных.
+    
+    Args:
+        strategies: Стратегии очистки, применяются по очереди к каждой пачке
         dry_run: Если True, только показать изменения без сохранения
+        batch_size: Количество строк в одном массовом UPDATE
+        name_filter: Условие SQL - читать только подходящих бойцов
+        preview: Сколько первых изменений показать
+        script: Имя скрипта для подсказки о запуске с --apply
+        workers: Число процессов для очистки; пачки распределяются между ними
+        rounds: Наибольшее число повторов цепочки стратегий для каждой пачки
     """
     db = Database('mma_data.db')
-    session = db.get_session()
+    # Чтение через соединение Core, без Session: кортежи (id, name) не попадают
+    # в identity map, и autoflush не проверяется на каждой строке
+    conn = db.engine.connect()
+    
+    total_count = conn.execute(select(func.count(Fighter.id))).scalar_one()
     
-    # Получить всех бойцов
-    fighters = session.query(Fighter).all()
+    # Потоково читать только (id, name)
+    stmt = select(Fighter.id, Fighter.name).execution_options(yield_per=1000)
+    if name_filter is not None:
+        stmt = stmt.where(name_filter)
+    rows = conn.execute(stmt)
     
-    fixed_count = 0
-    skipped_count = 0
+    updates = []
     
-    print(f"Обработка {len(fighters)} бойцов...")
+    print(f"Обработка {total_count} бойцов...")
     print()
     
-    for fighter in fighters:
-        cleaned_name = clean_fighter_name(fighter.name)
-        
-        if cleaned_name != fighter.name:
-            fixed_count += 1
-            
-            if fixed_count <= 10:  # Показать первые 10 изменений
-                print(f"ID {fighter.id}:")
-                print(f"  Было:  '{fighter.name}'")
-                print(f"  Стало: '{cleaned_name}'")
-                print()
-            
-            if not dry_run:
-                fighter.name = cleaned_name
+    # Очищать пачками по 1000 строк - пачка раскладывается на столбцы id и name,
+    # стратегии работают со столбцом имен
+    columns = (tuple(zip(*partition)) for partition in rows.partitions())
+    clean = partial(apply_strategies, strategies, rounds=rounds)
+    
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        if executor is None:
+            results = ((ids, names, clean(names)) for ids, names in columns)
         else:
-            skipped_count += 1
+            # Все пачки сразу уходят в пул, результаты возвращаются по порядку
+            columns = list(columns)
+            cleaned_columns = executor.map(clean, [names for _, names in columns])
+            results = ((ids, names, cleaned) for (ids, names), cleaned in zip(columns, cleaned_columns))
+        
+        for ids, names, cleaned_names in results:
+            for fighter_id, name, cleaned_name in zip(ids, names, cleaned_names):
+                if cleaned_name == name:
+                    continue
+                
+                updates.append((cleaned_name, fighter_id))
+                
+                if len(updates) <= preview:  # Показать первые изменения
+                    print(f"ID {fighter_id}:")
+                    print(f"  Было:  '{name}'")
+                    print(f"  Стало: '{cleaned_name}'")
+                    print()
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    
+    fixed_count = len(updates)
+    skipped_count = total_count - fixed_count
     
     print("=" * 60)
-    print(f"Всего бойцов: {len(fighters)}")
+    print(f"Всего бойцов: {total_count}")
     print(f"Будет исправлено: {fixed_count}")
     print(f"Без изменений: {skipped_count}")
     print("=" * 60)
     
+    conn.close()
+    
     if not dry_run:
-        session.commit()
+        # Массовое обновление через курсор DBAPI - без unit of work ORM,
+        # один подготовленный UPDATE на всю пачку
+        with db.engine.begin() as conn:
+            cursor = conn.connection.cursor()
+            # До первого UPDATE - journal_mode нельзя менять внутри транзакции
+            for pragma in BULK_WRITE_PRAGMAS:
+                cursor.execute(pragma)
+            for start in range(0, len(updates), batch_size):
+                cursor.executemany(UPDATE_NAME_SQL, updates[start:start + batch_size])
+            cursor.close()
         print("\n✅ Изменения сохранены в базу данных!")
     else:
         print("\n⚠️  Режим DRY RUN - изменения НЕ сохранены")
-        print("Для сохранения запустите: python3 fix_fighter_names.py --apply")
+        print(f"Для сохранения запустите: python3 {script} --apply")
+
+
+def fix_all_fighter_names(dry_run: bool = True, batch_size: int = BATCH_SIZE, workers: int = 1):
+    """
+    Исправить имена всех бойцов в базе данных.
     
-    session.close()
+    Args:
+        dry_run: Если True, только показать изменения без сохранения
+        batch_size: Количество строк в одном массовом UPDATE
+        workers: Число процессов для очистки
+    """
+    # Читать только тех бойцов, в имени которых SQLite нашел артефакт -
+    # чистые имена в Python не попадают
+    fix_names_with_strategies(
+        [clean_fighter_names],
+        dry_run=dry_run,
+        batch_size=batch_size,
+        name_filter=Fighter.name.regexp_match("(?i)" + _ARTIFACT_RE.pattern),
+        workers=workers,
+    )
 
 
-if __name__ == "__main__":
+def run_cli(fix_all: Callable[..., None]):
+    """
+    Запустить исправление имен с аргументами командной строки.
+    
+    Args:
+        fix_all: Функция исправления с параметрами dry_run, batch_size и workers
+    """
     import sys
     
     # Проверить аргументы
     apply_changes = "--apply" in sys.argv
+    batch_size = BATCH_SIZE
+    if "--batch-size" in sys.argv:
+        batch_size = int(sys.argv[sys.argv.index("--batch-size") + 1])
+    workers = 1
+    if "--workers" in sys.argv:
+        # --workers 0 - по числу ядер
+        workers = int(sys.argv[sys.argv.index("--workers") + 1]) or os.cpu_count() or 1
     
     if apply_changes:
         print("🚀 ПРИМЕНЕНИЕ ИЗМЕНЕНИЙ К БАЗЕ ДАННЫХ")
@@ -180,5 +362,8 @@ if __name__ == "__main__":
         print("🔍 РЕЖИМ ПРЕДВАРИТЕЛЬНОГО ПРОСМОТРА (DRY RUN)")
         print()
     
-    fix_all_fighter_names(dry_run=not apply_changes)
+    fix_all(dry_run=not apply_changes, batch_size=batch_size, workers=workers)
+
 
+if __name__ == "__main__":
+    run_cli(fix_all_fighter_names)
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Очистка имен бойцов обеими стратегиями за один проход.
+Сначала удаляются артефакты (fix_fighter_names), затем извлекается имя
+(fix_fighter_names_v2) - база читается и обновляется один раз. Цепочка
+повторяется, пока имена меняются, поэтому результат может быть чище, чем
+после запуска обоих скриптов друг за другом.
+"""
+
+from fix_fighter_names import (
+    BATCH_SIZE, MAX_STRATEGY_ROUNDS, clean_fighter_names, fix_names_with_strategies, run_cli,
+)
+from fix_fighter_names_v2 import extract_fighter_names
+
+# Стратегии в порядке применения
+STRATEGIES = [clean_fighter_names, extract_fighter_names]
+
+
+def fix_all_fighter_names(dry_run: bool = True, batch_size: int = BATCH_SIZE, workers: int = 1):
+    """
+    Исправить имена всех бойцов в базе данных всеми стратегиями.
+    
+    Args:
+        dry_run: Если True, только показать изменения без сохранения
+        batch_size: Количество строк в одном массовом UPDATE
+        workers: Число процессов для очистки
+    """
+    fix_names_with_strategies(
+        STRATEGIES,
+        dry_run=dry_run,
+        batch_size=batch_size,
+        preview=20,
+        workers=workers,
+        rounds=MAX_STRATEGY_ROUNDS,
+        script="fix_fighter_names_all.py",
+    )
+
+
+if __name__ == "__main__":
+    run_cli(fix_all_fighter_names)
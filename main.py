@@ -14,7 +14,9 @@ Usage:
 
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List
 
@@ -23,12 +25,59 @@ from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.panel import Panel
 
-from scraper import HTTPClient, EventListParser, EventDetailParser, FighterProfileParser, RankingsParser, generate_fighter_profile_url
+from sqlalchemy.orm import Session
+
+from scraper import HTTPClient, ResponseCache, EventListParser, EventDetailParser, FighterProfileParser, RankingsParser, generate_fighter_profile_url
+from scraper.cache import HTTP_CACHE_PATH
 from scraper.validators import EventData, ScrapedData
 from database import Database, Fighter
 
 console = Console()
 
+# SQLite database used by every command (WAL mode: mma_data.db-wal and
+# mma_data.db-shm appear next to it while connections are open)
+DB_PATH = Path(__file__).parent / "mma_data.db"
+
+# Event detail pages fetched in parallel. HTTPClient waits 1-2.5 s after each
+# request in the calling thread, so this is also the cap on requests in flight
+DETAIL_FETCH_WORKERS = 4
+
+# Minimum seconds between profile page requests across all fetch threads
+PROFILE_MIN_INTERVAL_SECONDS = 1.5
+
+# Progress labels name every Nth item; rebuilding the line per item adds up
+# once fetches run in parallel
+PROGRESS_LABEL_EVERY = 10
+
+# FighterData fields copied onto an existing fighter by scrape_fighter_profiles
+PROFILE_UPDATE_FIELDS = {
+    "name_english", "country", "age", "height_cm", "weight_kg", "reach_cm",
+    "style", "ranking", "wins_ko_tko", "wins_submission", "wins_decision",
+    "losses_ko_tko", "losses_submission", "losses_decision",
+}
+
+
+@lru_cache(maxsize=1)
+def get_database() -> Database:
+    """Return the shared Database, creating it (and any missing tables) on first use.
+    
+    Every command in a process reuses one engine and its connection pool.
+    """
+    db = Database(str(DB_PATH))
+    db.ensure_schema()
+    return db
+
+
+def make_profile_client(use_cache: bool = True) -> HTTPClient:
+    """Create an HTTP client for profile/rankings scraping.
+    
+    Args:
+        use_cache: If True, serve pages fetched in the last 12 hours from
+            HTTP_CACHE_PATH instead of the network, and revalidate older
+            ones with a conditional request.
+    """
+    return HTTPClient(cache=ResponseCache(HTTP_CACHE_PATH) if use_cache else None)
+
 
 def print_banner():
     """Print application banner."""
@@ -99,9 +148,62 @@ def scrape_event_details(
     return event
 
 
+def _save_events(db: Database, session: Session, events: List[EventData], stats: dict) -> None:
+    """Write events, their fighters and fights in the caller's transaction."""
+    # Fighters for all events at once: one lookup, one bulk insert
+    fighter_ids = db.get_or_create_fighters(session, [
+        fighter.model_dump(include={"name", "country", "wins", "losses", "draws", "profile_url"})
+        for event_data in events
+        for fight_data in event_data.fights
+        for fighter in (fight_data.fighter1, fight_data.fighter2)
+    ])
+    
+    event_ids = []
+    fight_rows = []
+    for event_data in events:
+        # Create or update event
+        event = db.get_or_create_event(
+            session=session,
+            name=event_data.name,
+            organization=event_data.organization,
+            slug=event_data.slug,
+            url=event_data.url,
+            event_date=event_data.event_date,
+            time_msk=event_data.time_msk,
+            location=event_data.location,
+            is_upcoming=event_data.is_upcoming,
+        )
+        stats["events_saved"] += 1
+        event_ids.append(event.id)
+        
+        fight_rows.extend(
+            {
+                "event_id": event.id,
+                "fighter1_id": fighter_ids[fight_data.fighter1.name],
+                "fighter2_id": fighter_ids[fight_data.fighter2.name],
+                "card_type": fight_data.card_type,
+                "weight_class": fight_data.weight_class,
+                "rounds": fight_data.rounds,
+                "scheduled_time": fight_data.scheduled_time,
+                "fight_order": fight_data.fight_order,
+            }
+            for fight_data in event_data.fights
+        )
+        stats["fighters_saved"] += 2 * len(event_data.fights)
+    
+    # Clear existing fights for these events (we'll re-add them), then add
+    # fights for every event in one statement
+    db.clear_fights_for_events(session, event_ids)
+    stats["fights_saved"] += db.create_fights(session, fight_rows)
+
+
 def save_to_database(db: Database, events: List[EventData]) -> dict:
     """Save scraped events to database.
     
+    All events are written in a single transaction. If that fails, it is
+    rolled back and the events are retried one transaction each, so one bad
+    event doesn't block the rest.
+    
     Args:
         db: Database instance.
         events: List of EventData to save.
@@ -116,64 +218,18 @@ def save_to_database(db: Database, events: List[EventData]) -> dict:
     }
     
     with db.get_session() as session:
+        try:
+            _save_events(db, session, events, stats)
+            session.commit()
+            return stats
+        except Exception as e:
+            console.print(f"[yellow]⚠[/yellow] Batch save failed ({e}), retrying event by event")
+            session.rollback()
+            stats = dict.fromkeys(stats, 0)
+        
         for event_data in events:
             try:
-                # Create or update event
-                event = db.get_or_create_event(
-                    session=session,
-                    name=event_data.name,
-                    organization=event_data.organization,
-                    slug=event_data.slug,
-                    url=event_data.url,
-                    event_date=event_data.event_date,
-                    time_msk=event_data.time_msk,
-                    location=event_data.location,
-                    is_upcoming=event_data.is_upcoming,
-                )
-                stats["events_saved"] += 1
-                
-                # Clear existing fights for this event (we'll re-add them)
-                db.clear_fights_for_event(session, event.id)
-                
-                # Add fights
-                for fight_data in event_data.fights:
-                    # Create or update fighters
-                    fighter1 = db.get_or_create_fighter(
-                        session=session,
-                        name=fight_data.fighter1.name,
-                        country=fight_data.fighter1.country,
-                        wins=fight_data.fighter1.wins,
-                        losses=fight_data.fighter1.losses,
-                        draws=fight_data.fighter1.draws,
-                        profile_url=fight_data.fighter1.profile_url,
-                    )
-                    stats["fighters_saved"] += 1
-                    
-                    fighter2 = db.get_or_create_fighter(
-                        session=session,
-                        name=fight_data.fighter2.name,
-                        country=fight_data.fighter2.country,
-                        wins=fight_data.fighter2.wins,
-                        losses=fight_data.fighter2.losses,
-                        draws=fight_data.fighter2.draws,
-                        profile_url=fight_data.fighter2.profile_url,
-                    )
-                    stats["fighters_saved"] += 1
-                    
-                    # Create fight
-                    db.create_fight(
-                        session=session,
-                        event=event,
-                        fighter1=fighter1,
-                        fighter2=fighter2,
-                        card_type=fight_data.card_type,
-                        weight_class=fight_data.weight_class,
-                        rounds=fight_data.rounds,
-                        scheduled_time=fight_data.scheduled_time,
-                        fight_order=fight_data.fight_order,
-                    )
-                    stats["fights_saved"] += 1
-                
+                _save_events(db, session, [event_data], stats)
                 session.commit()
                 
             except Exception as e:
@@ -210,13 +266,13 @@ def validate_scraped_data(events: List[EventData]) -> tuple:
         
         # Check fights
         for fight in event.fights:
-            if not fight.fighter1.name or not fight.fighter2.name:
+            fighter1, fighter2 = fight.fighter1, fight.fighter2
+            if not fighter1.name or not fighter2.name:
                 event_errors.append(f"Fight in {event.name} missing fighter name")
             
             # Check for unrealistic records
-            for fighter in [fight.fighter1, fight.fighter2]:
-                total_fights = fighter.wins + fighter.losses + fighter.draws
-                if total_fights > 100:
+            for fighter in (fighter1, fighter2):
+                if fighter.wins + fighter.losses + fighter.draws > 100:
                     event_errors.append(
                         f"Fighter {fighter.name} has unrealistic record: {fighter.record}"
                     )
@@ -290,9 +346,7 @@ def run_scraper(event_slug: Optional[str] = None, limit: Optional[int] = None):
     start_time = datetime.now()
     
     # Initialize database
-    db_path = Path(__file__).parent / "mma_data.db"
-    db = Database(str(db_path))
-    db.create_tables()
+    db = get_database()
     
     console.print()
     console.print("[bold]Starting scraper...[/bold]")
@@ -327,7 +381,8 @@ def run_scraper(event_slug: Optional[str] = None, limit: Optional[int] = None):
             console.print()
             console.print("[blue]→[/blue] Fetching event details...")
             
-            detailed_events = []
+            # Fetch detail pages concurrently; results keep the list order
+            detailed_events: List[Optional[EventData]] = [None] * len(events)
             with Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
@@ -335,14 +390,22 @@ def run_scraper(event_slug: Optional[str] = None, limit: Optional[int] = None):
             ) as progress:
                 task = progress.add_task("Scraping events...", total=len(events))
                 
-                for event in events:
-                    progress.update(task, description=f"Scraping {event.name}...")
-                    detailed = scrape_event_details(client, event)
-                    if detailed:
-                        detailed_events.append(detailed)
-                    progress.advance(task)
+                with ThreadPoolExecutor(max_workers=DETAIL_FETCH_WORKERS) as executor:
+                    futures = {
+                        executor.submit(scrape_event_details, client, event): i
+                        for i, event in enumerate(events)
+                    }
+                    for done, future in enumerate(as_completed(futures)):
+                        event = events[futures[future]]
+                        try:
+                            detailed_events[futures[future]] = future.result()
+                        except Exception as e:
+                            console.print(f"[red]✗[/red] Error scraping {event.name}: {e}")
+                        if done % PROGRESS_LABEL_EVERY == 0:
+                            progress.update(task, description=f"Scraped {event.name}")
+                        progress.advance(task)
             
-            events = detailed_events
+            events = [detailed for detailed in detailed_events if detailed]
     
     console.print()
     
@@ -363,6 +426,7 @@ def run_scraper(event_slug: Optional[str] = None, limit: Optional[int] = None):
     console.print()
     console.print("[blue]→[/blue] Saving to database...")
     save_stats = save_to_database(db, valid_events)
+    db.checkpoint("TRUNCATE")
     
     # Summary
     duration = datetime.now() - start_time
@@ -377,26 +441,25 @@ Fights saved:    {save_stats['fights_saved']}
 Fighters saved:  {save_stats['fighters_saved']}
 
 Duration: {duration.total_seconds():.1f} seconds
-Database: {db_path}
+Database: {DB_PATH}
         """.strip(),
         title="Summary",
         style="green",
     ))
 
 
-def scrape_rankings(organization: str = "aca", limit: Optional[int] = None):
+def scrape_rankings(organization: str = "aca", limit: Optional[int] = None, use_cache: bool = True):
     """Scrape all fighters from an organization's rankings page.
     
     Args:
         organization: Organization to scrape (e.g., "aca", "ufc").
         limit: Optional limit on number of profiles to scrape.
+        use_cache: If True, reuse pages cached by a recent run.
     """
     print_banner()
     start_time = datetime.now()
     
-    db_path = Path(__file__).parent / "mma_data.db"
-    db = Database(str(db_path))
-    db.create_tables()
+    db = get_database()
     
     console.print()
     console.print(f"[bold]Scraping {organization.upper()} Rankings...[/bold]")
@@ -404,7 +467,7 @@ def scrape_rankings(organization: str = "aca", limit: Optional[int] = None):
     
     stats = {"found": 0, "scraped": 0, "failed": 0}
     
-    with HTTPClient() as client:
+    with make_profile_client(use_cache) as client:
         # Fetch rankings page
         html = client.get_rankings_page(organization)
         if not html:
@@ -425,6 +488,10 @@ def scrape_rankings(organization: str = "aca", limit: Optional[int] = None):
         console.print()
         
         with db.get_session() as session:
+            # One lookup for every ranked name; fighters listed in several
+            # divisions are then served from the cache
+            fighter_cache = db.get_fighters_by_names(session, (f['name'] for f in ranked_fighters))
+            
             with Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
@@ -432,67 +499,69 @@ def scrape_rankings(organization: str = "aca", limit: Optional[int] = None):
             ) as progress:
                 task = progress.add_task("Scraping profiles...", total=len(ranked_fighters))
                 
-                for fighter_info in ranked_fighters:
-                    name = fighter_info['name']
-                    profile_url = fighter_info['profile_url']
-                    weight_class = fighter_info.get('weight_class')
-                    rank = fighter_info.get('rank')
-                    
-                    progress.update(task, description=f"Scraping {name}...")
-                    
-                    # Fetch profile
-                    html = client.get_fighter_profile(profile_url)
-                    
-                    if not html:
-                        stats["failed"] += 1
-                        progress.advance(task)
-                        continue
-                    
-                    # Parse profile
-                    profile_parser = FighterProfileParser(html, name)
-                    profile_data = profile_parser.parse_profile()
-                    
-                    if profile_data:
-                        # Build ranking string
-                        if rank == 0:
-                            ranking_str = f"{organization.upper()} Champion {weight_class or ''}"
-                        elif rank:
-                            ranking_str = f"{organization.upper()} #{rank} {weight_class or ''}"
+                # Fetch profiles in the background, spaced at least
+                # PROFILE_MIN_INTERVAL_SECONDS apart; parse and save them here in order
+                pages = client.get_fighter_profiles(
+                    [f['profile_url'] for f in ranked_fighters],
+                    min_interval=PROFILE_MIN_INTERVAL_SECONDS,
+                )
+                try:
+                    for i, (fighter_info, html) in enumerate(zip(ranked_fighters, pages)):
+                        name = fighter_info['name']
+                        profile_url = fighter_info['profile_url']
+                        weight_class = fighter_info.get('weight_class')
+                        rank = fighter_info.get('rank')
+                        
+                        if i % PROGRESS_LABEL_EVERY == 0:
+                            progress.update(task, description=f"Scraping {name}...")
+                        
+                        profile_data = FighterProfileParser(html, name).parse_profile() if html else None
+                        if profile_data:
+                            # Build ranking string
+                            if rank == 0:
+                                ranking_str = f"{organization.upper()} Champion {weight_class or ''}"
+                            elif rank:
+                                ranking_str = f"{organization.upper()} #{rank} {weight_class or ''}"
+                            else:
+                                ranking_str = None
+                            
+                            # Create or update fighter
+                            db.get_or_create_fighter(
+                                session=session,
+                                name=name,
+                                name_english=profile_data.name_english,
+                                country=profile_data.country,
+                                wins=profile_data.wins,
+                                losses=profile_data.losses,
+                                draws=profile_data.draws,
+                                age=profile_data.age,
+                                height_cm=profile_data.height_cm,
+                                weight_kg=profile_data.weight_kg,
+                                reach_cm=profile_data.reach_cm,
+                                style=profile_data.style,
+                                ranking=ranking_str,
+                                wins_ko_tko=profile_data.wins_ko_tko,
+                                wins_submission=profile_data.wins_submission,
+                                wins_decision=profile_data.wins_decision,
+                                losses_ko_tko=profile_data.losses_ko_tko,
+                                losses_submission=profile_data.losses_submission,
+                                losses_decision=profile_data.losses_decision,
+                                profile_url=profile_url,
+                                profile_scraped=True,
+                                cache=fighter_cache,
+                            )
+                            stats["scraped"] += 1
                         else:
-                            ranking_str = None
+                            stats["failed"] += 1
                         
-                        # Create or update fighter
-                        db.get_or_create_fighter(
-                            session=session,
-                            name=name,
-                            name_english=profile_data.name_english,
-                            country=profile_data.country,
-                            wins=profile_data.wins,
-                            losses=profile_data.losses,
-                            draws=profile_data.draws,
-                            age=profile_data.age,
-                            height_cm=profile_data.height_cm,
-                            weight_kg=profile_data.weight_kg,
-                            reach_cm=profile_data.reach_cm,
-                            style=profile_data.style,
-                            ranking=ranking_str,
-                            wins_ko_tko=profile_data.wins_ko_tko,
-                            wins_submission=profile_data.wins_submission,
-                            wins_decision=profile_data.wins_decision,
-                            losses_ko_tko=profile_data.losses_ko_tko,
-                            losses_submission=profile_data.losses_submission,
-                            losses_decision=profile_data.losses_decision,
-                            profile_url=profile_url,
-                            profile_scraped=True,
-                        )
-                        stats["scraped"] += 1
-                    else:
-                        stats["failed"] += 1
-                    
-                    progress.advance(task)
+                        progress.advance(task)
+                finally:
+                    # Stop pending fetches, even on Ctrl+C
+                    pages.close()
             
             session.commit()
     
+    db.checkpoint("TRUNCATE")
     duration = datetime.now() - start_time
     
     console.print()
@@ -511,18 +580,17 @@ Duration: {duration.total_seconds():.1f} seconds
     ))
 
 
-def scrape_fighter_profiles(limit: Optional[int] = None):
+def scrape_fighter_profiles(limit: Optional[int] = None, use_cache: bool = True):
     """Scrape detailed fighter profiles for fighters in the database.
     
     Args:
         limit: Optional limit on number of profiles to scrape.
+        use_cache: If True, reuse pages cached by a recent run.
     """
     print_banner()
     start_time = datetime.now()
     
-    db_path = Path(__file__).parent / "mma_data.db"
-    db = Database(str(db_path))
-    db.create_tables()
+    db = get_database()
     
     console.print()
     console.print("[bold]Scraping fighter profiles...[/bold]")
@@ -531,20 +599,18 @@ def scrape_fighter_profiles(limit: Optional[int] = None):
     stats = {"scraped": 0, "failed": 0, "skipped": 0}
     
     with db.get_session() as session:
-        # Get fighters without scraped profiles
-        fighters = db.get_fighters_without_profiles(session)
+        # Get fighters without scraped profiles; the limit is applied in SQL
+        # so only the fighters being scraped are loaded
+        fighters = db.get_fighters_without_profiles(session, limit=limit)
         
         if not fighters:
             console.print("[yellow]No fighters need profile scraping[/yellow]")
             return
         
-        if limit:
-            fighters = fighters[:limit]
-            
         console.print(f"[blue]→[/blue] Found {len(fighters)} fighters to scrape")
         console.print()
         
-        with HTTPClient() as client:
+        with make_profile_client(use_cache) as client:
             with Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
@@ -552,51 +618,42 @@ def scrape_fighter_profiles(limit: Optional[int] = None):
             ) as progress:
                 task = progress.add_task("Scraping profiles...", total=len(fighters))
                 
-                for fighter in fighters:
-                    progress.update(task, description=f"Scraping {fighter.name}...")
-                    
-                    # Generate profile URL
-                    profile_url = generate_fighter_profile_url(fighter.name)
-                    
-                    # Fetch profile
-                    html = client.get_fighter_profile(profile_url)
-                    
-                    if not html:
-                        stats["failed"] += 1
-                        progress.advance(task)
-                        continue
-                    
-                    # Parse profile
-                    parser = FighterProfileParser(html, fighter.name)
-                    profile_data = parser.parse_profile()
-                    
-                    if profile_data:
-                        # Update fighter with profile data
-                        fighter.name_english = profile_data.name_english
-                        fighter.country = profile_data.country
-                        fighter.age = profile_data.age
-                        fighter.height_cm = profile_data.height_cm
-                        fighter.weight_kg = profile_data.weight_kg
-                        fighter.reach_cm = profile_data.reach_cm
-                        fighter.style = profile_data.style
-                        fighter.ranking = profile_data.ranking
-                        fighter.wins_ko_tko = profile_data.wins_ko_tko
-                        fighter.wins_submission = profile_data.wins_submission
-                        fighter.wins_decision = profile_data.wins_decision
-                        fighter.losses_ko_tko = profile_data.losses_ko_tko
-                        fighter.losses_submission = profile_data.losses_submission
-                        fighter.losses_decision = profile_data.losses_decision
-                        fighter.profile_url = profile_url
-                        fighter.profile_scraped = True
+                # Generate profile URLs and fetch them in the background, spaced
+                # at least PROFILE_MIN_INTERVAL_SECONDS apart; parse them here in order
+                profile_urls = [generate_fighter_profile_url(fighter.name) for fighter in fighters]
+                pages = client.get_fighter_profiles(profile_urls, min_interval=PROFILE_MIN_INTERVAL_SECONDS)
+                
+                updates = []
+                try:
+                    for i, (fighter, profile_url, html) in enumerate(zip(fighters, profile_urls, pages)):
+                        if i % PROGRESS_LABEL_EVERY == 0:
+                            progress.update(task, description=f"Scraping {fighter.name}...")
+                        
+                        profile_data = FighterProfileParser(html, fighter.name).parse_profile() if html else None
+                        if profile_data:
+                            # Queue the update; all fighters are written at once below
+                            updates.append({
+                                "id": fighter.id,
+                                # Plain attribute reads; model_dump() serializes
+                                # the whole model just to pick these out
+                                **{field: getattr(profile_data, field) for field in PROFILE_UPDATE_FIELDS},
+                                "profile_url": profile_url,
+                                "profile_scraped": True,
+                            })
+                            
+                            stats["scraped"] += 1
+                        else:
+                            stats["failed"] += 1
                         
-                        stats["scraped"] += 1
-                    else:
-                        stats["failed"] += 1
-                    
-                    progress.advance(task)
+                        progress.advance(task)
+                finally:
+                    # Stop pending fetches, even on Ctrl+C
+                    pages.close()
                 
+                db.update_fighters(session, updates)
                 session.commit()
     
+    db.checkpoint("TRUNCATE")
     duration = datetime.now() - start_time
     
     console.print()
@@ -719,35 +776,34 @@ def main():
         help="Scrape all fighters from rankings page (default: aca)",
     )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Fetch profile/rankings pages from the network, ignoring the HTTP cache",
+    )
     
-    # Initialize database for stats/list commands
-    db_path = Path(__file__).parent / "mma_data.db"
-    db = Database(str(db_path))
+    args = parser.parse_args()
     
     if args.stats:
-        db.create_tables()
-        display_stats(db)
+        display_stats(get_database())
     elif args.list:
-        db.create_tables()
-        display_events_table(db)
+        display_events_table(get_database())
     elif args.profiles:
         # Scrape fighter profiles
         try:
-            scrape_fighter_profiles(limit=args.limit)
+            scrape_fighter_profiles(limit=args.limit, use_cache=not args.no_cache)
         except KeyboardInterrupt:
             console.print("\n[yellow]Scraping interrupted by user[/yellow]")
             sys.exit(1)
     elif args.rankings:
         # Scrape rankings page
         try:
-            scrape_rankings(organization=args.rankings, limit=args.limit)
+            scrape_rankings(organization=args.rankings, limit=args.limit, use_cache=not args.no_cache)
         except KeyboardInterrupt:
             console.print("\n[yellow]Scraping interrupted by user[/yellow]")
             sys.exit(1)
     elif args.fighter:
-        db.create_tables()
-        display_fighter_stats(db, args.fighter)
+        display_fighter_stats(get_database(), args.fighter)
     else:
         # Run scraper
         try:
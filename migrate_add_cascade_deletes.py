@@ -0,0 +1,107 @@
+"""Migration script to add ON DELETE CASCADE to child foreign keys.
+
+SQLite cannot alter a foreign key in place, so each affected table is
+rebuilt from the current model definition and its rows copied over.
+"""
+
+import sqlite3
+from pathlib import Path
+
+from sqlalchemy.dialects import sqlite as sqlite_dialect
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from database.models import Base
+
+DB_PATH = Path(__file__).parent / "mma_data.db"
+
+# Child tables whose foreign keys now cascade, parents before children
+CASCADE_TABLES = [
+    "fights",
+    "predictions",
+    "scorecards",
+    "round_scores",
+    "fight_results",
+    "official_scorecards",
+    "official_round_scores",
+]
+
+
+def migrate():
+    """Rebuild child tables so their foreign keys use ON DELETE CASCADE."""
+    conn = sqlite3.connect(DB_PATH)
+    conn.isolation_level = None
+    cursor = conn.cursor()
+    dialect = sqlite_dialect.dialect()
+
+    print("🔄 Starting database migration...")
+
+    # Table rebuilds must run with enforcement off (see "Making Other Kinds
+    # Of Table Schema Changes" in the SQLite ALTER TABLE docs)
+    cursor.execute("PRAGMA foreign_keys=OFF")
+
+    try:
+        cursor.execute("BEGIN")
+
+        # Rows whose parent was deleted before cascades existed would fail the
+        # final foreign key check; remove them (repeat for grandchildren)
+        print("\n0. Removing orphaned rows...")
+        orphans_removed = 0
+        while True:
+            orphans = [
+                (table, rowid)
+                for table, rowid, _parent, _fk in cursor.execute("PRAGMA foreign_key_check").fetchall()
+                if table in CASCADE_TABLES
+            ]
+            if not orphans:
+                break
+            for table, rowid in orphans:
+                cursor.execute(f"DELETE FROM {table} WHERE rowid = ?", (rowid,))
+            orphans_removed += len(orphans)
+        print(f"   ✓ Removed {orphans_removed} orphaned rows")
+
+        for i, name in enumerate(CASCADE_TABLES, start=1):
+            print(f"\n{i}. Rebuilding {name} table...")
+            cursor.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name=?", (name,))
+            row = cursor.fetchone()
+            if row is None:
+                print(f"   ⊙ {name} table does not exist")
+                continue
+            if "ON DELETE CASCADE" in row[0].upper():
+                print(f"   ⊙ {name} already cascades")
+                continue
+
+            table = Base.metadata.tables[name]
+            old_columns = {r[1] for r in cursor.execute(f"PRAGMA table_info({name})")}
+            missing = [c.name for c in table.columns if c.name not in old_columns]
+            if missing:
+                raise RuntimeError(
+                    f"{name} is missing columns {missing}; run the earlier migrate_*.py scripts first"
+                )
+            columns = ", ".join(c.name for c in table.columns)
+
+            ddl = str(CreateTable(table).compile(dialect=dialect)).strip()
+            cursor.execute(ddl.replace(f"CREATE TABLE {name} (", f"CREATE TABLE new_{name} (", 1))
+            cursor.execute(f"INSERT INTO new_{name} ({columns}) SELECT {columns} FROM {name}")
+            cursor.execute(f"DROP TABLE {name}")
+            cursor.execute(f"ALTER TABLE new_{name} RENAME TO {name}")
+            for index in table.indexes:
+                cursor.execute(str(CreateIndex(index).compile(dialect=dialect)))
+            print(f"   ✓ Rebuilt {name} with ON DELETE CASCADE")
+
+        violations = cursor.execute("PRAGMA foreign_key_check").fetchall()
+        if violations:
+            raise RuntimeError(f"{len(violations)} foreign key violations after rebuild")
+
+        cursor.execute("COMMIT")
+        print("\n✅ Migration completed successfully!")
+
+    except Exception as e:
+        cursor.execute("ROLLBACK")
+        print(f"\n❌ Migration failed: {e}")
+        raise
+    finally:
+        cursor.execute("PRAGMA foreign_keys=ON")
+        conn.close()
+
+if __name__ == "__main__":
+    migrate()
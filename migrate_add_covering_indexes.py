@@ -0,0 +1,63 @@
+"""Migration script to replace single-column prediction/scorecard indexes with covering ones."""
+
+import sqlite3
+from pathlib import Path
+
+DB_PATH = Path(__file__).parent / "mma_data.db"
+
+# Indexes made redundant by the (user_id, fight_id) unique constraints or
+# superseded by the covering indexes below
+OBSOLETE_INDEXES = [
+    "idx_prediction_fight",
+    "idx_prediction_user",
+    "idx_scorecard_fight",
+    "idx_scorecard_user",
+    "idx_scorecard_fight_winner",
+]
+
+COVERING_INDEXES = {
+    "idx_prediction_fight_cover": "predictions(fight_id, predicted_winner, win_method)",
+    "idx_scorecard_fight_cover": "scorecards(fight_id, winner, total_fighter1, total_fighter2)",
+}
+
+def migrate():
+    """Drop obsolete indexes and create covering indexes for per-fight aggregates."""
+    conn = sqlite3.connect(DB_PATH)
+    conn.isolation_level = None
+    cursor = conn.cursor()
+
+    print("🔄 Starting database migration...")
+
+    try:
+        cursor.execute("BEGIN")
+
+        # 1. Create covering indexes
+        print("\n1. Creating covering indexes...")
+        for name, target in COVERING_INDEXES.items():
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+            print(f"   ✓ Created {name}")
+
+        # 2. Drop obsolete indexes
+        print("\n2. Dropping obsolete indexes...")
+        for name in OBSOLETE_INDEXES:
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (name,))
+            if cursor.fetchone():
+                cursor.execute(f"DROP INDEX {name}")
+                print(f"   ✓ Dropped {name}")
+            else:
+                print(f"   ⊙ {name} already dropped")
+
+        cursor.execute("COMMIT")
+        cursor.execute("ANALYZE")
+        print("\n✅ Migration completed successfully!")
+
+    except Exception as e:
+        if conn.in_transaction:
+            cursor.execute("ROLLBACK")
+        print(f"\n❌ Migration failed: {e}")
+        raise
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    migrate()
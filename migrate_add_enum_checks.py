@@ -0,0 +1,89 @@
+"""Migration script to add CHECK constraints to enum columns.
+
+Predictions and fight results store enums as VARCHAR; the models now
+declare a CHECK constraint per enum column. SQLite cannot add a
+constraint to an existing table, so each table is rebuilt from the
+current model definition and its rows copied over.
+"""
+
+import sqlite3
+from pathlib import Path
+
+from sqlalchemy.dialects import sqlite as sqlite_dialect
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from database.models import Base
+
+DB_PATH = Path(__file__).parent / "mma_data.db"
+
+# Tables with enum columns
+ENUM_TABLES = ["predictions", "fight_results"]
+
+
+def migrate():
+    """Rebuild enum-bearing tables so their enum columns are CHECK-constrained."""
+    conn = sqlite3.connect(DB_PATH)
+    conn.isolation_level = None
+    cursor = conn.cursor()
+    dialect = sqlite_dialect.dialect()
+
+    print("🔄 Starting database migration...")
+
+    # Table rebuilds must run with enforcement off
+    cursor.execute("PRAGMA foreign_keys=OFF")
+
+    try:
+        cursor.execute("BEGIN")
+
+        for i, name in enumerate(ENUM_TABLES, start=1):
+            print(f"\n{i}. Rebuilding {name} table...")
+            cursor.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name=?", (name,))
+            row = cursor.fetchone()
+            if row is None:
+                print(f"   ⊙ {name} table does not exist")
+                continue
+            if "CHECK" in row[0].upper():
+                print(f"   ⊙ {name} already has enum checks")
+                continue
+
+            table = Base.metadata.tables[name]
+            old_columns = {r[1] for r in cursor.execute(f"PRAGMA table_info({name})")}
+            missing = [c.name for c in table.columns if c.name not in old_columns]
+            if missing:
+                raise RuntimeError(
+                    f"{name} is missing columns {missing}; run the earlier migrate_*.py scripts first"
+                )
+            columns = ", ".join(c.name for c in table.columns)
+
+            # Rows with values outside the enum fail the copy and roll back
+            ddl = str(CreateTable(table).compile(dialect=dialect)).strip()
+            cursor.execute(ddl.replace(f"CREATE TABLE {name} (", f"CREATE TABLE new_{name} (", 1))
+            cursor.execute(f"INSERT INTO new_{name} ({columns}) SELECT {columns} FROM {name}")
+            cursor.execute(f"DROP TABLE {name}")
+            cursor.execute(f"ALTER TABLE new_{name} RENAME TO {name}")
+            for index in table.indexes:
+                cursor.execute(str(CreateIndex(index).compile(dialect=dialect)))
+            print(f"   ✓ Rebuilt {name} with enum checks")
+
+        violations = [
+            v for v in cursor.execute("PRAGMA foreign_key_check").fetchall() if v[0] in ENUM_TABLES
+        ]
+        if violations:
+            raise RuntimeError(
+                f"{len(violations)} foreign key violations after rebuild; "
+                "run migrate_add_cascade_deletes.py first"
+            )
+
+        cursor.execute("COMMIT")
+        print("\n✅ Migration completed successfully!")
+
+    except Exception as e:
+        cursor.execute("ROLLBACK")
+        print(f"\n❌ Migration failed: {e}")
+        raise
+    finally:
+        cursor.execute("PRAGMA foreign_keys=ON")
+        conn.close()
+
+if __name__ == "__main__":
+    migrate()
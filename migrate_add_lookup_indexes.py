@@ -0,0 +1,51 @@
+"""Migration script to add case-insensitive fighter name and per-organization event indexes."""
+
+import sqlite3
+from pathlib import Path
+
+DB_PATH = Path(__file__).parent / "mma_data.db"
+
+def migrate():
+    """Create idx_fighter_name_lower and idx_event_org_date, drop the superseded idx_event_org."""
+    conn = sqlite3.connect(DB_PATH)
+    conn.isolation_level = None
+    cursor = conn.cursor()
+
+    print("🔄 Starting database migration...")
+
+    try:
+        cursor.execute("BEGIN")
+
+        # 1. Expression index for lower(name) = lower(?) lookups
+        print("\n1. Creating fighter name index...")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_fighter_name_lower ON fighters (lower(name))")
+        print("   ✓ Created idx_fighter_name_lower")
+
+        # 2. Composite index for per-organization listings ordered by date
+        print("\n2. Creating event organization/date index...")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_event_org_date ON events (organization, event_date)")
+        print("   ✓ Created idx_event_org_date")
+
+        # 3. organization-only filters are served by the composite's prefix
+        print("\n3. Dropping idx_event_org...")
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_event_org'")
+        if cursor.fetchone():
+            cursor.execute("DROP INDEX idx_event_org")
+            print("   ✓ Dropped idx_event_org")
+        else:
+            print("   ⊙ idx_event_org already dropped")
+
+        cursor.execute("COMMIT")
+        cursor.execute("ANALYZE")
+        print("\n✅ Migration completed successfully!")
+
+    except Exception as e:
+        if conn.in_transaction:
+            cursor.execute("ROLLBACK")
+        print(f"\n❌ Migration failed: {e}")
+        raise
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    migrate()
@@ -5,124 +5,131 @@ from pathlib import Path
 
 DB_PATH = Path(__file__).parent / "mma_data.db"
 
+# Same settings as database.db.Database: WAL (persists in the file) and one
+# fsync per checkpoint instead of per DDL statement
+MIGRATION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA foreign_keys=ON",
+)
+
+# Resolution columns added to existing tables: (table, column, declaration)
+NEW_COLUMNS = [
+    ("predictions", "is_correct", "INTEGER DEFAULT NULL"),
+    ("predictions", "resolved_at", "TIMESTAMP DEFAULT NULL"),
+    ("scorecards", "correct_rounds", "INTEGER DEFAULT 0"),
+    ("scorecards", "total_rounds", "INTEGER DEFAULT 0"),
+    ("scorecards", "resolved_at", "TIMESTAMP DEFAULT NULL"),
+    ("round_scores", "is_correct", "INTEGER DEFAULT NULL"),
+]
+
+# Result tables, created in this order (each references the previous one)
+NEW_TABLES = [
+    ("fight_results", """
+        CREATE TABLE fight_results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            fight_id INTEGER NOT NULL UNIQUE,
+            winner VARCHAR(20) NOT NULL,
+            method VARCHAR(20) NOT NULL,
+            finish_round INTEGER,
+            finish_time VARCHAR(10),
+            is_resolved INTEGER DEFAULT 0,
+            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (fight_id) REFERENCES fights(id) ON DELETE CASCADE
+        )
+    """),
+    ("official_scorecards", """
+        CREATE TABLE official_scorecards (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            fight_result_id INTEGER NOT NULL,
+            judge_name VARCHAR(255) NOT NULL,
+            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (fight_result_id) REFERENCES fight_results(id) ON DELETE CASCADE
+        )
+    """),
+    ("official_round_scores", """
+        CREATE TABLE official_round_scores (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            official_scorecard_id INTEGER NOT NULL,
+            round_number INTEGER NOT NULL,
+            fighter1_score INTEGER NOT NULL,
+            fighter2_score INTEGER NOT NULL,
+            FOREIGN KEY (official_scorecard_id) REFERENCES official_scorecards(id) ON DELETE CASCADE,
+            UNIQUE (official_scorecard_id, round_number)
+        )
+    """),
+]
+
+# Indexes created once all tables exist: (name, target)
+NEW_INDEXES = [
+    ("idx_fight_result_fight", "fight_results(fight_id)"),
+    ("idx_official_scorecard_result", "official_scorecards(fight_result_id)"),
+    ("idx_official_roundscore_scorecard", "official_round_scores(official_scorecard_id)"),
+    # Partial index over fighters still waiting for a profile scrape
+    ("idx_fighter_unscraped", "fighters(id) WHERE profile_scraped = 0"),
+]
+
 def migrate():
     """Add new tables and columns for fight results and resolution tracking."""
     conn = sqlite3.connect(DB_PATH)
+    conn.isolation_level = None
     cursor = conn.cursor()
+    for pragma in MIGRATION_PRAGMAS:
+        cursor.execute(pragma)
     
     print("🔄 Starting database migration...")
     
     try:
-        # 1. Add resolution fields to predictions table
-        print("\n1. Adding resolution fields to predictions table...")
-        try:
-            cursor.execute("ALTER TABLE predictions ADD COLUMN is_correct INTEGER DEFAULT NULL")
-            print("   ✓ Added is_correct column")
-        except sqlite3.OperationalError as e:
-            if "duplicate column" in str(e).lower():
-                print("   ⊙ is_correct column already exists")
-            else:
-                raise
-        
-        try:
-            cursor.execute("ALTER TABLE predictions ADD COLUMN resolved_at TIMESTAMP DEFAULT NULL")
-            print("   ✓ Added resolved_at column")
-        except sqlite3.OperationalError as e:
-            if "duplicate column" in str(e).lower():
-                print("   ⊙ resolved_at column already exists")
-            else:
-                raise
+        # All DDL in one transaction: one journal flush instead of one per statement
+        cursor.execute("BEGIN IMMEDIATE")
         
-        # 2. Add resolution fields to scorecards table
-        print("\n2. Adding resolution fields to scorecards table...")
-        try:
-            cursor.execute("ALTER TABLE scorecards ADD COLUMN correct_rounds INTEGER DEFAULT 0")
-            print("   ✓ Added correct_rounds column")
-        except sqlite3.OperationalError as e:
-            if "duplicate column" in str(e).lower():
-                print("   ⊙ correct_rounds column already exists")
-            else:
-                raise
+        # Read the schema once; on a re-run every step below is a lookup
+        schema = {
+            name for (name,) in cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type IN ('table', 'index')"
+            )
+        }
         
-        try:
-            cursor.execute("ALTER TABLE scorecards ADD COLUMN total_rounds INTEGER DEFAULT 0")
-            print("   ✓ Added total_rounds column")
-        except sqlite3.OperationalError as e:
-            if "duplicate column" in str(e).lower():
-                print("   ⊙ total_rounds column already exists")
-            else:
-                raise
+        # 1-3. Add resolution fields, one PRAGMA table_info per table
+        tables = list(dict.fromkeys(table for table, _, _ in NEW_COLUMNS))
+        existing = {
+            table: {row[1] for row in cursor.execute(f"PRAGMA table_info({table})")}
+            for table in tables
+        }
+        for step, table in enumerate(tables, start=1):
+            print(f"\n{step}. Adding resolution fields to {table} table...")
+            for column_table, column, decl in NEW_COLUMNS:
+                if column_table != table:
+                    continue
+                if column in existing[table]:
+                    print(f"   ⊙ {column} column already exists")
+                else:
+                    cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+                    print(f"   ✓ Added {column} column")
         
-        try:
-            cursor.execute("ALTER TABLE scorecards ADD COLUMN resolved_at TIMESTAMP DEFAULT NULL")
-            print("   ✓ Added resolved_at column")
-        except sqlite3.OperationalError as e:
-            if "duplicate column" in str(e).lower():
-                print("   ⊙ resolved_at column already exists")
+        # 4-6. Create the result tables
+        for step, (table, ddl) in enumerate(NEW_TABLES, start=len(tables) + 1):
+            print(f"\n{step}. Creating {table} table...")
+            if table in schema:
+                print(f"   ⊙ {table} table already exists")
             else:
-                raise
+                cursor.execute(ddl)
+                print(f"   ✓ Created {table} table")
         
-        # 3. Add resolution field to round_scores table
-        print("\n3. Adding resolution field to round_scores table...")
-        try:
-            cursor.execute("ALTER TABLE round_scores ADD COLUMN is_correct INTEGER DEFAULT NULL")
-            print("   ✓ Added is_correct column")
-        except sqlite3.OperationalError as e:
-            if "duplicate column" in str(e).lower():
-                print("   ⊙ is_correct column already exists")
+        # 7. Create indexes once all tables exist
+        print(f"\n{len(tables) + len(NEW_TABLES) + 1}. Creating indexes...")
+        for name, target in NEW_INDEXES:
+            if name in schema:
+                print(f"   ⊙ {name} already exists")
             else:
-                raise
-        
-        # 4. Create fight_results table
-        print("\n4. Creating fight_results table...")
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS fight_results (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                fight_id INTEGER NOT NULL UNIQUE,
-                winner VARCHAR(20) NOT NULL,
-                method VARCHAR(20) NOT NULL,
-                finish_round INTEGER,
-                finish_time VARCHAR(10),
-                is_resolved INTEGER DEFAULT 0,
-                created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (fight_id) REFERENCES fights(id) ON DELETE CASCADE
-            )
-        """)
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_fight_result_fight ON fight_results(fight_id)")
-        print("   ✓ Created fight_results table")
-        
-        # 5. Create official_scorecards table
-        print("\n5. Creating official_scorecards table...")
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS official_scorecards (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                fight_result_id INTEGER NOT NULL,
-                judge_name VARCHAR(255) NOT NULL,
-                created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (fight_result_id) REFERENCES fight_results(id) ON DELETE CASCADE
-            )
-        """)
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_official_scorecard_result ON official_scorecards(fight_result_id)")
-        print("   ✓ Created official_scorecards table")
-        
-        # 6. Create official_round_scores table
-        print("\n6. Creating official_round_scores table...")
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS official_round_scores (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                official_scorecard_id INTEGER NOT NULL,
-                round_number INTEGER NOT NULL,
-                fighter1_score INTEGER NOT NULL,
-                fighter2_score INTEGER NOT NULL,
-                FOREIGN KEY (official_scorecard_id) REFERENCES official_scorecards(id) ON DELETE CASCADE,
-                UNIQUE (official_scorecard_id, round_number)
-            )
-        """)
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_official_roundscore_scorecard ON official_round_scores(official_scorecard_id)")
-        print("   ✓ Created official_round_scores table")
+                cursor.execute(f"CREATE INDEX {name} ON {target}")
+                print(f"   ✓ Created {name}")
         
-        conn.commit()
+        cursor.execute("COMMIT")
         print("\n✅ Migration completed successfully!")
         
         # Show summary
@@ -135,10 +142,12 @@ def migrate():
         print(f"   Fight Results: {cursor.fetchone()[0]}")
         
     except Exception as e:
-        conn.rollback()
+        if conn.in_transaction:
+            cursor.execute("ROLLBACK")
         print(f"\n❌ Migration failed: {e}")
         raise
     finally:
+        cursor.execute("PRAGMA optimize")
         conn.close()
 
 if __name__ == "__main__":
@@ -0,0 +1,74 @@
+"""Migration script to add materialized score totals to scorecards."""
+
+import sqlite3
+from pathlib import Path
+
+DB_PATH = Path(__file__).parent / "mma_data.db"
+
+def migrate():
+    """Add total_fighter1/total_fighter2/winner columns and backfill them from round scores."""
+    conn = sqlite3.connect(DB_PATH)
+    conn.isolation_level = None
+    cursor = conn.cursor()
+
+    print("🔄 Starting database migration...")
+
+    try:
+        cursor.execute("BEGIN")
+
+        # 1. Add total/winner columns to scorecards table
+        print("\n1. Adding total columns to scorecards table...")
+        for column, ddl in [
+            ("total_fighter1", "INTEGER DEFAULT 0"),
+            ("total_fighter2", "INTEGER DEFAULT 0"),
+            ("winner", "VARCHAR(8) DEFAULT NULL"),
+        ]:
+            try:
+                cursor.execute(f"ALTER TABLE scorecards ADD COLUMN {column} {ddl}")
+                print(f"   ✓ Added {column} column")
+            except sqlite3.OperationalError as e:
+                if "duplicate column" in str(e).lower():
+                    print(f"   ⊙ {column} column already exists")
+                else:
+                    raise
+
+        # 2. Backfill totals from round scores
+        print("\n2. Backfilling totals from round scores...")
+        cursor.execute("""
+            UPDATE scorecards SET
+                total_fighter1 = (
+                    SELECT COALESCE(SUM(fighter1_score), 0) FROM round_scores
+                    WHERE round_scores.scorecard_id = scorecards.id
+                ),
+                total_fighter2 = (
+                    SELECT COALESCE(SUM(fighter2_score), 0) FROM round_scores
+                    WHERE round_scores.scorecard_id = scorecards.id
+                )
+        """)
+        cursor.execute("""
+            UPDATE scorecards SET winner = CASE
+                WHEN total_fighter1 > total_fighter2 THEN 'fighter1'
+                WHEN total_fighter2 > total_fighter1 THEN 'fighter2'
+                ELSE 'draw'
+            END
+        """)
+        print(f"   ✓ Backfilled {cursor.rowcount} scorecards")
+
+        # 3. Index for winner aggregation per fight
+        print("\n3. Creating scorecard winner index...")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_scorecard_fight_winner ON scorecards(fight_id, winner)")
+        print("   ✓ Created idx_scorecard_fight_winner")
+
+        cursor.execute("COMMIT")
+        print("\n✅ Migration completed successfully!")
+
+    except Exception as e:
+        if conn.in_transaction:
+            cursor.execute("ROLLBACK")
+        print(f"\n❌ Migration failed: {e}")
+        raise
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    migrate()
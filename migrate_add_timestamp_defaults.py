@@ -0,0 +1,94 @@
+"""Migration script to give timestamp columns a sub-second database default.
+
+created_at/scraped_at/updated_at are now filled by the database on
+insert instead of by Python. Tables created before that have no column
+default, so inserts would fail their NOT NULL constraint; tables given the
+earlier CURRENT_TIMESTAMP default only store whole seconds. SQLite cannot
+alter a column default in place, so each affected table is rebuilt from
+the current model definition and its rows copied over.
+"""
+
+import sqlite3
+from pathlib import Path
+
+from sqlalchemy.dialects import sqlite as sqlite_dialect
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from database.models import Base
+
+DB_PATH = Path(__file__).parent / "mma_data.db"
+
+
+def migrate():
+    """Rebuild tables whose timestamp columns lack a database default."""
+    conn = sqlite3.connect(DB_PATH)
+    conn.isolation_level = None
+    cursor = conn.cursor()
+    dialect = sqlite_dialect.dialect()
+
+    print("🔄 Starting database migration...")
+
+    # Table rebuilds must run with enforcement off
+    cursor.execute("PRAGMA foreign_keys=OFF")
+
+    try:
+        cursor.execute("BEGIN")
+        violations_before = len(cursor.execute("PRAGMA foreign_key_check").fetchall())
+
+        # Parents before children
+        for i, table in enumerate(Base.metadata.sorted_tables, start=1):
+            name = table.name
+            defaulted = [c.name for c in table.columns if c.server_default is not None]
+            if not defaulted:
+                continue
+
+            print(f"\n{i}. Rebuilding {name} table...")
+            old_columns = {r[1]: r[4] for r in cursor.execute(f"PRAGMA table_info({name})")}
+            if not old_columns:
+                print(f"   ⊙ {name} table does not exist")
+                continue
+            # PRAGMA table_info reports the default without its parentheses
+            expected = {
+                c.name: c.server_default.arg.text[1:-1]
+                for c in table.columns if c.server_default is not None
+            }
+            if all(old_columns.get(c) == expected[c] for c in defaulted):
+                print(f"   ⊙ {name} already has timestamp defaults")
+                continue
+
+            missing = [c.name for c in table.columns if c.name not in old_columns]
+            if missing:
+                raise RuntimeError(
+                    f"{name} is missing columns {missing}; run the earlier migrate_*.py scripts first"
+                )
+            columns = ", ".join(c.name for c in table.columns)
+
+            ddl = str(CreateTable(table).compile(dialect=dialect)).strip()
+            cursor.execute(ddl.replace(f"CREATE TABLE {name} (", f"CREATE TABLE new_{name} (", 1))
+            cursor.execute(f"INSERT INTO new_{name} ({columns}) SELECT {columns} FROM {name}")
+            cursor.execute(f"DROP TABLE {name}")
+            cursor.execute(f"ALTER TABLE new_{name} RENAME TO {name}")
+            for index in table.indexes:
+                cursor.execute(str(CreateIndex(index).compile(dialect=dialect)))
+            print(f"   ✓ Rebuilt {name} with timestamp defaults")
+
+        # Pre-existing orphans are left to migrate_add_cascade_deletes.py
+        violations_after = len(cursor.execute("PRAGMA foreign_key_check").fetchall())
+        if violations_after > violations_before:
+            raise RuntimeError(
+                f"{violations_after - violations_before} new foreign key violations after rebuild"
+            )
+
+        cursor.execute("COMMIT")
+        print("\n✅ Migration completed successfully!")
+
+    except Exception as e:
+        cursor.execute("ROLLBACK")
+        print(f"\n❌ Migration failed: {e}")
+        raise
+    finally:
+        cursor.execute("PRAGMA foreign_keys=ON")
+        conn.close()
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,76 @@
+"""Migration script to store fighters.weight_kg as REAL instead of INTEGER.
+
+SQLite cannot change a column type in place, so the fighters table is
+rebuilt from the current model definition and its rows copied over.
+"""
+
+import sqlite3
+from pathlib import Path
+
+from sqlalchemy.dialects import sqlite as sqlite_dialect
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from database.models import Base
+
+DB_PATH = Path(__file__).parent / "mma_data.db"
+
+
+def migrate():
+    """Rebuild the fighters table with a REAL weight_kg column."""
+    conn = sqlite3.connect(DB_PATH)
+    conn.isolation_level = None
+    cursor = conn.cursor()
+    dialect = sqlite_dialect.dialect()
+
+    print("🔄 Starting database migration...")
+
+    # fights references fighters; rebuilds must run with enforcement off
+    cursor.execute("PRAGMA foreign_keys=OFF")
+
+    try:
+        cursor.execute("BEGIN")
+
+        print("\n1. Rebuilding fighters table...")
+        weight_type = next(
+            r[2] for r in cursor.execute("PRAGMA table_info(fighters)") if r[1] == "weight_kg"
+        )
+        if weight_type.upper() in ("FLOAT", "REAL"):
+            print("   ⊙ weight_kg is already REAL")
+        else:
+            table = Base.metadata.tables["fighters"]
+            columns = ", ".join(c.name for c in table.columns)
+            select_columns = ", ".join(
+                "CAST(weight_kg AS REAL)" if c.name == "weight_kg" else c.name
+                for c in table.columns
+            )
+
+            ddl = str(CreateTable(table).compile(dialect=dialect)).strip()
+            cursor.execute(ddl.replace("CREATE TABLE fighters (", "CREATE TABLE new_fighters (", 1))
+            cursor.execute(f"INSERT INTO new_fighters ({columns}) SELECT {select_columns} FROM fighters")
+            cursor.execute("DROP TABLE fighters")
+            cursor.execute("ALTER TABLE new_fighters RENAME TO fighters")
+            for index in table.indexes:
+                cursor.execute(str(CreateIndex(index).compile(dialect=dialect)))
+            print(f"   ✓ Rebuilt fighters with REAL weight_kg ({weight_type} before)")
+
+        # Only references into fighters matter here; other orphans are
+        # handled by migrate_add_cascade_deletes.py
+        violations = [
+            v for v in cursor.execute("PRAGMA foreign_key_check").fetchall() if v[2] == "fighters"
+        ]
+        if violations:
+            raise RuntimeError(f"{len(violations)} fighter foreign key violations after rebuild")
+
+        cursor.execute("COMMIT")
+        print("\n✅ Migration completed successfully!")
+
+    except Exception as e:
+        cursor.execute("ROLLBACK")
+        print(f"\n❌ Migration failed: {e}")
+        raise
+    finally:
+        cursor.execute("PRAGMA foreign_keys=ON")
+        conn.close()
+
+if __name__ == "__main__":
+    migrate()
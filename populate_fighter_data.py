@@ -1,6 +1,7 @@
 """Script to populate missing fighter profile data from gidstats.com"""
 
-import time
+from typing import Optional
+
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 
@@ -12,25 +13,90 @@ from sqlalchemy import select
 
 console = Console()
 
+# Fighters written per commit in populate_all_fighters; an interrupted run
+# loses at most this many (each fighter also gets its own savepoint)
+COMMIT_EVERY = 25
+
+# Profile fields copied onto the Fighter when the page has a value
+PROFILE_FIELDS = (
+    "name_english", "country", "age", "height_cm", "weight_kg", "reach_cm",
+    "style", "ranking",
+)
+
+# Win/loss method counts, always copied (missing counts become 0)
+METHOD_FIELDS = (
+    "wins_ko_tko", "wins_submission", "wins_decision",
+    "losses_ko_tko", "losses_submission", "losses_decision",
+)
+
+
+def _set_if_changed(obj: Fighter, attr: str, value) -> None:
+    """Set an attribute only if the value differs, so unchanged columns
+    don't mark the instance dirty."""
+    if getattr(obj, attr) != value:
+        setattr(obj, attr, value)
+
+
+def _populate_fighter(fighter: Fighter, profile_url: str, html: Optional[bytes]) -> bool:
+    """Parse and apply one fighter's fetched profile.
+    
+    Args:
+        fighter: Fighter to update in place.
+        profile_url: URL the profile was fetched from.
+        html: Fetched profile page, or None if the fetch failed.
+        
+    Returns:
+        True if the profile was applied, False if it could not be fetched or parsed.
+    """
+    _set_if_changed(fighter, "profile_url", profile_url)
+    
+    if not html:
+        console.print(f"[yellow]⚠ No HTML for {fighter.name}[/yellow]")
+        return False
+    
+    # Parse profile data
+    parser = FighterProfileParser(html, fighter.name)
+    profile_data = parser.parse_profile()
+    
+    if not profile_data:
+        console.print(f"[yellow]⚠ Failed to parse {fighter.name}[/yellow]")
+        return False
+    
+    # Update fighter with the profile data the page has
+    for attr in PROFILE_FIELDS:
+        value = getattr(profile_data, attr)
+        if value:
+            _set_if_changed(fighter, attr, value)
+    
+    # Update win/loss methods
+    for attr in METHOD_FIELDS:
+        _set_if_changed(fighter, attr, getattr(profile_data, attr) or 0)
+    
+    # Mark as scraped
+    _set_if_changed(fighter, "profile_scraped", True)
+    return True
+
 
 def populate_all_fighters(max_fighters: int = None, delay: float = 1.0):
     """Populate profile data for all fighters in the database.
     
     Args:
         max_fighters: Maximum number of fighters to process (None = all)
-        delay: Delay between requests in seconds to avoid overloading the server
+        delay: Minimum seconds between requests to avoid overloading the server
     """
     db = Database("mma_data.db")
-    client = HTTPClient()
     
-    with db.get_session() as session:
-        # Get all fighters that haven't had their profiles scraped
-        stmt = select(Fighter).where(Fighter.profile_scraped == False)
+    with HTTPClient() as client, db.get_session() as session:
+        # Get all fighters that haven't had their profiles scraped; only the
+        # columns needed to queue the fetches, Fighters are loaded per batch
+        stmt = select(Fighter.id, Fighter.name, Fighter.profile_url).where(
+            Fighter.profile_scraped == False
+        )
         
         if max_fighters:
             stmt = stmt.limit(max_fighters)
         
-        fighters = list(session.execute(stmt).scalars().all())
+        fighters = session.execute(stmt).all()
         
         if not fighters:
             console.print("[yellow]No fighters need profile scraping[/yellow]")
@@ -46,91 +112,67 @@ def populate_all_fighters(max_fighters: int = None, delay: float = 1.0):
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            console=console
+            TextColumn("✓{task.fields[success]} ✗{task.fields[errors]}"),
+            console=console,
+            refresh_per_second=4
         ) as progress:
             task = progress.add_task(
                 "[cyan]Processing fighters...", 
-                total=len(fighters)
+                total=len(fighters),
+                success=0,
+                errors=0
             )
             
-            for fighter in fighters:
-                progress.update(
-                    task, 
-                    description=f"[cyan]Processing: {fighter.name[:30]}..."
-                )
-                
-                try:
-                    # Generate profile URL
-                    if fighter.profile_url:
-                        profile_url = fighter.profile_url
-                    else:
-                        profile_url = generate_fighter_profile_url(fighter.name)
-                        fighter.profile_url = profile_url
-                    
-                    # Fetch profile page
-                    html = client.get_fighter_profile(profile_url)
-                    
-                    if not html:
-                        console.print(f"[yellow]⚠ No HTML for {fighter.name}[/yellow]")
-                        error_count += 1
-                        progress.advance(task)
-                        continue
-                    
-                    # Parse profile data
-                    parser = FighterProfileParser(html, fighter.name)
-                    profile_data = parser.parse_profile()
+            # Fetch pages in the background, spaced at least `delay` apart;
+            # parse and write them here in order
+            profile_urls = [
+                row.profile_url or generate_fighter_profile_url(row.name)
+                for row in fighters
+            ]
+            pages = client.get_fighter_profiles(profile_urls, min_interval=delay)
+            
+            try:
+                for start in range(0, len(fighters), COMMIT_EVERY):
+                    batch = fighters[start:start + COMMIT_EVERY]
+                    # One SELECT loads the whole batch's Fighters
+                    loaded = {
+                        fighter.id: fighter
+                        for fighter in session.execute(
+                            select(Fighter).where(Fighter.id.in_([row.id for row in batch]))
+                        ).scalars()
+                    }
                     
-                    if not profile_data:
-                        console.print(f"[yellow]⚠ Failed to parse {fighter.name}[/yellow]")
-                        error_count += 1
+                    for row, profile_url, html in zip(batch, profile_urls[start:start + COMMIT_EVERY], pages):
+                        fighter = loaded[row.id]
+                        progress.update(
+                            task, 
+                            description=f"[cyan]Processing: {fighter.name[:30]}..."
+                        )
+                        
+                        try:
+                            # A failure rolls back only this fighter's savepoint
+                            with session.begin_nested():
+                                if _populate_fighter(fighter, profile_url, html):
+                                    success_count += 1
+                                else:
+                                    error_count += 1
+                            
+                        except Exception as e:
+                            console.print(f"[red]✗ Error with {fighter.name}: {e}[/red]")
+                            error_count += 1
+                        
+                        progress.update(task, success=success_count, errors=error_count)
                         progress.advance(task)
-                        continue
-                    
-                    # Update fighter with profile data
-                    if profile_data.name_english:
-                        fighter.name_english = profile_data.name_english
-                    if profile_data.country:
-                        fighter.country = profile_data.country
-                    if profile_data.age:
-                        fighter.age = profile_data.age
-                    if profile_data.height_cm:
-                        fighter.height_cm = profile_data.height_cm
-                    if profile_data.weight_kg:
-                        fighter.weight_kg = profile_data.weight_kg
-                    if profile_data.reach_cm:
-                        fighter.reach_cm = profile_data.reach_cm
-                    if profile_data.style:
-                        fighter.style = profile_data.style
-                    if profile_data.ranking:
-                        fighter.ranking = profile_data.ranking
-                    
-                    # Update win methods
-                    fighter.wins_ko_tko = profile_data.wins_ko_tko or 0
-                    fighter.wins_submission = profile_data.wins_submission or 0
-                    fighter.wins_decision = profile_data.wins_decision or 0
-                    
-                    # Update loss methods
-                    fighter.losses_ko_tko = profile_data.losses_ko_tko or 0
-                    fighter.losses_submission = profile_data.losses_submission or 0
-                    fighter.losses_decision = profile_data.losses_decision or 0
-                    
-                    # Mark as scraped
-                    fighter.profile_scraped = True
                     
                     session.commit()
-                    success_count += 1
-                    
-                    console.print(f"[green]✓ {fighter.name}[/green]")
-                    
-                except Exception as e:
-                    console.print(f"[red]✗ Error with {fighter.name}: {e}[/red]")
-                    error_count += 1
-                    session.rollback()
-                
-                progress.advance(task)
-                
-                # Delay to avoid overloading the server
-                time.sleep(delay)
+                    # Drop the committed batch so the session stays small
+                    session.expunge_all()
+            finally:
+                # Stop pending fetches, keep the last partial batch, even on Ctrl+C
+                pages.close()
+                session.commit()
+        
+        db.checkpoint("TRUNCATE")
         
         console.print(f"\n[bold green]✓ Complete![/bold green]")
         console.print(f"[green]Success: {success_count}[/green]")
@@ -144,9 +186,8 @@ def populate_specific_fighter(fighter_name: str):
         fighter_name: Name of the fighter to update
     """
     db = Database("mma_data.db")
-    client = HTTPClient()
     
-    with db.get_session() as session:
+    with HTTPClient() as client, db.get_session() as session:
         stmt = select(Fighter).where(Fighter.name == fighter_name)
         fighter = session.execute(stmt).scalar_one_or_none()
         
@@ -210,12 +251,8 @@ def populate_specific_fighter(fighter_name: str):
                 console.print(f"  Ranking: {profile_data.ranking}")
             
             # Update win/loss methods
-            fighter.wins_ko_tko = profile_data.wins_ko_tko or 0
-            fighter.wins_submission = profile_data.wins_submission or 0
-            fighter.wins_decision = profile_data.wins_decision or 0
-            fighter.losses_ko_tko = profile_data.losses_ko_tko or 0
-            fighter.losses_submission = profile_data.losses_submission or 0
-            fighter.losses_decision = profile_data.losses_decision or 0
+            for attr in METHOD_FIELDS:
+                _set_if_changed(fighter, attr, getattr(profile_data, attr) or 0)
             
             console.print(f"\n  Win Methods: KO/TKO={fighter.wins_ko_tko}, Sub={fighter.wins_submission}, Dec={fighter.wins_decision}")
             console.print(f"  Loss Methods: KO/TKO={fighter.losses_ko_tko}, Sub={fighter.losses_submission}, Dec={fighter.losses_decision}")
@@ -1,39 +1,86 @@
 """Comprehensive script to scrape ALL fighter profiles and populate database"""
 
-import time
+from datetime import datetime, timezone
+from typing import Optional
+
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 from rich.prompt import Confirm
 
 from database import Database
 from database.models import Fighter
-from scraper.client import HTTPClient
+from scraper.cache import HTTP_CACHE_PATH, ResponseCache
+from scraper.client import NOT_MODIFIED, HTTPClient
 from scraper.parsers import FighterProfileParser, generate_fighter_profile_url
-from sqlalchemy import select
+from sqlalchemy import func, select
 
 console = Console()
 
+# Fighters written per bulk UPDATE + commit; an interrupted run loses at
+# most this many
+COMMIT_EVERY = 25
+
+# Profile fields that replace the stored value only when the page has one
+PROFILE_FIELDS = (
+    "name_english", "country", "age", "height_cm", "weight_kg", "reach_cm",
+    "style", "ranking",
+)
+
+# Win/loss method counts, always overwritten
+METHOD_FIELDS = (
+    "wins_ko_tko", "wins_submission", "wins_decision",
+    "losses_ko_tko", "losses_submission", "losses_decision",
+)
+
+
+def _page_applied(updated_at: Optional[datetime], stored_at: float) -> bool:
+    """Check whether a fighter row was written after its cached page was downloaded.
+    
+    The cache stores a page before it is parsed or committed, so a run that
+    stopped early leaves pages cached that never reached the fighter.
+    
+    Args:
+        updated_at: Fighter.updated_at (naive values are UTC).
+        stored_at: CachedResponse.stored_at of the profile page.
+    """
+    if updated_at is None:
+        return False
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    return updated_at.timestamp() >= stored_at
+
 
 def scrape_all_fighters(
     skip_scraped: bool = True,
     max_fighters: int = None,
     delay: float = 1.5,
-    start_from: int = 0
+    start_from: int = 0,
+    use_cache: bool = True
 ):
     """Scrape profile data for all fighters.
     
     Args:
         skip_scraped: Skip fighters that are already marked as scraped
         max_fighters: Maximum number of fighters to process (None = all)
-        delay: Delay between requests in seconds
+        delay: Minimum seconds between requests
         start_from: Skip first N fighters (for resuming)
+        use_cache: Reuse pages from http_cache.db; fresh ones skip the request,
+            older ones are revalidated (a 304 costs no page download). An
+            already scraped fighter isn't parsed again if the page is unchanged
+            and was written to the fighter (updated_at after it was downloaded)
     """
     db = Database("mma_data.db")
-    client = HTTPClient()
+    cache = ResponseCache(HTTP_CACHE_PATH) if use_cache else None
     
-    with db.get_session() as session:
-        # Build query
-        stmt = select(Fighter)
+    # One client (and its keep-alive connection pool) for the whole run
+    with HTTPClient(cache=cache) as client, db.get_session() as session:
+        # Build query; plain rows with the columns needed to queue the
+        # fetches, fill in what a profile page leaves out and spot no-op updates
+        stmt = select(
+            Fighter.id, Fighter.name, Fighter.profile_url, Fighter.profile_scraped,
+            Fighter.updated_at, Fighter.wins, Fighter.losses, Fighter.draws,
+            *(getattr(Fighter, field) for field in PROFILE_FIELDS + METHOD_FIELDS),
+        )
         
         if skip_scraped:
             stmt = stmt.where(Fighter.profile_scraped == False)
@@ -46,7 +93,7 @@ def scrape_all_fighters(
         if max_fighters:
             stmt = stmt.limit(max_fighters)
         
-        fighters = list(session.execute(stmt).scalars().all())
+        fighters = session.execute(stmt).all()
         
         if not fighters:
             console.print("[yellow]No fighters to process[/yellow]")
@@ -65,7 +112,9 @@ def scrape_all_fighters(
             BarColumn(),
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             TextColumn("✓{task.fields[success]} ✗{task.fields[errors]} ⊘{task.fields[not_found]}"),
-            console=console
+            console=console,
+            # Fetches overlap now; don't redraw for every fighter
+            refresh_per_second=4
         ) as progress:
             task = progress.add_task(
                 "[cyan]Scraping...", 
@@ -75,118 +124,113 @@ def scrape_all_fighters(
                 not_found=0
             )
             
-            for i, fighter in enumerate(fighters):
-                progress.update(
-                    task, 
-                    description=f"[cyan]{fighter.name[:40]}..."
-                )
-                
-                try:
-                    # Generate or use existing profile URL
-                    if not fighter.profile_url:
-                        fighter.profile_url = generate_fighter_profile_url(fighter.name)
-                    
-                    profile_url = fighter.profile_url
-                    
-                    # Fetch profile page
-                    html = client.get_fighter_profile(profile_url)
+            # Generate or use existing profile URLs and fetch the pages in the
+            # background, spaced at least `delay` apart; process them here
+            profile_urls = [
+                row.profile_url or generate_fighter_profile_url(row.name)
+                for row in fighters
+            ]
+            pages = client.get_fighter_profiles(
+                profile_urls, min_interval=delay, if_modified=not skip_scraped
+            )
+            
+            # Parsed fighters waiting for the next bulk UPDATE; every row
+            # sets the same columns so they go out as one executemany.
+            # Fighters whose page matched the stored data only get
+            # updated_at stamped, so the next run knows the page was applied
+            updates = []
+            unchanged = []
+            
+            def save_batch():
+                """Write and commit the queued fighters."""
+                db.update_fighters(session, updates)
+                db.update_fighters(session, unchanged)
+                session.commit()
+                updates.clear()
+                unchanged.clear()
+            
+            try:
+                for row, profile_url, html in zip(fighters, profile_urls, pages):
+                    progress.update(
+                        task, 
+                        description=f"[cyan]{row.name[:40]}..."
+                    )
                     
-                    if not html:
-                        not_found_count += 1
-                        progress.update(task, not_found=not_found_count)
-                        progress.advance(task)
-                        time.sleep(delay * 0.5)  # Shorter delay for 404s
-                        continue
+                    try:
+                        if html is NOT_MODIFIED:
+                            cached = client.cache.get_stale(profile_url)
+                            if row.profile_scraped and _page_applied(row.updated_at, cached.stored_at):
+                                # Same page as the one last written to this fighter
+                                success_count += 1
+                                progress.update(task, success=success_count)
+                                progress.advance(task)
+                                continue
+                            html = cached.body
+                        
+                        if not html:
+                            not_found_count += 1
+                            progress.update(task, not_found=not_found_count)
+                            progress.advance(task)
+                            continue
+                        
+                        # Parse profile data
+                        parser = FighterProfileParser(html, row.name)
+                        profile_data = parser.parse_profile()
+                        
+                        if not profile_data:
+                            error_count += 1
+                            progress.update(task, errors=error_count)
+                            progress.advance(task)
+                            continue
+                        
+                        values = {"id": row.id, "profile_url": profile_url, "profile_scraped": True}
+                        
+                        # Take each available field, keep the stored value otherwise
+                        for field in PROFILE_FIELDS:
+                            value = getattr(profile_data, field)
+                            if not value or (field == "name_english" and value == row.name):
+                                value = getattr(row, field)
+                            values[field] = value
+                        
+                        # Always update win/loss methods
+                        for field in METHOD_FIELDS:
+                            values[field] = getattr(profile_data, field) or 0
+                        
+                        # Update record
+                        values["wins"] = profile_data.wins
+                        values["losses"] = profile_data.losses
+                        values["draws"] = profile_data.draws
+                        
+                        # Re-scraped fighters whose page hasn't changed need no full write
+                        if any(getattr(row, field) != value for field, value in values.items()):
+                            updates.append(values)
+                        else:
+                            unchanged.append({"id": row.id, "profile_scraped": True})
+                        
+                        # No line per fighter; the counters in the bar show progress
+                        success_count += 1
+                        progress.update(task, success=success_count)
                     
-                    # Parse profile data
-                    parser = FighterProfileParser(html, fighter.name)
-                    profile_data = parser.parse_profile()
+                    except KeyboardInterrupt:
+                        console.print("\n[yellow]Interrupted! Progress saved.[/yellow]")
+                        raise
                     
-                    if not profile_data:
+                    except Exception as e:
+                        error_msg = str(e)[:80]
+                        console.print(f"[red]✗ {row.name}: {error_msg}[/red]")
                         error_count += 1
                         progress.update(task, errors=error_count)
-                        progress.advance(task)
-                        time.sleep(delay)
-                        continue
                     
-                    # Track what was updated
-                    updated_fields = []
+                    if len(updates) + len(unchanged) >= COMMIT_EVERY:
+                        save_batch()
                     
-                    # Update all available fields
-                    if profile_data.name_english and profile_data.name_english != fighter.name:
-                        fighter.name_english = profile_data.name_english
-                        updated_fields.append("en_name")
-                    
-                    if profile_data.country:
-                        fighter.country = profile_data.country
-                        updated_fields.append("country")
-                    
-                    if profile_data.age:
-                        fighter.age = profile_data.age
-                        updated_fields.append("age")
-                    
-                    if profile_data.height_cm:
-                        fighter.height_cm = profile_data.height_cm
-                        updated_fields.append("height")
-                    
-                    if profile_data.weight_kg:
-                        fighter.weight_kg = profile_data.weight_kg
-                        updated_fields.append("weight")
-                    
-                    if profile_data.reach_cm:
-                        fighter.reach_cm = profile_data.reach_cm
-                        updated_fields.append("reach")
-                    
-                    if profile_data.style:
-                        fighter.style = profile_data.style
-                        updated_fields.append("style")
-                    
-                    if profile_data.ranking:
-                        fighter.ranking = profile_data.ranking
-                        updated_fields.append("ranking")
-                    
-                    # Always update win/loss methods
-                    fighter.wins_ko_tko = profile_data.wins_ko_tko or 0
-                    fighter.wins_submission = profile_data.wins_submission or 0
-                    fighter.wins_decision = profile_data.wins_decision or 0
-                    fighter.losses_ko_tko = profile_data.losses_ko_tko or 0
-                    fighter.losses_submission = profile_data.losses_submission or 0
-                    fighter.losses_decision = profile_data.losses_decision or 0
-                    updated_fields.append("methods")
-                    
-                    # Update record if it changed
-                    if (profile_data.wins != fighter.wins or 
-                        profile_data.losses != fighter.losses or 
-                        profile_data.draws != fighter.draws):
-                        fighter.wins = profile_data.wins
-                        fighter.losses = profile_data.losses
-                        fighter.draws = profile_data.draws
-                        updated_fields.append("record")
-                    
-                    # Mark as scraped
-                    fighter.profile_scraped = True
-                    
-                    session.commit()
-                    success_count += 1
-                    progress.update(task, success=success_count)
-                    
-                    if len(updated_fields) > 0:
-                        console.print(f"[green]✓ {fighter.name}: {', '.join(updated_fields)}[/green]")
-                    
-                except KeyboardInterrupt:
-                    console.print("\n[yellow]Interrupted! Progress saved.[/yellow]")
-                    session.commit()
-                    raise
-                    
-                except Exception as e:
-                    error_msg = str(e)[:80]
-                    console.print(f"[red]✗ {fighter.name}: {error_msg}[/red]")
-                    error_count += 1
-                    progress.update(task, errors=error_count)
-                    session.rollback()
-                
-                progress.advance(task)
-                time.sleep(delay)
+                    progress.advance(task)
+            finally:
+                # Stop pending fetches and save the last partial batch, even on Ctrl+C
+                pages.close()
+                save_batch()
+        
+        db.checkpoint("TRUNCATE")
         
         console.print(f"\n[bold]Final Results:[/bold]")
         console.print(f"[green]✓ Successfully scraped: {success_count}/{len(fighters)}[/green]")
@@ -222,16 +266,21 @@ if __name__ == "__main__":
         action="store_true",
         help="Re-scrape fighters that were already scraped (updates their data)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Fetch every profile page instead of reusing http_cache.db"
+    )
     
     args = parser.parse_args()
     
     # Show summary
     db = Database("mma_data.db")
     with db.get_session() as session:
-        stmt = select(Fighter)
+        stmt = select(func.count()).select_from(Fighter)
         if not args.include_scraped:
             stmt = stmt.where(Fighter.profile_scraped == False)
-        total = len(list(session.execute(stmt).scalars().all()))
+        total = session.execute(stmt).scalar_one()
     
     console.print(f"\n[bold]Fighters to process: {total}[/bold]")
     
@@ -253,7 +302,8 @@ if __name__ == "__main__":
             skip_scraped=not args.include_scraped,
             max_fighters=args.max,
             delay=args.delay,
-            start_from=args.start_from
+            start_from=args.start_from,
+            use_cache=not args.no_cache
         )
     except KeyboardInterrupt:
         console.print("\n[yellow]Stopped by user[/yellow]")
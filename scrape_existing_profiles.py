@@ -1,6 +1,5 @@
 """Script to scrape profile data for fighters that already have profile URLs"""
 
-import time
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 
@@ -12,20 +11,41 @@ from sqlalchemy import select
 
 console = Console()
 
+# Fighters written per bulk UPDATE + commit
+COMMIT_EVERY = 200
 
-def scrape_fighters_with_urls(max_fighters: int = None, delay: float = 1.5):
+# Profile fields set only when the page has a value; otherwise the stored
+# value is written back so every row in a batch sets the same columns
+PROFILE_FIELDS = (
+    "name_english", "country", "age", "height_cm", "weight_kg", "reach_cm",
+    "style", "ranking",
+)
+
+# Win/loss method counts, always overwritten
+METHOD_FIELDS = (
+    "wins_ko_tko", "wins_submission", "wins_decision",
+    "losses_ko_tko", "losses_submission", "losses_decision",
+)
+
+
+def scrape_fighters_with_urls(max_fighters: int = None, delay: float = 1.5, workers: int = None):
     """Scrape profile data for fighters that already have profile URLs.
     
     Args:
         max_fighters: Maximum number of fighters to process (None = all)
-        delay: Delay between requests in seconds
+        delay: Minimum seconds between requests
+        workers: Profile pages fetched at once (None = HTTPClient.FETCH_WORKERS)
     """
     db = Database("mma_data.db")
-    client = HTTPClient()
     
-    with db.get_session() as session:
-        # Get fighters that have profile URLs but haven't been scraped
-        stmt = select(Fighter).where(
+    with HTTPClient() as client, db.get_session() as session:
+        # Get fighters that have profile URLs but haven't been scraped; only
+        # the columns the loop reads and compares against, as plain rows
+        stmt = select(
+            Fighter.id, Fighter.name, Fighter.profile_url,
+            Fighter.wins, Fighter.losses, Fighter.draws,
+            *(getattr(Fighter, field) for field in PROFILE_FIELDS + METHOD_FIELDS),
+        ).where(
             Fighter.profile_url.isnot(None),
             Fighter.profile_scraped == False
         )
@@ -33,7 +53,7 @@ def scrape_fighters_with_urls(max_fighters: int = None, delay: float = 1.5):
         if max_fighters:
             stmt = stmt.limit(max_fighters)
         
-        fighters = list(session.execute(stmt).scalars().all())
+        fighters = session.execute(stmt).all()
         
         if not fighters:
             console.print("[yellow]No fighters with URLs need scraping[/yellow]")
@@ -56,91 +76,90 @@ def scrape_fighters_with_urls(max_fighters: int = None, delay: float = 1.5):
                 total=len(fighters)
             )
             
-            for fighter in fighters:
-                progress.update(
-                    task, 
-                    description=f"[cyan]{fighter.name[:40]}..."
-                )
-                
-                try:
-                    # Fetch profile page
-                    html = client.get_fighter_profile(fighter.profile_url)
-                    
-                    if not html:
-                        error_count += 1
-                        progress.advance(task)
-                        time.sleep(delay)
-                        continue
-                    
-                    # Parse profile data
-                    parser = FighterProfileParser(html, fighter.name)
-                    profile_data = parser.parse_profile()
+            # Fetch pages in the background, spaced at least `delay` apart;
+            # parse and write them here in order
+            pages = client.get_fighter_profiles(
+                [fighter.profile_url for fighter in fighters],
+                min_interval=delay,
+                workers=workers,
+            )
+            
+            # Parsed fighters waiting for the next executemany UPDATE, and
+            # fighters whose page matched the stored data, which only need
+            # profile_scraped set
+            pending = []
+            unchanged = []
+            
+            def save_batch():
+                """Write and commit the queued fighters; one summary line per batch."""
+                if not pending and not unchanged:
+                    return
+                db.update_fighters(session, pending)
+                db.update_fighters(session, unchanged)
+                session.commit()
+                console.print(f"[green]✓ Saved {len(pending)} updated, {len(unchanged)} unchanged[/green]")
+                pending.clear()
+                unchanged.clear()
+            
+            try:
+                for fighter, html in zip(fighters, pages):
+                    progress.update(
+                        task, 
+                        description=f"[cyan]{fighter.name[:40]}..."
+                    )
                     
-                    if not profile_data:
+                    try:
+                        if not html:
+                            error_count += 1
+                            progress.advance(task)
+                            continue
+                        
+                        # Parse profile data
+                        parser = FighterProfileParser(html, fighter.name)
+                        profile_data = parser.parse_profile()
+                        
+                        if not profile_data:
+                            error_count += 1
+                            progress.advance(task)
+                            continue
+                        
+                        # Collect the columns to set; written in batches below
+                        values = {"id": fighter.id}
+                        for field in PROFILE_FIELDS:
+                            values[field] = getattr(profile_data, field) or getattr(fighter, field)
+                        
+                        # Update win/loss methods
+                        for field in METHOD_FIELDS:
+                            values[field] = getattr(profile_data, field) or 0
+                        
+                        # Update record
+                        values["wins"] = profile_data.wins
+                        values["losses"] = profile_data.losses
+                        values["draws"] = profile_data.draws
+                        
+                        # Write the full row only if the page changed something
+                        if any(getattr(fighter, field) != value for field, value in values.items()):
+                            values["profile_scraped"] = True
+                            pending.append(values)
+                        else:
+                            unchanged.append({"id": fighter.id, "profile_scraped": True})
+                        success_count += 1
+                        
+                    except Exception as e:
+                        console.print(f"[red]✗ {fighter.name}: {str(e)[:100]}[/red]")
                         error_count += 1
-                        progress.advance(task)
-                        time.sleep(delay)
-                        continue
                     
-                    # Update fighter with profile data
-                    updates = []
+                    if len(pending) + len(unchanged) >= COMMIT_EVERY:
+                        save_batch()
                     
-                    if profile_data.name_english:
-                        fighter.name_english = profile_data.name_english
-                        updates.append(f"english_name")
-                    if profile_data.country:
-                        fighter.country = profile_data.country
-                        updates.append(f"country")
-                    if profile_data.age:
-                        fighter.age = profile_data.age
-                        updates.append(f"age")
-                    if profile_data.height_cm:
-                        fighter.height_cm = profile_data.height_cm
-                        updates.append(f"height")
-                    if profile_data.weight_kg:
-                        fighter.weight_kg = profile_data.weight_kg
-                        updates.append(f"weight")
-                    if profile_data.reach_cm:
-                        fighter.reach_cm = profile_data.reach_cm
-                        updates.append(f"reach")
-                    if profile_data.style:
-                        fighter.style = profile_data.style
-                        updates.append(f"style")
-                    if profile_data.ranking:
-                        fighter.ranking = profile_data.ranking
-                        updates.append(f"ranking")
-                    
-                    # Update win/loss methods
-                    fighter.wins_ko_tko = profile_data.wins_ko_tko or 0
-                    fighter.wins_submission = profile_data.wins_submission or 0
-                    fighter.wins_decision = profile_data.wins_decision or 0
-                    fighter.losses_ko_tko = profile_data.losses_ko_tko or 0
-                    fighter.losses_submission = profile_data.losses_submission or 0
-                    fighter.losses_decision = profile_data.losses_decision or 0
-                    updates.append(f"methods")
-                    
-                    # Update record if changed
-                    if profile_data.wins != fighter.wins or profile_data.losses != fighter.losses or profile_data.draws != fighter.draws:
-                        fighter.wins = profile_data.wins
-                        fighter.losses = profile_data.losses
-                        fighter.draws = profile_data.draws
-                        updates.append(f"record")
-                    
-                    # Mark as scraped
-                    fighter.profile_scraped = True
-                    
-                    session.commit()
-                    success_count += 1
-                    
-                    console.print(f"[green]✓ {fighter.name} - Updated: {', '.join(updates)}[/green]")
-                    
-                except Exception as e:
-                    console.print(f"[red]✗ {fighter.name}: {str(e)[:100]}[/red]")
-                    error_count += 1
-                    session.rollback()
-                
-                progress.advance(task)
-                time.sleep(delay)
+                    progress.advance(task)
+            finally:
+                # Stop pending fetches, keep the last partial batch, even on Ctrl+C
+                pages.close()
+                save_batch()
+        
+        # Fold the run's writes back into mma_data.db and shrink the -wal file
+        db.checkpoint("TRUNCATE")
         
         console.print(f"\n[bold]Results:[/bold]")
         console.print(f"[green]✓ Successfully scraped: {success_count}[/green]")
@@ -164,13 +183,19 @@ if __name__ == "__main__":
         default=1.5,
         help="Delay between requests in seconds (default: 1.5)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help=f"Profile pages fetched at once (default: {HTTPClient.FETCH_WORKERS})"
+    )
     
     args = parser.parse_args()
     
     try:
         scrape_fighters_with_urls(
             max_fighters=args.max,
-            delay=args.delay
+            delay=args.delay,
+            workers=args.workers
         )
     except KeyboardInterrupt:
         console.print("\n[yellow]Interrupted by user[/yellow]")
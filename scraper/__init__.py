@@ -1,5 +1,6 @@
 """MMA Event Scraper - Scraper module."""
 
+from .cache import ResponseCache
 from .client import HTTPClient
 from .parsers import (
     EventListParser,
@@ -12,6 +13,7 @@ from .validators import EventData, FightData, FighterData
 
 __all__ = [
     "HTTPClient",
+    "ResponseCache",
     "EventListParser",
     "EventDetailParser",
     "FighterProfileParser",
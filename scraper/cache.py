@@ -0,0 +1,113 @@
+"""SQLite-backed cache of HTTP response bodies, keyed by URL."""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import NamedTuple, Optional, Union
+
+# How long a cached page is served before it is fetched again; after that
+# it is revalidated with a conditional request
+DEFAULT_EXPIRE_AFTER_SECONDS = 12 * 60 * 60
+
+# Bumped when the responses table changes; an older cache file is dropped
+CACHE_VERSION = 3
+
+# Cache file shared by main.py and the profile scripts, next to mma_data.db
+# whatever directory they are run from
+HTTP_CACHE_PATH = Path(__file__).resolve().parent.parent / "http_cache.db"
+
+
+class CachedResponse(NamedTuple):
+    """A stored page with the validators the server sent for it."""
+
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    # When this body was downloaded (time.time()); a 304 doesn't change it
+    stored_at: float
+
+
+class ResponseCache:
+    """Disk cache for fetched pages.
+
+    One connection is shared by all threads using the client; a lock
+    serializes access to it.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        expire_after: float = DEFAULT_EXPIRE_AFTER_SECONDS,
+    ):
+        """Open (or create) the cache database.
+
+        Args:
+            path: Path to the SQLite file.
+            expire_after: Seconds a cached response stays fresh.
+        """
+        self.expire_after = expire_after
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != CACHE_VERSION:
+            self._conn.execute("DROP TABLE IF EXISTS responses")
+            self._conn.execute(f"PRAGMA user_version = {CACHE_VERSION}")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "url TEXT PRIMARY KEY, body BLOB NOT NULL, fetched_at REAL NOT NULL, "
+            "etag TEXT, last_modified TEXT, stored_at REAL NOT NULL)"
+        )
+
+    def get(self, url: str) -> Optional[bytes]:
+        """Return the cached body for a URL, or None if missing or expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body FROM responses WHERE url = ? AND fetched_at > ?",
+                (url, time.time() - self.expire_after),
+            ).fetchone()
+        return row[0] if row else None
+
+    def get_stale(self, url: str) -> Optional[CachedResponse]:
+        """Return the cached entry for a URL whatever its age, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, stored_at FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+        return CachedResponse(*row) if row else None
+
+    def set(
+        self,
+        url: str,
+        body: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Store the body fetched for a URL, with its ETag/Last-Modified headers."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(url, body, fetched_at, etag, last_modified, stored_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (url, body, now, etag, last_modified, now),
+            )
+
+    def touch(self, url: str) -> None:
+        """Mark a cached entry fresh again (the server answered 304)."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET fetched_at = ? WHERE url = ?",
+                (time.time(), url),
+            )
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the cache database."""
+        self._conn.close()
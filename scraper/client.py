@@ -2,14 +2,21 @@
 
 import time
 import random
-from typing import Optional
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count, islice
+from typing import Iterator, List, Optional
 from functools import wraps
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 from urllib3.util.retry import Retry
 from rich.console import Console
 
+from .cache import ResponseCache
+
 console = Console()
 
 # User agents to rotate
@@ -23,7 +30,11 @@ USER_AGENTS = [
 
 
 def rate_limit(min_delay: float = 1.0, max_delay: float = 3.0):
-    """Decorator to add random delay between requests.
+    """Decorator to space out requests by a random delay.
+    
+    The delay is measured from the start of the request, so time spent
+    waiting on the network counts towards it; a slow response pays no
+    extra sleep.
     
     Args:
         min_delay: Minimum delay in seconds.
@@ -32,41 +43,115 @@ def rate_limit(min_delay: float = 1.0, max_delay: float = 3.0):
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
+            started = time.monotonic()
             result = func(*args, **kwargs)
-            delay = random.uniform(min_delay, max_delay)
-            time.sleep(delay)
+            remaining = random.uniform(min_delay, max_delay) - (time.monotonic() - started)
+            if remaining > 0:
+                time.sleep(remaining)
             return result
         return wrapper
     return decorator
 
 
+class Throttle:
+    """Spaces out calls made from several threads.
+    
+    Each wait() returns at least min_interval seconds after the previous one.
+    """
+    
+    def __init__(self, min_interval: float):
+        """Initialize throttle.
+        
+        Args:
+            min_interval: Minimum seconds between consecutive calls.
+        """
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+    
+    def wait(self) -> None:
+        """Block until this caller's turn."""
+        with self._lock:
+            now = time.monotonic()
+            turn = max(now, self._next_at)
+            self._next_at = turn + self.min_interval
+        if turn > now:
+            time.sleep(turn - now)
+
+
+# Returned by get(..., if_modified=True) instead of a cached body the
+# server (or the cache's freshness window) says is unchanged
+NOT_MODIFIED = object()
+
+
+# Headers sent with every request; the User-Agent is rotated separately.
+# Accept-Encoding lists only what urllib3 can decode here (br and zstd need
+# their optional packages), so no response comes back undecodable
+DEFAULT_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5,ru;q=0.3",
+    "Accept-Encoding": ACCEPT_ENCODING,
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Cache-Control": "max-age=0",
+}
+
+
 class HTTPClient:
     """HTTP client with retry logic, rate limiting, and User-Agent rotation."""
     
     BASE_URL = "https://gidstats.com"
     
+    # Threads used by get_fighter_profiles
+    FETCH_WORKERS = 8
+    
+    # Host pools kept by the adapter, and kept-alive connections per host.
+    # POOL_MAXSIZE must cover the threads sharing one client (see main.py);
+    # get_fighter_profiles never runs more workers than this
+    POOL_CONNECTIONS = 4
+    POOL_MAXSIZE = 32
+    
+    # Profile pages get_fighter_profiles fetches ahead of its caller; bounds
+    # the finished pages held in memory while the caller parses and writes
+    PREFETCH_PAGES = 32
+    
+    # Requests sent with one User-Agent before switching to another (a 403
+    # also switches it)
+    USER_AGENT_ROTATE_EVERY = 50
+    
     def __init__(
         self,
         timeout: int = 30,
         max_retries: int = 3,
         backoff_factor: float = 0.5,
+        connect_timeout: float = 3.05,
+        cache: Optional[ResponseCache] = None,
     ):
         """Initialize HTTP client.
         
         Args:
-            timeout: Request timeout in seconds.
+            timeout: Read timeout in seconds.
             max_retries: Maximum number of retries.
             backoff_factor: Backoff factor for retries.
+            connect_timeout: Connect timeout in seconds; kept short so a dead
+                connection fails fast and gets retried.
+            cache: Optional disk cache for profile and rankings pages; closed
+                with the client.
         """
-        self.timeout = timeout
+        self.timeout = (connect_timeout, timeout)
         self.session = self._create_session(max_retries, backoff_factor)
+        self.cache = cache
+        self._requests_sent = count(1)
         
     def _create_session(
         self,
         max_retries: int,
         backoff_factor: float,
     ) -> requests.Session:
-        """Create a requests session with retry logic.
+        """Create a requests session with retry logic and a pooled adapter.
+        
+        Connections are kept alive in the adapter's pool, so repeated
+        requests to gidstats.com reuse one TLS connection per thread.
         
         Args:
             max_retries: Maximum number of retries.
@@ -76,6 +161,8 @@ class HTTPClient:
             Configured requests session.
         """
         session = requests.Session()
+        session.headers.update(DEFAULT_HEADERS)
+        session.headers["User-Agent"] = random.choice(USER_AGENTS)
         
         # Configure retry strategy
         retry_strategy = Retry(
@@ -85,50 +172,102 @@ class HTTPClient:
             allowed_methods=["GET"],
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=retry_strategy,
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
         return session
     
-    def _get_headers(self) -> dict:
-        """Get request headers with random User-Agent.
-        
-        Returns:
-            Headers dictionary.
-        """
-        return {
-            "User-Agent": random.choice(USER_AGENTS),
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5,ru;q=0.3",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-            "Cache-Control": "max-age=0",
-        }
+    def _rotate_user_agent(self) -> None:
+        """Switch the session to a random User-Agent."""
+        self.session.headers["User-Agent"] = random.choice(USER_AGENTS)
     
-    @rate_limit(min_delay=1.0, max_delay=2.5)
-    def get(self, url: str, full_url: bool = False) -> Optional[str]:
+    def get(
+        self,
+        url: str,
+        full_url: bool = False,
+        cached: bool = False,
+        if_modified: bool = False,
+    ) -> Optional[bytes]:
         """Make a GET request with rate limiting.
         
+        The body is returned undecoded; the parsers hand the bytes to lxml,
+        which decodes them in one pass.
+        
         Args:
             url: URL path (will be appended to BASE_URL) or full URL if full_url=True.
             full_url: If True, use url as-is; otherwise prepend BASE_URL.
+            cached: If True and the client has a cache, serve a fresh cached
+                copy without a request (or rate-limit delay) and store new
+                responses. An expired copy is revalidated with
+                If-None-Match/If-Modified-Since and reused on 304.
+            if_modified: If True, return NOT_MODIFIED instead of a cached
+                body that is fresh or was revalidated. That only means the
+                page matches the cached copy, which is stored as soon as it
+                is downloaded; the caller has to check it applied that copy
+                (see CachedResponse.stored_at) before skipping it.
             
         Returns:
-            Response text or None if request failed.
+            Response body, NOT_MODIFIED, or None if request failed.
         """
         request_url = url if full_url else f"{self.BASE_URL}{url}"
+        cache = self.cache if cached else None
+        
+        if cache is None:
+            response = self._fetch(request_url)
+            return response.content if response is not None else None
+        
+        body = cache.get(request_url)
+        if body is not None:
+            return NOT_MODIFIED if if_modified else body
+        
+        stale = cache.get_stale(request_url)
+        headers = {}
+        if stale is not None:
+            if stale.etag:
+                headers["If-None-Match"] = stale.etag
+            if stale.last_modified:
+                headers["If-Modified-Since"] = stale.last_modified
+        
+        response = self._fetch(request_url, headers)
+        if response is None:
+            return None
+        
+        if response.status_code == 304 and stale is not None:
+            cache.touch(request_url)
+            return NOT_MODIFIED if if_modified else stale.body
+        
+        cache.set(
+            request_url,
+            response.content,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return response.content
+    
+    @rate_limit(min_delay=1.0, max_delay=2.5)
+    def _fetch(self, request_url: str, headers: Optional[dict] = None) -> Optional[requests.Response]:
+        """Fetch a URL over the network.
+        
+        Args:
+            request_url: Full URL.
+            headers: Extra request headers (e.g. conditional-request validators).
+            
+        Returns:
+            Response (200, or 304 for a conditional request) or None if
+            request failed.
+        """
+        if next(self._requests_sent) % self.USER_AGENT_ROTATE_EVERY == 0:
+            self._rotate_user_agent()
         
         try:
-            response = self.session.get(
-                request_url,
-                headers=self._get_headers(),
-                timeout=self.timeout,
-            )
+            response = self.session.get(request_url, headers=headers, timeout=self.timeout)
             response.raise_for_status()
-            response.encoding = "utf-8"
-            return response.text
+            return response
             
         except requests.exceptions.Timeout:
             console.print(f"[red]✗[/red] Timeout fetching {request_url}")
@@ -136,13 +275,15 @@ class HTTPClient:
             
         except requests.exceptions.HTTPError as e:
             console.print(f"[red]✗[/red] HTTP error {e.response.status_code} for {request_url}")
+            if e.response.status_code == 403:
+                self._rotate_user_agent()
             return None
             
         except requests.exceptions.RequestException as e:
             console.print(f"[red]✗[/red] Request failed for {request_url}: {e}")
             return None
     
-    def get_events_page(self) -> Optional[str]:
+    def get_events_page(self) -> Optional[bytes]:
         """Fetch the events list page.
         
         Returns:
@@ -154,7 +295,7 @@ class HTTPClient:
             console.print("[green]✓[/green] Events list fetched")
         return html
     
-    def get_event_detail(self, slug: str) -> Optional[str]:
+    def get_event_detail(self, slug: str) -> Optional[bytes]:
         """Fetch an individual event detail page.
         
         Args:
@@ -169,19 +310,71 @@ class HTTPClient:
             console.print(f"[green]✓[/green] Event fetched: {slug}")
         return html
     
-    def get_fighter_profile(self, profile_url: str) -> Optional[str]:
+    def get_fighter_profile(self, profile_url: str, if_modified: bool = False) -> Optional[bytes]:
         """Fetch a fighter's profile page.
         
         Args:
             profile_url: Full URL to fighter profile.
+            if_modified: Return NOT_MODIFIED for an unchanged cached page.
             
         Returns:
-            HTML content of profile page or None.
+            HTML content of profile page, NOT_MODIFIED, or None.
         """
-        html = self.get(profile_url, full_url=True)
+        html = self.get(profile_url, full_url=True, cached=True, if_modified=if_modified)
         return html
     
-    def get_rankings_page(self, organization: str = "aca") -> Optional[str]:
+    def get_fighter_profiles(
+        self,
+        profile_urls: List[str],
+        min_interval: float = 0.0,
+        workers: Optional[int] = None,
+        if_modified: bool = False,
+    ) -> Iterator[Optional[bytes]]:
+        """Fetch many profile pages concurrently.
+        
+        Pages are yielded in the order of profile_urls, so the caller can
+        parse and write them on its own thread while the next ones download.
+        At most PREFETCH_PAGES (or `workers`, if larger) are fetched ahead of
+        the caller. Closing the iterator early (e.g. on Ctrl+C) cancels the
+        fetches that haven't started.
+        
+        Args:
+            profile_urls: Full URLs to fighter profiles.
+            min_interval: Minimum seconds between request starts across all
+                threads, on top of the per-request rate limit.
+            workers: Number of threads (default FETCH_WORKERS, at most
+                POOL_MAXSIZE so every thread keeps its connection alive).
+            if_modified: Yield NOT_MODIFIED for unchanged cached pages.
+            
+        Yields:
+            HTML content of each profile page, NOT_MODIFIED, or None if it
+            failed.
+        """
+        throttle = Throttle(min_interval)
+        
+        def fetch(url: str) -> Optional[bytes]:
+            throttle.wait()
+            return self.get_fighter_profile(url, if_modified=if_modified)
+        
+        workers = min(workers or self.FETCH_WORKERS, self.POOL_MAXSIZE)
+        executor = ThreadPoolExecutor(max_workers=workers)
+        urls = iter(profile_urls)
+        try:
+            pending = deque(
+                executor.submit(fetch, url)
+                for url in islice(urls, max(self.PREFETCH_PAGES, workers))
+            )
+            while pending:
+                html = pending.popleft().result()
+                # Refill the window before handing the page over, so the
+                # workers stay busy while the caller parses it
+                for url in islice(urls, 1):
+                    pending.append(executor.submit(fetch, url))
+                yield html
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def get_rankings_page(self, organization: str = "aca") -> Optional[bytes]:
         """Fetch a rankings page for an organization.
         
         Args:
@@ -191,14 +384,16 @@ class HTTPClient:
             HTML content of rankings page or None.
         """
         console.print(f"[blue]→[/blue] Fetching {organization.upper()} rankings...")
-        html = self.get(f"/ru/ranking/{organization}/")
+        html = self.get(f"/ru/ranking/{organization}/", cached=True)
         if html:
             console.print(f"[green]✓[/green] Rankings fetched")
         return html
     
     def close(self) -> None:
-        """Close the session."""
+        """Close the session and the cache, if any."""
         self.session.close()
+        if self.cache is not None:
+            self.cache.close()
     
     def __enter__(self):
         """Context manager entry."""
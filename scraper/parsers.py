@@ -1,11 +1,15 @@
-"""BeautifulSoup parsers for gidstats.com pages."""
+"""HTML parsers (BeautifulSoup, and lxml for profile pages) for gidstats.com pages."""
 
 import re
 from datetime import date, datetime
-from typing import Optional, List, Tuple
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Optional, List, Tuple, Union
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+from bs4.builder import LXMLTreeBuilder
+from lxml import etree
 from rich.console import Console
 
 from .validators import EventData, FightData, FighterData
@@ -14,17 +18,174 @@ console = Console()
 
 BASE_URL = "https://gidstats.com"
 
+# Patterns shared by the event parsers, compiled once at import
+_DATE_RE = re.compile(r"(\d{2})\.(\d{2})\.(\d{2,4})")
+_TIME_MSK_RE = re.compile(r"(\d{1,2}:\d{2})\s*МСК")
+_ROUNDS_RE = re.compile(r"(\d)\s*x\s*\d")
+
+# Used by generate_fighter_profile_url
+_SLUG_INVALID_RE = re.compile(r'[^a-z0-9_]')
+
+# String types get_text() collects for ordinary elements; script, style and
+# template contents and comments have their own subclasses and are skipped
+_TEXT_TYPES = (NavigableString, CData)
+
+
+def _make_soup(html: Union[str, bytes]) -> BeautifulSoup:
+    """Parse HTML into a BeautifulSoup tree with the lxml builder.
+    
+    Args:
+        html: HTML content to parse; raw response bytes are decoded as
+            UTF-8 by the parser itself.
+        
+    Returns:
+        Parsed BeautifulSoup tree.
+    """
+    # gidstats.com serves UTF-8; naming it skips encoding detection
+    options = {"from_encoding": "utf-8"} if isinstance(html, bytes) else {}
+    # lxml is imported above, so its builder is always there; passing the
+    # class skips the feature lookup. bs4 makes its own lxml parser for
+    # every page, so unlike _LXML_PARSER there is nothing to share
+    return BeautifulSoup(html, builder=LXMLTreeBuilder, **options)
+
+
+def _element_texts(root: Tag) -> Dict[int, str]:
+    """Get the text of every element under root in one pass.
+    
+    Gives the same text as each element's get_text(), but builds it
+    bottom-up, so nested elements are walked once instead of once per
+    enclosing element.
+    
+    Args:
+        root: Element (or soup) to walk.
+        
+    Returns:
+        Mapping of id() of root and each descendant Tag to its text.
+    """
+    texts: Dict[int, str] = {}
+    # Post-order walk with an explicit stack; each entry is an element, its
+    # remaining children and the text collected so far
+    stack = [(root, iter(root.contents), [])]
+    while stack:
+        tag, children, parts = stack[-1]
+        for child in children:
+            if isinstance(child, Tag):
+                stack.append((child, iter(child.contents), []))
+                break
+            if type(child) in _TEXT_TYPES:
+                parts.append(child)
+        else:
+            stack.pop()
+            text = texts[id(tag)] = "".join(parts)
+            if stack:
+                stack[-1][2].append(text)
+    return texts
+
+
+# Decodes raw response bytes as UTF-8, like _make_soup. Nothing is looked
+# up by id, so the parser doesn't index id attributes while building. A
+# plain etree parser: lxml.html's element classes are picked by a Python
+# callback for every element the parsers touch
+_LXML_PARSER = etree.HTMLParser(encoding="utf-8", collect_ids=False)
+
+# Text of an element and everything in it, as lxml.html's text_content()
+_text_content = etree.XPath("string()")
+
+# Elements whose text BeautifulSoup's get_text() leaves out
+_DROPPED_TAGS = ("script", "style", "template")
+
+
+def _make_tree(html: Union[str, bytes]) -> etree._Element:
+    """Parse HTML straight into an lxml tree, without a BeautifulSoup layer.
+    
+    script, style and template elements are emptied so _text_content()
+    and itertext() give the same text as BeautifulSoup's get_text().
+    
+    Args:
+        html: HTML content to parse.
+        
+    Returns:
+        Root <html> element (empty for an empty document).
+    """
+    tree = etree.fromstring(html, parser=_LXML_PARSER)
+    if tree is None:
+        # Nothing but whitespace
+        return etree.Element("html")
+    # Emptied rather than removed: removing one joins the text before it
+    # and its tail into one piece, which get_text(strip=True) keeps apart
+    for element in list(tree.iter(*_DROPPED_TAGS)):
+        element.clear(keep_tail=True)
+    return tree
+
+
+def _stripped_text(element: etree._Element) -> str:
+    """Get an lxml element's text like BeautifulSoup's get_text(strip=True).
+    
+    Args:
+        element: Element from a _make_tree() tree.
+        
+    Returns:
+        Each text piece stripped and joined without separators.
+    """
+    return "".join(text.strip() for text in element.itertext())
+
 
 class EventListParser:
     """Parser for the events list page (/ru/events)."""
     
-    def __init__(self, html: str):
+    # Links like /ru/events/aca-197/ or /ru/events/pfl_mena_4-2579/
+    EVENT_HREF_RE = re.compile(r"/ru/events/([a-z0-9_-]+)/?$")
+    
+    # Organization + event number in one pass; alternatives sharing a prefix
+    # are folded, longest first (e.g. "UFC Vegas 110" before "UFC 110")
+    ORG_EVENT_RE = re.compile(
+        r'((?:UFC(?:\s+Vegas)?|ACA(?:\s+Young\s+Eagles)?|PFL(?:\s+(?:MENA|Europe|Africa))?'
+        r'|KSW|OKTAGON|Cage\s+Warriors|Bellator|BRAVE\s+CF|UAE\s+Warriors|Ares\s+FC'
+        r'|MMA\s+Series|Open\s+FC|LFA)\s+\d+)',
+        re.IGNORECASE,
+    )
+    # Generic PFL events carry no number
+    PFL_RE = re.compile(r'(PFL)', re.IGNORECASE)
+    TRAILING_YEAR_RE = re.compile(r'\s*\d{4,}$')
+    # Date and time leading the link text ("05.12.202517:00 МСК..."); a
+    # four-digit year is tried first so "06.12.2519:00" reads as 2025
+    LINK_DATETIME_RE = re.compile(r'(\d{2})\.(\d{2})\.(\d{4}|\d{2})\s*(\d{1,2}:\d{2})')
+    TIME_RE = re.compile(r"(\d{1,2}:\d{2})\s*(?:МСК)?")
+    
+    # Location at the end of the link text, most specific first. Kept as
+    # separate patterns: a rejected match falls through to the next one,
+    # and one fused alternation measured slower on real link texts
+    LOCATION_PATTERNS = tuple(re.compile(pattern) for pattern in (
+        # City, State/Region, Country (e.g., "Grozny, Chechnya, Russia")
+        r'([A-Za-zÀ-ž][A-Za-zÀ-ž\s]+,\s*[A-Za-zÀ-ž][A-Za-zÀ-ž\s]+,\s*[A-Za-zÀ-ž][A-Za-zÀ-ž\s]+)\.?\s*$',
+        # City, Country (Latin with accents, e.g., "Moscow, Russia", "Łódź, Poland")
+        r'([A-Za-zÀ-ž][A-Za-zÀ-ž\s]+,\s*[A-Za-zÀ-ž][A-Za-zÀ-ž\s]+)\.?\s*$',
+        # City, Country (Cyrillic)
+        r'([А-Я][а-яА-Я\s]+,\s*[А-Я][а-яА-Я\s]+)\.?\s*$',
+        # Handle "UFC APEX, Las Vegas, USA" type
+        r'([A-Z][A-Za-z\s]+,\s*[A-Z][a-zA-Z\s]+,\s*[A-Z][A-Za-z]+)\.?\s*$',
+        # Just country name at end (e.g., "Benin.")
+        r'([A-Za-zÀ-ž]{4,})\.?\s*$',
+    ))
+    TRAILING_ORG_RE = re.compile(
+        r'\s+(?:UFC|ACA|PFL|KSW|OKTAGON|Bellator|BRAVE|UAE\s+Warriors|Ares|MMA\s+Series|Young\s+Eagles).*$',
+        re.IGNORECASE,
+    )
+    # Organization names that can be left over as a "location"
+    LOCATION_SKIP_WORDS = frozenset((
+        'ufc', 'aca', 'pfl', 'ksw', 'oktagon', 'bellator', 'brave', 'ares',
+        'series', 'eagles', 'mena', 'africa', 'europe',
+    ))
+    
+    def __init__(self, html: Union[str, bytes]):
         """Initialize parser with HTML content.
         
         Args:
             html: HTML content of the events list page.
         """
-        self.soup = BeautifulSoup(html, "lxml")
+        # Only links and their ancestors' text are read, so skip the
+        # BeautifulSoup layer
+        self.tree = _make_tree(html)
     
     def parse_upcoming_events(self) -> List[EventData]:
         """Parse upcoming events from the page.
@@ -36,17 +197,22 @@ class EventListParser:
         
         # Find all links to individual events
         # Pattern matches URLs like /ru/events/aca-197/ or /ru/events/pfl_mena_4-2579/
-        event_links = self.soup.find_all("a", href=re.compile(r"/ru/events/[a-z0-9_-]+/?$"))
+        event_links = self.tree.iter("a")
         
         seen_slugs = set()
         
+        # Date and time found in each ancestor searched so far, by element
+        # (lxml reuses ids of elements no longer referenced); sibling links
+        # share most of their ancestors
+        parent_datetimes = {}
+        
         for link in event_links:
             href = link.get("href", "")
             if not href:
                 continue
                 
             # Extract slug from URL (handles both aca-197 and pfl_mena_4-2579 formats)
-            slug_match = re.search(r"/ru/events/([a-z0-9_-]+)/?$", href)
+            slug_match = self.EVENT_HREF_RE.search(href)
             if not slug_match:
                 continue
                 
@@ -58,13 +224,18 @@ class EventListParser:
             seen_slugs.add(slug)
             
             # Get event name from link text or parent
-            name = self._extract_event_name(link, slug)
+            link_text = _stripped_text(link)
+            name = self._extract_event_name(link_text, slug)
             if not name:
                 continue
             
-            # Try to find date and location near this link
-            event_date, time_msk = self._find_event_datetime(link)
-            location = self._find_event_location(link)
+            # Date and time usually lead the link text; otherwise look
+            # around the link
+            event_date, time_msk = (
+                self._parse_link_datetime(link_text)
+                or self._find_event_datetime(link, parent_datetimes)
+            )
+            location = self._find_event_location(link_text)
             
             # Extract organization from name
             organization = EventData.extract_organization(name)
@@ -84,67 +255,68 @@ class EventListParser:
             except Exception as e:
                 console.print(f"[yellow]⚠[/yellow] Failed to parse event {slug}: {e}")
         
-        # Deduplicate by slug
-        unique_events = {}
-        for event in events:
-            if event.slug not in unique_events:
-                unique_events[event.slug] = event
-        
-        return list(unique_events.values())
+        # seen_slugs already keeps one event per slug
+        return events
     
-    def _extract_event_name(self, link: Tag, slug: str) -> Optional[str]:
+    def _extract_event_name(self, text: str, slug: str) -> Optional[str]:
         """Extract event name from link or surrounding context.
         
         Link text format: "05.12.202517:00 МСКACA 197Moscow, Russia"
         We need to extract just "ACA 197"
         
         Args:
-            link: BeautifulSoup Tag for the link.
+            text: Link text, stripped.
             slug: Event slug.
             
         Returns:
             Event name or None.
         """
-        text = link.get_text(strip=True)
-        
         # Extract organization + event name/number pattern
         # This is the most reliable pattern
-        org_patterns = [
-            r'(UFC\s+(?:Vegas\s+)?\d+)',
-            r'(UFC\s+\d+)',
-            r'(ACA\s+Young\s+Eagles\s+\d+)',
-            r'(ACA\s+\d+)',
-            r'(PFL\s+(?:MENA|Europe|Africa)\s+\d+)',
-            r'(PFL\s+\d+)',
-            r'(PFL)',  # Just PFL for generic PFL events
-            r'(KSW\s+\d+)',
-            r'(OKTAGON\s+\d+)',
-            r'(Cage\s+Warriors\s+\d+)',
-            r'(Bellator\s+\d+)',
-            r'(BRAVE\s+CF\s+\d+)',
-            r'(UAE\s+Warriors\s+\d+)',
-            r'(Ares\s+FC\s+\d+)',
-            r'(MMA\s+Series\s+\d+)',
-            r'(Open\s+FC\s+\d+)',
-            r'(LFA\s+\d+)',
-        ]
-        
-        for pattern in org_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
+        match = self.ORG_EVENT_RE.search(text) or self.PFL_RE.search(text)
+        if match:
+            return match.group(1).strip()
         
         # Fallback: convert slug to name
         name = slug.replace("-", " ").replace("_", " ").title()
         # Clean up slug-based name
-        name = re.sub(r'\s*\d{4,}$', '', name)  # Remove trailing year-like numbers
+        name = self.TRAILING_YEAR_RE.sub('', name)  # Remove trailing year-like numbers
         return name
     
-    def _find_event_datetime(self, link: Tag) -> Tuple[Optional[date], Optional[str]]:
+    def _parse_link_datetime(self, text: str) -> Optional[Tuple[date, str]]:
+        """Read the date and time at the start of an event link's text.
+        
+        Args:
+            text: Link text, stripped.
+            
+        Returns:
+            Tuple of (date, time_msk), or None if the text doesn't start
+            with a valid date and time.
+        """
+        match = self.LINK_DATETIME_RE.match(text)
+        if not match:
+            return None
+        day, month, year, time_msk = match.groups()
+        year = int(year)
+        if year < 100:
+            year += 2000
+        try:
+            return date(year, int(month), int(day)), time_msk
+        except ValueError:
+            return None
+    
+    def _find_event_datetime(
+        self,
+        link: etree._Element,
+        parent_datetimes: Dict[etree._Element, Tuple[Optional[date], Optional[str]]],
+    ) -> Tuple[Optional[date], Optional[str]]:
         """Find event date and time near a link.
         
         Args:
-            link: BeautifulSoup Tag for the link.
+            link: Link element.
+            parent_datetimes: Date and time found in ancestors already
+                searched on this page, by element; filled in as new ones
+                are searched.
             
         Returns:
             Tuple of (date, time_msk).
@@ -152,75 +324,78 @@ class EventListParser:
         event_date = None
         time_msk = None
         
-        # Search in parent elements for date pattern
-        parent = link.parent
-        for _ in range(5):
-            if parent:
-                text = parent.get_text()
-                
-                # Look for date pattern DD.MM.YYYY or DD.MM.YY
-                date_match = re.search(r"(\d{2})\.(\d{2})\.(\d{2,4})", text)
-                if date_match:
-                    day = int(date_match.group(1))
-                    month = int(date_match.group(2))
-                    year = int(date_match.group(3))
-                    if year < 100:
-                        year += 2000
-                    try:
-                        event_date = date(year, month, day)
-                    except ValueError:
-                        pass
-                
-                # Look for time pattern HH:MM
-                time_match = re.search(r"(\d{1,2}:\d{2})\s*(?:МСК)?", text)
-                if time_match:
-                    time_msk = time_match.group(1)
-                
-                if event_date and time_msk:
-                    break
-                    
-                parent = parent.parent
+        # Search in parent elements, nearest first; a farther one fills in
+        # whatever the nearer ones lack
+        for parent in islice(link.iterancestors(), 5):
+            found = parent_datetimes.get(parent)
+            if found is None:
+                found = parent_datetimes[parent] = self._search_datetime(_text_content(parent))
+            parent_date, parent_time = found
+            
+            if parent_date:
+                event_date = parent_date
+            if parent_time:
+                time_msk = parent_time
+            
+            if event_date and time_msk:
+                break
+        
+        return event_date, time_msk
+    
+    def _search_datetime(self, text: str) -> Tuple[Optional[date], Optional[str]]:
+        """Find the first date and time in an element's text.
+        
+        Args:
+            text: Element text.
+            
+        Returns:
+            Tuple of (date, time_msk); date is None if the first date
+            found isn't a valid one.
+        """
+        event_date = None
+        time_msk = None
+        
+        # Look for date pattern DD.MM.YYYY or DD.MM.YY
+        date_match = _DATE_RE.search(text)
+        if date_match:
+            day = int(date_match.group(1))
+            month = int(date_match.group(2))
+            year = int(date_match.group(3))
+            if year < 100:
+                year += 2000
+            try:
+                event_date = date(year, month, day)
+            except ValueError:
+                pass
+        
+        # Look for time pattern HH:MM
+        time_match = self.TIME_RE.search(text)
+        if time_match:
+            time_msk = time_match.group(1)
         
         return event_date, time_msk
     
-    def _find_event_location(self, link: Tag) -> Optional[str]:
+    def _find_event_location(self, text: str) -> Optional[str]:
         """Find event location from link text.
         
         Link text format: "05.12.202517:00 МСКACA 197Moscow, Russia"
         
         Args:
-            link: BeautifulSoup Tag for the link.
+            text: Link text, stripped.
             
         Returns:
             Location string or None.
         """
-        text = link.get_text(strip=True)
-        
         # Location is at the end of the link text after event name
         # Pattern: anything ending with City, Country or City, State, Country
-        loc_patterns = [
-            # City, State/Region, Country (e.g., "Grozny, Chechnya, Russia")
-            r'([A-Za-zÀ-ž][A-Za-zÀ-ž\s]+,\s*[A-Za-zÀ-ž][A-Za-zÀ-ž\s]+,\s*[A-Za-zÀ-ž][A-Za-zÀ-ž\s]+)\.?\s*$',
-            # City, Country (Latin with accents, e.g., "Moscow, Russia", "Łódź, Poland")
-            r'([A-Za-zÀ-ž][A-Za-zÀ-ž\s]+,\s*[A-Za-zÀ-ž][A-Za-zÀ-ž\s]+)\.?\s*$',
-            # City, Country (Cyrillic)
-            r'([А-Я][а-яА-Я\s]+,\s*[А-Я][а-яА-Я\s]+)\.?\s*$',
-            # Handle "UFC APEX, Las Vegas, USA" type
-            r'([A-Z][A-Za-z\s]+,\s*[A-Z][a-zA-Z\s]+,\s*[A-Z][A-Za-z]+)\.?\s*$',
-            # Just country name at end (e.g., "Benin.")
-            r'([A-Za-zÀ-ž]{4,})\.?\s*$',
-        ]
-        
-        for pattern in loc_patterns:
-            loc_match = re.search(pattern, text)
+        for pattern in self.LOCATION_PATTERNS:
+            loc_match = pattern.search(text)
             if loc_match:
-                location = loc_match.group(1).strip().rstrip('.')
-                # Remove trailing organization names
-                location = re.sub(r'\s+(?:UFC|ACA|PFL|KSW|OKTAGON|Bellator|BRAVE|UAE\s+Warriors|Ares|MMA\s+Series|Young\s+Eagles).*$', '', location, flags=re.IGNORECASE)
-                location = location.strip()
+                # Remove trailing organization names; the group can't hold a
+                # dot, but may end in line breaks the pattern's $ won't skip
+                location = self.TRAILING_ORG_RE.sub('', loc_match.group(1).strip()).strip()
                 # Filter out pure organization names
-                skip_words = ['ufc', 'aca', 'pfl', 'ksw', 'oktagon', 'bellator', 'brave', 'ares', 'series', 'eagles', 'mena', 'africa', 'europe']
-                if location.lower() in skip_words:
+                if location.lower() in self.LOCATION_SKIP_WORDS:
                     continue
                 # Accept if it's a location pattern
                 if len(location) > 3:
@@ -233,15 +408,62 @@ class EventListParser:
 class EventDetailParser:
     """Parser for individual event pages (/ru/events/{slug}/)."""
     
-    def __init__(self, html: str, event_slug: str):
+    TITLE_SUFFIX_RE = re.compile(r"\s*[-|]\s*GID\s*Stats.*$", re.IGNORECASE)
+    
+    # Location in the page header, most specific first
+    LOCATION_PATTERNS = tuple(re.compile(pattern, re.MULTILINE) for pattern in (
+        # After date and time МСК: City, Country (Latin)
+        r"\d{2}\.\d{2}\.\d{2,4}\s*\d{1,2}:\d{2}\s*МСК\s*([A-Za-z][A-Za-z\s]+,\s*[A-Za-z][A-Za-z\s]+)",
+        # After date and time МСК: City, Country (Cyrillic)
+        r"\d{2}\.\d{2}\.\d{2,4}\s*\d{1,2}:\d{2}\s*МСК\s*([А-Яа-я][А-Яа-я\s]+,\s*[А-Яа-я][А-Яа-я\s]+)",
+        # City, Country near beginning of text (Latin)
+        r"^[^,]{0,200}([A-Z][a-zA-Z\s]{2,20},\s*[A-Z][a-zA-Z\s]{2,20})",
+    ))
+    
+    # Card section headers
+    # Card section headers, one alternation per card type so the document's
+    # text nodes are scanned once
+    SECTION_PATTERNS = {
+        "main": re.compile(r"основной кард|main card|основной", re.IGNORECASE),
+        "prelim": re.compile(r"прелимы|prelims|preliminary|прелиминари", re.IGNORECASE),
+    }
+    
+    # Fighter records (W-L-D) and the names in front of them: searched up
+    # to a record's start, the run of letters and spaces ending there, from
+    # its first letter
+    RECORD_RE = re.compile(r'(\d+)\s*[-–]\s*(\d+)\s*[-–]\s*(\d+)')
+    NAME_BEFORE_RE = re.compile(r'(?<![A-Za-zА-Яа-яЁё\s])\s*([A-Za-zА-Яа-яЁё][A-Za-zА-Яа-яЁё\s]*)\Z')
+    
+    # Name Record VS Name Record, Latin or Cyrillic names, matched a piece at
+    # a time by _match_fight: one side is a name then its W-L-D record
+    FIGHTER_RECORD_RE = re.compile(r"([A-Za-zА-Яа-яЁё\s]+?)\s*(\d+\s*[-–]\s*\d+\s*[-–]\s*\d+)")
+    # The same, starting only where a run of name characters starts, so a
+    # run with no record after it is scanned once, not from each position
+    FIGHTER_RECORD_START_RE = re.compile(r"(?<![A-Za-zА-Яа-яЁё\s])" + FIGHTER_RECORD_RE.pattern)
+    VS_WORD_RE = re.compile("VS|vs|против")
+    
+    # "VS" in any case, checked as plain substrings: faster than upper-casing
+    # each item's text or a case-insensitive regex
+    VS_SPELLINGS = ("VS", "vs", "Vs", "vS")
+    
+    def __init__(self, html: Union[str, bytes], event_slug: str):
         """Initialize parser with HTML content.
         
         Args:
             html: HTML content of the event detail page.
             event_slug: Slug of the event being parsed.
         """
-        self.soup = BeautifulSoup(html, "lxml")
+        self.soup = _make_soup(html)
         self.event_slug = event_slug
+        # Date, time and location are all read from the page text
+        self._text: Optional[str] = None
+    
+    @property
+    def text(self) -> str:
+        """Full page text, extracted once per parser."""
+        if self._text is None:
+            self._text = self.soup.get_text()
+        return self._text
     
     def parse_event_details(self) -> Optional[EventData]:
         """Parse full event details including fight card.
@@ -301,7 +523,7 @@ class EventDetailParser:
         if title:
             title_text = title.get_text(strip=True)
             # Remove site name suffix
-            name = re.sub(r"\s*[-|]\s*GID\s*Stats.*$", "", title_text, flags=re.IGNORECASE)
+            name = self.TITLE_SUFFIX_RE.sub("", title_text)
             if name:
                 return name
         
@@ -317,10 +539,10 @@ class EventDetailParser:
         time_msk = None
         
         # Look for date/time in the page
-        text = self.soup.get_text()
+        text = self.text
         
         # Pattern: DD.MM.YY or DD.MM.YYYY
-        date_match = re.search(r"(\d{2})\.(\d{2})\.(\d{2,4})", text)
+        date_match = _DATE_RE.search(text)
         if date_match:
             try:
                 day = int(date_match.group(1))
@@ -333,7 +555,7 @@ class EventDetailParser:
                 pass
         
         # Pattern: HH:MM МСК
-        time_match = re.search(r"(\d{1,2}:\d{2})\s*МСК", text)
+        time_match = _TIME_MSK_RE.search(text)
         if time_match:
             time_msk = time_match.group(1)
         
@@ -347,20 +569,11 @@ class EventDetailParser:
         """
         # Look for location in page header area (first 2000 chars)
         # The location is typically near the event name and date
-        text = self.soup.get_text()[:2000]
+        text = self.text[:2000]
         
         # Patterns to match location after date/time
-        patterns = [
-            # After date and time МСК: City, Country (Latin)
-            r"\d{2}\.\d{2}\.\d{2,4}\s*\d{1,2}:\d{2}\s*МСК\s*([A-Za-z][A-Za-z\s]+,\s*[A-Za-z][A-Za-z\s]+)",
-            # After date and time МСК: City, Country (Cyrillic)
-            r"\d{2}\.\d{2}\.\d{2,4}\s*\d{1,2}:\d{2}\s*МСК\s*([А-Яа-я][А-Яа-я\s]+,\s*[А-Яа-я][А-Яа-я\s]+)",
-            # City, Country near beginning of text (Latin)
-            r"^[^,]{0,200}([A-Z][a-zA-Z\s]{2,20},\s*[A-Z][a-zA-Z\s]{2,20})",
-        ]
-        
-        for pattern in patterns:
-            loc_match = re.search(pattern, text, re.MULTILINE)
+        for pattern in self.LOCATION_PATTERNS:
+            loc_match = pattern.search(text)
             if loc_match:
                 location = loc_match.group(1).strip().rstrip('.')
                 if len(location) > 5 and "," in location:
@@ -407,23 +620,21 @@ class EventDetailParser:
         """
         fights = []
         
-        # Look for section headers
-        section_keywords = {
-            "main": ["основной кард", "main card", "основной"],
-            "prelim": ["прелимы", "prelims", "preliminary", "прелиминари"],
-        }
-        
-        keywords = section_keywords.get(card_type, [])
+        # Find section by its header keywords
+        pattern = self.SECTION_PATTERNS.get(card_type)
+        if pattern is None:
+            return fights
         
-        # Find section by keyword
-        for keyword in keywords:
-            elements = self.soup.find_all(string=re.compile(keyword, re.IGNORECASE))
-            for element in elements:
-                # Get parent container
-                container = element.find_parent(["div", "section", "ul"])
-                if container:
-                    section_fights = self._extract_fights_from_container(container, card_type)
-                    fights.extend(section_fights)
+        # Containers already parsed, by id(); several headers (e.g.
+        # "Основной кард" and a nested "основной") can share one
+        seen = set()
+        for element in self.soup.find_all(string=pattern):
+            # Get parent container
+            container = element.find_parent(["div", "section", "ul"])
+            if container and id(container) not in seen:
+                seen.add(id(container))
+                section_fights = self._extract_fights_from_container(container, card_type)
+                fights.extend(section_fights)
         
         return fights
     
@@ -441,12 +652,13 @@ class EventDetailParser:
         
         # Look for list items or divs with fight info
         items = container.find_all(["li", "div", "tr"])
+        texts = _element_texts(container)
         
         for item in items:
-            text = item.get_text()
+            text = texts[id(item)]
             
             # Look for VS pattern
-            if "VS" in text.upper() or " - " in text:
+            if any(vs in text for vs in self.VS_SPELLINGS) or " - " in text:
                 fight = self._parse_fight_from_text(text, card_type)
                 if fight:
                     fights.append(fight)
@@ -460,32 +672,48 @@ class EventDetailParser:
             List of FightData objects.
         """
         fights = []
+        # Fighter pairs already added; nested items repeat the same fight
+        seen = set()
         
         # Find containers that have exactly 2 fighter records
         # This is the structure used by gidstats.com
         items = self.soup.find_all(['li', 'div', 'tr'])
+        # Items nest, so build all their texts in one pass
+        texts = _element_texts(self.soup)
         
         for item in items:
-            text = item.get_text()
+            text = texts[id(item)]
+            
+            # Two W-L-D records take at least four dashes; counting them in
+            # C rules out most items before the regex scans them
+            if text.count("-") + text.count("–") < 4:
+                continue
             
             # Find all records in this container (W-L-D pattern)
-            records = re.findall(r'(\d+)\s*[-–]\s*(\d+)\s*[-–]\s*(\d+)', text)
+            records = list(self.RECORD_RE.finditer(text))
             
             # A fight container should have exactly 2 records
             if len(records) != 2:
                 continue
             
-            # Extract fighter names - they appear before records
+            # Extract fighter names - they appear right before records
             # Pattern: Name followed by W - L - D
-            name_pattern = r'([A-Za-zА-Яа-яЁё][A-Za-zА-Яа-яЁё\s]+?)\s*\d+\s*[-–]\s*\d+\s*[-–]\s*\d+'
-            names = re.findall(name_pattern, text)
+            names = []
+            start = 0
+            for record in records:
+                name = self.NAME_BEFORE_RE.search(text, start, record.start())
+                # Names run at least 2 characters up to the record
+                if not name or record.start() - name.start(1) < 2:
+                    break
+                names.append(name.group(1))
+                start = record.end()
             
             if len(names) < 2:
                 continue
             
             # Clean up names
-            fighter1_name = " ".join(names[0].split()).strip()
-            fighter2_name = " ".join(names[1].split()).strip()
+            fighter1_name = " ".join(names[0].split())
+            fighter2_name = " ".join(names[1].split())
             
             # Skip invalid names
             if len(fighter1_name) < 3 or len(fighter2_name) < 3:
@@ -498,27 +726,36 @@ class EventDetailParser:
             if any(w in fighter2_name.lower() for w in skip_words):
                 continue
             
+            # Skip duplicates before building anything; keyed on the names
+            # as FighterData will store them (without a "кг" prefix)
+            key = tuple(
+                name[3:] if name.startswith('кг ') else name
+                for name in (fighter1_name, fighter2_name)
+            )
+            if key in seen:
+                continue
+            
             try:
                 fighter1 = FighterData(
                     name=fighter1_name,
-                    wins=int(records[0][0]),
-                    losses=int(records[0][1]),
-                    draws=int(records[0][2]),
+                    wins=int(records[0].group(1)),
+                    losses=int(records[0].group(2)),
+                    draws=int(records[0].group(3)),
                 )
                 
                 fighter2 = FighterData(
                     name=fighter2_name,
-                    wins=int(records[1][0]),
-                    losses=int(records[1][1]),
-                    draws=int(records[1][2]),
+                    wins=int(records[1].group(1)),
+                    losses=int(records[1].group(2)),
+                    draws=int(records[1].group(3)),
                 )
                 
                 # Extract scheduled time if present
-                time_match = re.search(r'(\d{1,2}:\d{2})\s*МСК', text)
+                time_match = _TIME_MSK_RE.search(text)
                 scheduled_time = time_match.group(1) if time_match else None
                 
                 # Extract rounds if present (e.g., "5 x 5" or "3 x 5")
-                rounds_match = re.search(r'(\d)\s*x\s*\d', text)
+                rounds_match = _ROUNDS_RE.search(text)
                 rounds = int(rounds_match.group(1)) if rounds_match else None
                 
                 fight = FightData(
@@ -529,20 +766,53 @@ class EventDetailParser:
                     rounds=rounds,
                 )
                 fights.append(fight)
+                seen.add(key)
                 
             except (ValueError, IndexError) as e:
                 continue
         
-        # Remove duplicates (same fighters)
-        seen = set()
-        unique_fights = []
-        for fight in fights:
-            key = (fight.fighter1.name, fight.fighter2.name)
-            if key not in seen:
-                seen.add(key)
-                unique_fights.append(fight)
+        return fights
+    
+    def _match_fight(self, text: str) -> Optional[Tuple[re.Match, re.Match]]:
+        """Find the first "Name Record VS Name Record" in text.
         
-        return unique_fights
+        Finds the same fighters as one pattern with lazy gaps around "VS"
+        (the gaps don't cross a line break), in linear rather than
+        quadratic time on long text with no fight in it.
+        
+        Args:
+            text: Text to search.
+            
+        Returns:
+            Matches for the first and second fighter (name and record
+            groups), or None.
+        """
+        pos = 0
+        while True:
+            first = self.FIGHTER_RECORD_START_RE.search(text, pos)
+            if not first:
+                return None
+            pos = first.start() + 1
+            
+            # "VS" must be on the line the first record ends on
+            line_end = text.find("\n", first.end())
+            if line_end < 0:
+                line_end = len(text)
+            vs = self.VS_WORD_RE.search(text, first.end(), line_end)
+            if not vs:
+                continue
+            
+            # The second fighter may start right after "VS", even mid-word
+            second = (
+                self.FIGHTER_RECORD_RE.match(text, vs.end())
+                or self.FIGHTER_RECORD_START_RE.search(text, vs.end())
+            )
+            if not second:
+                # Nothing further on can match either
+                return None
+            if second.start() <= line_end:
+                return first, second
+            # Any later "VS" on this line leads to the same second fighter
     
     def _parse_fight_from_text(self, text: str, card_type: str) -> Optional[FightData]:
         """Parse a single fight from text.
@@ -555,18 +825,16 @@ class EventDetailParser:
             FightData or None.
         """
         # Pattern for: Name Record VS Name Record
-        # Handle both Latin and Cyrillic names
-        pattern = r"([A-Za-zА-Яа-яЁё\s]+?)\s*(\d+\s*[-–]\s*\d+\s*[-–]\s*\d+).*?(?:VS|vs|против).*?([A-Za-zА-Яа-яЁё\s]+?)\s*(\d+\s*[-–]\s*\d+\s*[-–]\s*\d+)"
-        
-        match = re.search(pattern, text)
+        match = self._match_fight(text)
         if not match:
             return None
+        first, second = match
         
         try:
-            fighter1_name = match.group(1).strip()
-            fighter1_record = match.group(2).replace(" ", "").replace("–", "-")
-            fighter2_name = match.group(3).strip()
-            fighter2_record = match.group(4).replace(" ", "").replace("–", "-")
+            fighter1_name = first.group(1).strip()
+            fighter1_record = first.group(2).replace(" ", "").replace("–", "-")
+            fighter2_name = second.group(1).strip()
+            fighter2_record = second.group(2).replace(" ", "").replace("–", "-")
             
             # Clean names
             fighter1_name = " ".join(fighter1_name.split())
@@ -579,11 +847,11 @@ class EventDetailParser:
             fighter2 = FighterData.from_record_string(fighter2_name, fighter2_record)
             
             # Try to extract scheduled time
-            time_match = re.search(r"(\d{1,2}:\d{2})\s*МСК", text)
+            time_match = _TIME_MSK_RE.search(text)
             scheduled_time = time_match.group(1) if time_match else None
             
             # Try to extract rounds
-            rounds_match = re.search(r"(\d)\s*x\s*\d", text)
+            rounds_match = _ROUNDS_RE.search(text)
             rounds = int(rounds_match.group(1)) if rounds_match else None
             
             return FightData(
@@ -601,15 +869,62 @@ class EventDetailParser:
 class FighterProfileParser:
     """Parser for individual fighter profile pages (/ru/fighters/{slug}.html)."""
     
-    def __init__(self, html: str, fighter_name: str):
+    # Patterns run over the page text, compiled once for every profile. Kept
+    # as separate searches: each starts with a literal that re scans for
+    # quickly, and one combined alternation was ~10x slower on pages
+    # missing a field
+    WINS_RE = re.compile(r'Победы\s*(\d+)')
+    LOSSES_RE = re.compile(r'Поражения\s*(\d+)')
+    DRAWS_RE = re.compile(r'Ничья\s*(\d+)')
+    AGE_RE = re.compile(r'Возраст\s*(\d+)')
+    HEIGHT_RE = re.compile(r'Рост\s*(\d+)\s*см')
+    # Either label; searched separately so each has a literal to scan for
+    # (an alternation up front has none and is ~9x slower when both are missing)
+    WEIGHT_RES = (
+        re.compile(r'Последний\s*вес\s*(\d+(?:\.\d+)?)\s*кг'),
+        re.compile(r'Вес\s*(\d+(?:\.\d+)?)\s*кг'),
+    )
+    REACH_RE = re.compile(r'Размах\s*рук\s*(\d+)\s*см')
+    STYLE_RE = re.compile(r'Стиль\s+([А-Яа-яA-Za-z\s]+?)(?:\n|Место|Представляет)')
+    COUNTRY_RE = re.compile(r'Представляет\s*страну\s*([А-Яа-яA-Za-z]+)')
+    KO_TKO_RE = re.compile(r'KO/TKO\s*(\d+)')
+    DECISION_RE = re.compile(r'РЕШ\s*(\d+)')
+    SUBMISSION_RE = re.compile(r'САБ\s*(\d+)')
+    # Loss methods: the first KO/TKO, РЕШ and САБ counts, in that order,
+    # after this heading
+    LOSSES_HEADING = 'Поражения'
+    LATIN_NAME_RE = re.compile(r'^[A-Za-z\s]+$')
+    RANKING_RE = re.compile(r'((?:ACA|UFC|PFL|Bellator)\s*#\d+\s*\w+)')
+    
+    # Fallback when the page has no "Представляет страну" line
+    COUNTRY_NAMES = (
+        'Россия', 'Russia', 'USA', 'Brazil', 'Бразилия', 
+        'Таджикистан', 'Узбекистан', 'Казахстан', 'Украина',
+        'Грузия', 'Армения', 'Азербайджан', 'Кыргызстан',
+        'Дагестан', 'Чечня'
+    )
+    # Any of them, found in one pass over the text
+    COUNTRY_NAME_RE = re.compile('|'.join(map(re.escape, COUNTRY_NAMES)))
+    
+    def __init__(self, html: Union[str, bytes], fighter_name: str):
         """Initialize parser with HTML content.
         
         Args:
             html: HTML content of the fighter profile page.
             fighter_name: Name of the fighter being parsed.
         """
-        self.soup = BeautifulSoup(html, "lxml")
+        # Only the page text and <h2> tags are read, so skip BeautifulSoup
+        self.tree = _make_tree(html)
         self.fighter_name = fighter_name
+        # Profile pages are large; every stats regex runs over the same text
+        self._text: Optional[str] = None
+    
+    @property
+    def text(self) -> str:
+        """Full page text, extracted once per parser."""
+        if self._text is None:
+            self._text = _text_content(self.tree)
+        return self._text
     
     def parse_profile(self) -> Optional[FighterData]:
         """Parse fighter profile data.
@@ -664,62 +979,66 @@ class FighterProfileParser:
         """
         stats = {}
         
-        text = self.soup.get_text()
+        text = self.text
         
         # Parse wins/losses/draws
-        wins_match = re.search(r'Победы\s*(\d+)', text)
+        wins_match = self.WINS_RE.search(text)
         if wins_match:
             stats['wins'] = int(wins_match.group(1))
         
-        losses_match = re.search(r'Поражения\s*(\d+)', text)
+        losses_match = self.LOSSES_RE.search(text)
         if losses_match:
             stats['losses'] = int(losses_match.group(1))
         
-        draws_match = re.search(r'Ничья\s*(\d+)', text)
+        draws_match = self.DRAWS_RE.search(text)
         if draws_match:
             stats['draws'] = int(draws_match.group(1))
         
         # Parse age
-        age_match = re.search(r'Возраст\s*(\d+)', text)
+        age_match = self.AGE_RE.search(text)
         if age_match:
             stats['age'] = int(age_match.group(1))
         
         # Parse height (Рост) - format: "184 см"
-        height_match = re.search(r'Рост\s*(\d+)\s*см', text)
+        height_match = self.HEIGHT_RE.search(text)
         if height_match:
             stats['height_cm'] = int(height_match.group(1))
         
         # Parse weight (Последний вес) - format: "93 кг"
-        weight_match = re.search(r'(?:Последний\s*вес|Вес)\s*(\d+(?:\.\d+)?)\s*кг', text)
+        # The leftmost of the two labels, as one pattern would find
+        weight_match = min(
+            filter(None, (pattern.search(text) for pattern in self.WEIGHT_RES)),
+            key=lambda match: match.start(),
+            default=None,
+        )
         if weight_match:
             stats['weight_kg'] = float(weight_match.group(1))
         
         # Parse reach (Размах рук) - format: "184 см"
-        reach_match = re.search(r'Размах\s*рук\s*(\d+)\s*см', text)
+        reach_match = self.REACH_RE.search(text)
         if reach_match:
             stats['reach_cm'] = int(reach_match.group(1))
         
         # Parse style (Стиль)
-        style_match = re.search(r'Стиль\s+([А-Яа-яA-Za-z\s]+?)(?:\n|Место|Представляет)', text)
+        style_match = self.STYLE_RE.search(text)
         if style_match:
             stats['style'] = style_match.group(1).strip()
         
         # Parse country (Представляет страну)
-        country_match = re.search(r'Представляет\s*страну\s*([А-Яа-яA-Za-z]+)', text)
+        country_match = self.COUNTRY_RE.search(text)
         if country_match:
             stats['country'] = country_match.group(1).strip()
         else:
-            # Try alternate pattern - common country names
-            country_patterns = [
-                'Россия', 'Russia', 'USA', 'Brazil', 'Бразилия', 
-                'Таджикистан', 'Узбекистан', 'Казахстан', 'Украина',
-                'Грузия', 'Армения', 'Азербайджан', 'Кыргызстан',
-                'Дагестан', 'Чечня'
-            ]
-            for country in country_patterns:
-                if country in text:
-                    stats['country'] = country
-                    break
+            # Try alternate pattern - common country names. One scan rules
+            # them all out; on a hit, a name earlier in COUNTRY_NAMES found
+            # anywhere in the text still wins over the leftmost one
+            country_match = self.COUNTRY_NAME_RE.search(text)
+            if country_match:
+                country = country_match.group()
+                rank = self.COUNTRY_NAMES.index(country)
+                stats['country'] = next(
+                    (name for name in self.COUNTRY_NAMES[:rank] if name in text), country
+                )
         
         return stats
     
@@ -731,22 +1050,22 @@ class FighterProfileParser:
         """
         methods = {'ko_tko': 0, 'submission': 0, 'decision': 0}
         
-        text = self.soup.get_text()
+        text = self.text
         
         # Find the wins section - pattern: "KO/TKO 6 (40%)"
         # Look for patterns after "Победы" heading
         
-        ko_match = re.search(r'KO/TKO\s*(\d+)', text)
+        ko_match = self.KO_TKO_RE.search(text)
         if ko_match:
             methods['ko_tko'] = int(ko_match.group(1))
         
         # РЕШ = Decision (Решение)
-        decision_match = re.search(r'РЕШ\s*(\d+)', text)
+        decision_match = self.DECISION_RE.search(text)
         if decision_match:
             methods['decision'] = int(decision_match.group(1))
         
         # САБ = Submission (Сабмишен)
-        sub_match = re.search(r'САБ\s*(\d+)', text)
+        sub_match = self.SUBMISSION_RE.search(text)
         if sub_match:
             methods['submission'] = int(sub_match.group(1))
         
@@ -760,15 +1079,23 @@ class FighterProfileParser:
         """
         methods = {'ko_tko': 0, 'submission': 0, 'decision': 0}
         
-        text = self.soup.get_text()
+        text = self.text
         
         # Look for the losses section
-        # Pattern after "Поражения" heading
-        losses_section = re.search(r'Поражения.*?KO/TKO\s*(\d+).*?РЕШ\s*(\d+).*?САБ\s*(\d+)', text, re.DOTALL)
-        if losses_section:
-            methods['ko_tko'] = int(losses_section.group(1))
-            methods['decision'] = int(losses_section.group(2))
-            methods['submission'] = int(losses_section.group(3))
+        # Pattern after "Поражения" heading. Each count is searched for from
+        # where the previous one ended; a single "Поражения.*?KO/TKO.*?..."
+        # regex backtracks over the rest of the page for every heading
+        # when the counts are missing
+        start = text.find(self.LOSSES_HEADING)
+        if start == -1:
+            return methods
+        ko_match = self.KO_TKO_RE.search(text, start + len(self.LOSSES_HEADING))
+        decision_match = ko_match and self.DECISION_RE.search(text, ko_match.end())
+        sub_match = decision_match and self.SUBMISSION_RE.search(text, decision_match.end())
+        if sub_match:
+            methods['ko_tko'] = int(ko_match.group(1))
+            methods['decision'] = int(decision_match.group(1))
+            methods['submission'] = int(sub_match.group(1))
         
         return methods
     
@@ -779,11 +1106,10 @@ class FighterProfileParser:
             English name or None.
         """
         # Look for h2 with English name
-        h2_tags = self.soup.find_all('h2')
-        for h2 in h2_tags:
-            text = h2.get_text(strip=True)
+        for h2 in self.tree.iter('h2'):
+            text = _stripped_text(h2)
             # Check if it's Latin characters (English name)
-            if text and re.match(r'^[A-Za-z\s]+$', text):
+            if text and self.LATIN_NAME_RE.match(text):
                 return text
         
         return None
@@ -794,10 +1120,10 @@ class FighterProfileParser:
         Returns:
             Ranking string or None.
         """
-        text = self.soup.get_text()
+        text = self.text
         
         # Pattern: "ACA #1 LHW" or similar
-        ranking_match = re.search(r'((?:ACA|UFC|PFL|Bellator)\s*#\d+\s*\w+)', text)
+        ranking_match = self.RANKING_RE.search(text)
         if ranking_match:
             return ranking_match.group(1)
         
@@ -807,14 +1133,33 @@ class FighterProfileParser:
 class RankingsParser:
     """Parser for rankings pages (/ru/ranking/{org}/)."""
     
-    def __init__(self, html: str, organization: str = "ACA"):
+    FIGHTER_PATH = '/ru/fighters/'
+    FIGHTER_HREF_RE = re.compile(r'/ru/fighters/[a-z0-9_]+\.html')
+    LEADING_RANK_RE = re.compile(r'^\d+\s*')
+    TRAILING_INFO_RE = re.compile(r'\s*(?:Чемпион|НР|\d+|\-\d+)$')
+    RANK_RE = re.compile(r'\b(\d+)\s+[А-Яа-я]')
+    
+    # Weight class names in Russian; the first one a heading contains wins
+    WEIGHT_CLASSES = {
+        'Тяжелый вес': 'Heavyweight',
+        'Полутяжелый вес': 'Light Heavyweight',
+        'Средний вес': 'Middleweight',
+        'Полусредний вес': 'Welterweight',
+        'Легкий вес': 'Lightweight',
+        'Полулегкий вес': 'Featherweight',
+        'Легчайший вес': 'Bantamweight',
+        'Наилегчайший вес': 'Flyweight',
+    }
+    
+    def __init__(self, html: Union[str, bytes], organization: str = "ACA"):
         """Initialize parser with HTML content.
         
         Args:
             html: HTML content of the rankings page.
             organization: Organization name.
         """
-        self.soup = BeautifulSoup(html, "lxml")
+        # Links, headings and parent text only; no BeautifulSoup layer
+        self.tree = _make_tree(html)
         self.organization = organization
     
     def parse_all_fighters(self) -> List[dict]:
@@ -823,107 +1168,124 @@ class RankingsParser:
         Returns:
             List of dicts with fighter info (name, rank, weight_class, profile_url).
         """
-        fighters = []
-        
-        # Find all fighter links on the page
-        # Links are in format /ru/fighters/{slug}.html
-        fighter_links = self.soup.find_all('a', href=re.compile(r'/ru/fighters/[a-z0-9_]+\.html'))
+        # Fighters by full profile URL; a fighter listed in several rankings
+        # (e.g. a division and pound-for-pound) is fetched once
+        fighters = {}
         
-        seen_urls = set()
+        # Weight class of the heading before each element, from one pass
+        weight_classes = self._index_weight_classes()
         
-        for link in fighter_links:
+        # Find all fighter links on the page
+        # Links are in format /ru/fighters/{slug}.html; a substring check
+        # skips the regex for the page's other links
+        for link in self.tree.iter('a'):
             href = link.get('href', '')
-            if not href or href in seen_urls:
+            if self.FIGHTER_PATH not in href or not self.FIGHTER_HREF_RE.search(href):
+                continue
+            
+            # Build full URL - relative and absolute links to one profile match
+            full_url = urljoin(BASE_URL, href)
+            
+            # Try to get rank
+            rank = self._get_rank_for_link(link)
+            
+            known = fighters.get(full_url)
+            if known:
+                # Keep the best (lowest) rank and the weight class it came with
+                if rank is not None and (known['rank'] is None or rank < known['rank']):
+                    known['rank'] = rank
+                    known['weight_class'] = self._get_weight_class_for_link(link, weight_classes) or known['weight_class']
                 continue
-            seen_urls.add(href)
             
             # Get fighter name from link text or nearby elements
-            name = link.get_text(strip=True)
+            name = _stripped_text(link)
             if not name or len(name) < 2:
                 # Try parent element
-                parent = link.parent
-                if parent:
-                    name = parent.get_text(strip=True)
+                parent = link.getparent()
+                if parent is not None:
+                    name = _stripped_text(parent)
             
             # Clean name - remove rank numbers and extra text
-            name = re.sub(r'^\d+\s*', '', name)  # Remove leading rank number
-            name = re.sub(r'\s*(?:Чемпион|НР|\d+|\-\d+)$', '', name)  # Remove trailing info
+            name = self.LEADING_RANK_RE.sub('', name)  # Remove leading rank number
+            name = self.TRAILING_INFO_RE.sub('', name)  # Remove trailing info
             name = ' '.join(name.split())  # Normalize whitespace
             
             if not name or len(name) < 3:
                 continue
             
-            # Build full URL
-            full_url = urljoin(BASE_URL, href)
-            
             # Try to determine weight class from context
-            weight_class = self._get_weight_class_for_link(link)
+            weight_class = self._get_weight_class_for_link(link, weight_classes)
             
-            # Try to get rank
-            rank = self._get_rank_for_link(link)
-            
-            fighters.append({
+            fighters[full_url] = {
                 'name': name,
                 'profile_url': full_url,
                 'weight_class': weight_class,
                 'rank': rank,
                 'organization': self.organization,
-            })
+            }
         
+        fighters = list(fighters.values())
         console.print(f"[green]✓[/green] Found {len(fighters)} ranked fighters")
         return fighters
     
-    def _get_weight_class_for_link(self, link: Tag) -> Optional[str]:
+    def _index_weight_classes(self) -> Dict[etree._Element, Optional[str]]:
+        """Map every element to the weight class named by the heading before it.
+        
+        One walk in document order, so each link's ancestors are looked up
+        instead of searching backwards from every one of them.
+        
+        Returns:
+            Weight class (or None) of the nearest preceding h2/h3/h4, by element.
+        """
+        index = {}
+        current = None
+        for element in self.tree.iter(tag=etree.Element):
+            index[element] = current
+            if element.tag in ('h3', 'h2', 'h4'):
+                text = _stripped_text(element)
+                current = next(
+                    (en_class for ru_class, en_class in self.WEIGHT_CLASSES.items() if ru_class in text),
+                    None,
+                )
+        return index
+    
+    def _get_weight_class_for_link(
+        self,
+        link: etree._Element,
+        weight_classes: Dict[etree._Element, Optional[str]],
+    ) -> Optional[str]:
         """Try to determine the weight class for a fighter link.
         
         Args:
-            link: BeautifulSoup Tag for the fighter link.
+            link: Fighter link element.
+            weight_classes: Index from _index_weight_classes().
             
         Returns:
             Weight class name or None.
         """
-        # Weight class names in Russian
-        weight_classes = {
-            'Тяжелый вес': 'Heavyweight',
-            'Полутяжелый вес': 'Light Heavyweight',
-            'Средний вес': 'Middleweight',
-            'Полусредний вес': 'Welterweight',
-            'Легкий вес': 'Lightweight',
-            'Полулегкий вес': 'Featherweight',
-            'Легчайший вес': 'Bantamweight',
-            'Наилегчайший вес': 'Flyweight',
-        }
-        
-        # Search up the DOM tree for weight class heading
-        parent = link.parent
-        for _ in range(10):
-            if parent:
-                # Look for h3 or heading with weight class
-                heading = parent.find_previous(['h3', 'h2', 'h4'])
-                if heading:
-                    text = heading.get_text(strip=True)
-                    for ru_class, en_class in weight_classes.items():
-                        if ru_class in text:
-                            return en_class
-                parent = parent.parent
+        # Search up the DOM tree for a weight class heading before an ancestor
+        for parent in islice(link.iterancestors(), 10):
+            weight_class = weight_classes.get(parent)
+            if weight_class:
+                return weight_class
         
         return None
     
-    def _get_rank_for_link(self, link: Tag) -> Optional[int]:
+    def _get_rank_for_link(self, link: etree._Element) -> Optional[int]:
         """Try to get the rank number for a fighter.
         
         Args:
-            link: BeautifulSoup Tag for the fighter link.
+            link: Fighter link element.
             
         Returns:
             Rank number or None.
         """
         # Look for rank in parent text
-        parent = link.parent
-        if parent:
-            text = parent.get_text()
+        parent = link.getparent()
+        if parent is not None:
+            text = _text_content(parent)
             # Pattern: number followed by name
-            rank_match = re.search(r'\b(\d+)\s+[А-Яа-я]', text)
+            rank_match = self.RANK_RE.search(text)
             if rank_match:
                 return int(rank_match.group(1))
             # Check for "Чемпион" (Champion)
@@ -933,28 +1295,33 @@ class RankingsParser:
         return None
 
 
+# Cyrillic to Latin transliteration used in profile URL slugs
+TRANSLIT_TABLE = str.maketrans({
+    'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'д': 'd', 'е': 'e', 'ё': 'e',
+    'ж': 'zh', 'з': 'z', 'и': 'i', 'й': 'y', 'к': 'k', 'л': 'l', 'м': 'm',
+    'н': 'n', 'о': 'o', 'п': 'p', 'р': 'r', 'с': 's', 'т': 't', 'у': 'u',
+    'ф': 'f', 'х': 'kh', 'ц': 'ts', 'ч': 'ch', 'ш': 'sh', 'щ': 'shch',
+    'ъ': '', 'ы': 'y', 'ь': '', 'э': 'e', 'ю': 'yu', 'я': 'ya',
+})
+
+
+@lru_cache(maxsize=8192)
 def generate_fighter_profile_url(fighter_name: str) -> str:
     """Generate the profile URL for a fighter.
     
+    Cached, since retries and re-scrapes ask for the same names again.
+    
     Args:
         fighter_name: Fighter name (can be Cyrillic or Latin).
         
     Returns:
         URL to fighter's profile page.
     """
-    # Transliterate Cyrillic to Latin for URL
-    translit_map = {
-        'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'д': 'd', 'е': 'e', 'ё': 'e',
-        'ж': 'zh', 'з': 'z', 'и': 'i', 'й': 'y', 'к': 'k', 'л': 'l', 'м': 'm',
-        'н': 'n', 'о': 'o', 'п': 'p', 'р': 'r', 'с': 's', 'т': 't', 'у': 'u',
-        'ф': 'f', 'х': 'kh', 'ц': 'ts', 'ч': 'ch', 'ш': 'sh', 'щ': 'shch',
-        'ъ': '', 'ы': 'y', 'ь': '', 'э': 'e', 'ю': 'yu', 'я': 'ya',
-    }
-    
     # Clean and normalize the name
     name = fighter_name.lower().strip()
-    # Remove "кг" prefix if present
-    name = re.sub(r'^кг\s+', '', name)
+    # Remove "кг" prefix if present; split() below drops the whitespace after it
+    if name.startswith('кг') and name[2:3].isspace():
+        name = name[2:]
     
     # Split into parts (first name, last name)
     parts = name.split()
@@ -967,18 +1334,11 @@ def generate_fighter_profile_url(fighter_name: str) -> str:
     # Join with underscore
     slug = '_'.join(parts)
     
-    # Transliterate
-    result = []
-    for char in slug:
-        if char in translit_map:
-            result.append(translit_map[char])
-        else:
-            result.append(char)
-    
-    slug = ''.join(result)
+    # Transliterate Cyrillic to Latin for URL
+    slug = slug.translate(TRANSLIT_TABLE)
     
     # Clean up any special characters
-    slug = re.sub(r'[^a-z0-9_]', '', slug)
+    slug = _SLUG_INVALID_RE.sub('', slug)
     
     return f"{BASE_URL}/ru/fighters/{slug}.html"
 
@@ -1,12 +1,55 @@
 """Pydantic models for data validation."""
 
 import re
-from datetime import date, datetime
+from datetime import date, datetime, timezone
 from typing import Optional, List
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 
+def utc_now() -> datetime:
+    """Get current UTC datetime (timezone-aware)."""
+    return datetime.now(timezone.utc)
+
+
+# Patterns used by the validators below, compiled once at import
+_RECORD_RE = re.compile(r"(\d+)-(\d+)(?:-(\d+))?")
+_TIME_RE = re.compile(r"(\d{1,2}:\d{2})")
+
+# Card type spellings and the card type each one means
+_CARD_TYPES = {
+    "main": "main",
+    "основной": "main",
+    "main card": "main",
+    "основной кард": "main",
+    "prelim": "prelim",
+    "prelims": "prelim",
+    "preliminary": "prelim",
+    "прелимы": "prelim",
+    "прелиминари": "prelim",
+}
+
+# Event name prefixes (upper case) and the organization each one means,
+# in match order
+_ORG_PREFIXES = (
+    ("UFC", "UFC"),
+    ("ACA", "ACA"),
+    ("PFL", "PFL"),
+    ("BELLATOR", "BELLATOR"),
+    ("KSW", "KSW"),
+    ("OKTAGON", "OKTAGON"),
+    ("CAGE WARRIORS", "CAGE WARRIORS"),
+    ("LFA", "LFA"),
+    ("BRAVE CF", "BRAVE CF"),
+    ("UAE WARRIORS", "UAE WARRIORS"),
+    ("ARES FC", "ARES FC"),
+    ("RIZIN", "RIZIN"),
+    ("ONE", "ONE"),
+    ("MMA SERIES", "MMA SERIES"),
+    ("OPEN FC", "OPEN FC"),
+)
+
+
 class FighterData(BaseModel):
     """Validated fighter data."""
     
@@ -47,9 +90,10 @@ class FighterData(BaseModel):
         """Clean and normalize fighter name."""
         # Remove extra whitespace
         v = " ".join(v.split())
-        # Remove weight class prefix (кг)
-        v = re.sub(r'^кг\s+', '', v)
-        return v.strip()
+        # Remove weight class prefix (кг); whitespace is single spaces by now
+        if v.startswith("кг "):
+            v = v[3:]
+        return v
     
     @field_validator("country")
     @classmethod
@@ -102,12 +146,17 @@ class FighterData(BaseModel):
         
         # Parse record string - handles '9-2-0', '9 - 2 - 0', '9-2', etc.
         record_str = record_str.replace(" ", "")
-        match = re.match(r"(\d+)-(\d+)(?:-(\d+))?", record_str)
+        parts = record_str.split("-")
         
-        if match:
-            wins = int(match.group(1))
-            losses = int(match.group(2))
-            draws = int(match.group(3)) if match.group(3) else 0
+        # Plain 'W-L-D' needs no regex; other shapes go through _RECORD_RE
+        if len(parts) == 3 and parts[0].isdecimal() and parts[1].isdecimal() and parts[2].isdecimal():
+            wins, losses, draws = int(parts[0]), int(parts[1]), int(parts[2])
+        else:
+            match = _RECORD_RE.match(record_str)
+            if match:
+                wins = int(match.group(1))
+                losses = int(match.group(2))
+                draws = int(match.group(3)) if match.group(3) else 0
         
         return cls(
             name=name,
@@ -135,11 +184,7 @@ class FightData(BaseModel):
     def validate_card_type(cls, v: str) -> str:
         """Validate and normalize card type."""
         v = v.lower().strip()
-        if v in ("main", "основной", "main card", "основной кард"):
-            return "main"
-        elif v in ("prelim", "prelims", "preliminary", "прелимы", "прелиминари"):
-            return "prelim"
-        return v
+        return _CARD_TYPES.get(v, v)
     
     @field_validator("scheduled_time")
     @classmethod
@@ -148,7 +193,7 @@ class FightData(BaseModel):
         if v:
             v = v.strip()
             # Accept formats like "23:30", "23:30 МСК"
-            time_match = re.match(r"(\d{1,2}:\d{2})", v)
+            time_match = _TIME_RE.match(v)
             if time_match:
                 return time_match.group(1)
         return v
@@ -171,7 +216,7 @@ class EventData(BaseModel):
     @classmethod
     def clean_name(cls, v: str) -> str:
         """Clean event name."""
-        return " ".join(v.split()).strip()
+        return " ".join(v.split())
     
     @field_validator("organization")
     @classmethod
@@ -215,7 +260,7 @@ class EventData(BaseModel):
         """Validate time format."""
         if v:
             v = v.strip()
-            time_match = re.match(r"(\d{1,2}:\d{2})", v)
+            time_match = _TIME_RE.match(v)
             if time_match:
                 return time_match.group(1)
         return v
@@ -225,9 +270,8 @@ class EventData(BaseModel):
     def clean_location(cls, v: Optional[str]) -> Optional[str]:
         """Clean location string."""
         if v:
-            v = " ".join(v.split()).strip()
-            # Remove trailing period
-            v = v.rstrip(".")
+            # Collapse whitespace and remove trailing period
+            v = " ".join(v.split()).rstrip(".")
             return v if v else None
         return None
     
@@ -241,27 +285,10 @@ class EventData(BaseModel):
         Returns:
             Organization name.
         """
-        # Common patterns
-        patterns = [
-            (r"^(UFC)\s*", "UFC"),
-            (r"^(ACA)\s*", "ACA"),
-            (r"^(PFL)\s*", "PFL"),
-            (r"^(Bellator)\s*", "BELLATOR"),
-            (r"^(KSW)\s*", "KSW"),
-            (r"^(OKTAGON)\s*", "OKTAGON"),
-            (r"^(Cage Warriors)\s*", "CAGE WARRIORS"),
-            (r"^(LFA)\s*", "LFA"),
-            (r"^(BRAVE CF)\s*", "BRAVE CF"),
-            (r"^(UAE Warriors)\s*", "UAE WARRIORS"),
-            (r"^(Ares FC)\s*", "ARES FC"),
-            (r"^(RIZIN)\s*", "RIZIN"),
-            (r"^(ONE)\s*", "ONE"),
-            (r"^(MMA Series)\s*", "MMA SERIES"),
-            (r"^(Open FC)\s*", "OPEN FC"),
-        ]
-        
-        for pattern, org in patterns:
-            if re.match(pattern, event_name, re.IGNORECASE):
+        # Common prefixes, matched case-insensitively
+        name_upper = event_name.upper()
+        for prefix, org in _ORG_PREFIXES:
+            if name_upper.startswith(prefix):
                 return org
         
         # Default: take first word
@@ -272,7 +299,7 @@ class ScrapedData(BaseModel):
     """Container for all scraped data."""
     
     events: List[EventData] = Field(default_factory=list)
-    scraped_at: datetime = Field(default_factory=datetime.utcnow)
+    scraped_at: datetime = Field(default_factory=utc_now)
     
     @property
     def total_events(self) -> int:
@@ -6,57 +6,112 @@ from datetime import datetime, timezone
 from typing import Generator
 
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import Connection, create_engine, event
+from sqlalchemy.orm import scoped_session, sessionmaker, Session
+from sqlalchemy.pool import StaticPool
+
+# Tests run against an in-memory database (test_engine); TEST_DB_PATH is
+# only the file the app's startup hook creates its schema in. Each
+# pytest-xdist worker (PYTEST_XDIST_WORKER is gw0, gw1, ...) gets its own
+# startup database file
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+TEST_DB_PATH = f"test_mma_data_{_XDIST_WORKER}.db" if _XDIST_WORKER else "test_mma_data.db"
 
 # Set test environment variables before importing app
 os.environ["JWT_SECRET"] = "test-secret-key-for-testing"
 os.environ["ADMIN_USERNAME"] = "testadmin"
 os.environ["ADMIN_PASSWORD"] = "testpass123"
+# Keep the app's startup hook away from the real mma_data.db
+os.environ["DATABASE_PATH"] = TEST_DB_PATH
 
-from database.models import Base, Event, Fight, Fighter, User, Prediction, Scorecard
+from database.models import (
+    Base, Event, Fight, Fighter, User, Prediction, Scorecard, PredictedWinner, WinMethod,
+)
 from database import Database
+from api.auth import create_access_token
 from api.main import app, get_database
 
 
-# Test database setup
-TEST_DB_PATH = "test_mma_data.db"
-
-
 @pytest.fixture(scope="session")
 def test_engine():
-    """Create a test database engine."""
-    engine = create_engine(f"sqlite:///{TEST_DB_PATH}", echo=False)
+    """Create one in-memory test database shared by every test.
+    
+    StaticPool hands the same connection to every checkout (including the
+    TestClient's thread), so all sessions see one database.
+    """
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        echo=False,
+    )
+    
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        # Same FK enforcement as Database; and let SQLAlchemy emit BEGIN
+        # itself, since pysqlite's own transaction handling breaks SAVEPOINT
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine, "begin")
+    def on_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+    
     Base.metadata.create_all(engine)
     yield engine
-    # Cleanup after all tests
-    Base.metadata.drop_all(engine)
-    if os.path.exists(TEST_DB_PATH):
-        os.remove(TEST_DB_PATH)
+    engine.dispose()
+    # WAL mode leaves -wal/-shm files next to the startup hook's database
+    for path in (TEST_DB_PATH, f"{TEST_DB_PATH}-wal", f"{TEST_DB_PATH}-shm"):
+        if os.path.exists(path):
+            os.remove(path)
 
 
 @pytest.fixture(scope="function")
-def db_session(test_engine) -> Generator[Session, None, None]:
+def db_connection(test_engine) -> Generator[Connection, None, None]:
+    """Open a transaction that is rolled back after each test.
+    
+    Sessions bound to this connection commit to savepoints inside it, so no
+    test sees another test's rows.
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="function")
+def db_session(db_connection) -> Generator[Session, None, None]:
     """Create a new database session for each test."""
-    SessionLocal = sessionmaker(bind=test_engine)
-    session = SessionLocal()
+    session = Session(bind=db_connection, join_transaction_mode="create_savepoint")
     try:
         yield session
     finally:
-        session.rollback()
         session.close()
 
 
 @pytest.fixture(scope="function")
-def test_db(test_engine) -> Generator[Database, None, None]:
-    """Create a test Database instance."""
+def test_db(db_connection) -> Generator[Database, None, None]:
+    """Create a test Database instance on the test's connection."""
     db = Database(TEST_DB_PATH)
+    db.SessionLocal = sessionmaker(bind=db_connection, join_transaction_mode="create_savepoint")
+    db.ScopedSession = scoped_session(db.SessionLocal)
     yield db
+    db.remove_session()
+
+
+@pytest.fixture(scope="session")
+def app_client() -> Generator[TestClient, None, None]:
+    """Start the app once; its startup hook runs a single time per session."""
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture(scope="function")
-def client(test_db) -> Generator[TestClient, None, None]:
-    """Create a test client with overridden database."""
+def client(app_client, test_db) -> Generator[TestClient, None, None]:
+    """Get the test client with the database overridden for this test."""
     # Override the database dependency
     def override_get_database():
         return test_db
@@ -66,11 +121,13 @@ def client(test_db) -> Generator[TestClient, None, None]:
     
     app.dependency_overrides[get_database] = override_get_database
     app.dependency_overrides[get_db] = override_get_database
+    # Cookies set by an earlier test (e.g. admin_session) must not carry over
+    app_client.cookies.clear()
     
-    with TestClient(app) as test_client:
-        yield test_client
+    yield app_client
     
     app.dependency_overrides.clear()
+    app_client.cookies.clear()
 
 
 @pytest.fixture
@@ -167,6 +224,28 @@ def sample_user(db_session) -> User:
     return user
 
 
+@pytest.fixture
+def make_prediction(db_session, sample_fight, sample_user):
+    """Get a function that adds a prediction by sample_user on sample_fight."""
+    def make(
+        predicted_winner: PredictedWinner = PredictedWinner.FIGHTER1,
+        win_method: WinMethod = WinMethod.KO_TKO,
+        commit: bool = True,
+    ) -> Prediction:
+        prediction = Prediction(
+            user_id=sample_user.id,
+            fight_id=sample_fight.id,
+            predicted_winner=predicted_winner,
+            win_method=win_method,
+        )
+        db_session.add(prediction)
+        if commit:
+            db_session.commit()
+        return prediction
+    
+    return make
+
+
 @pytest.fixture
 def admin_session(client) -> str:
     """Login as admin and return session cookie."""
@@ -177,3 +256,16 @@ def admin_session(client) -> str:
     assert response.status_code == 200
     return response.cookies.get("admin_session")
 
+
+@pytest.fixture
+def admin_client(client, admin_session) -> TestClient:
+    """Get the test client with the admin session cookie set."""
+    client.cookies.set("admin_session", admin_session)
+    return client
+
+
+@pytest.fixture
+def user_headers(sample_user) -> dict:
+    """Authorization header with an access token for sample_user."""
+    token = create_access_token(sample_user.id, sample_user.telegram_id)
+    return {"Authorization": f"Bearer {token}"}
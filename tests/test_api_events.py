@@ -22,7 +22,7 @@ class TestListEvents:
         assert len(events) >= 1
         assert any(e["slug"] == "test-event-1" for e in events)
 
-    def test_list_events_upcoming_only(self, client: TestClient, test_db, db_session):
+    def test_list_events_upcoming_only(self, client: TestClient, db_session):
         """Test filtering for upcoming events only."""
         # Create a past event
         past_event = Event(
@@ -32,9 +32,6 @@ class TestListEvents:
             url="https://example.com/past",
             is_upcoming=False,
         )
-        db_session.add(past_event)
-        db_session.commit()
-
         # Create upcoming event
         upcoming_event = Event(
             name="Upcoming Event",
@@ -43,7 +40,7 @@ class TestListEvents:
             url="https://example.com/upcoming",
             is_upcoming=True,
         )
-        db_session.add(upcoming_event)
+        db_session.add_all([past_event, upcoming_event])
         db_session.commit()
 
         # Default should only show upcoming
@@ -52,7 +49,7 @@ class TestListEvents:
         events = response.json()
         assert all(e["is_upcoming"] for e in events)
 
-    def test_list_events_all(self, client: TestClient, test_db, db_session):
+    def test_list_events_all(self, client: TestClient):
         """Test listing all events including past."""
         response = client.get("/api/events?upcoming_only=false")
         assert response.status_code == 200
@@ -87,10 +84,9 @@ class TestGetEvent:
 class TestAdminEvents:
     """Tests for admin event management."""
 
-    def test_create_event(self, client: TestClient, admin_session: str):
+    def test_create_event(self, admin_client: TestClient):
         """Test creating a new event."""
-        client.cookies.set("admin_session", admin_session)
-        response = client.post(
+        response = admin_client.post(
             "/api/admin/events",
             json={
                 "name": "New Test Event",
@@ -106,10 +102,9 @@ class TestAdminEvents:
         assert data["name"] == "New Test Event"
         assert data["organization"] == "Bellator"
 
-    def test_update_event(self, client: TestClient, admin_session: str, sample_event):
+    def test_update_event(self, admin_client: TestClient, sample_event):
         """Test updating an event."""
-        client.cookies.set("admin_session", admin_session)
-        response = client.put(
+        response = admin_client.put(
             f"/api/admin/events/{sample_event.id}",
             json={
                 "name": "Updated Event Name",
@@ -122,7 +117,7 @@ class TestAdminEvents:
         data = response.json()
         assert data["name"] == "Updated Event Name"
 
-    def test_delete_event(self, client: TestClient, admin_session: str, db_session):
+    def test_delete_event(self, admin_client: TestClient, db_session):
         """Test deleting an event."""
         # Create event to delete
         event = Event(
@@ -135,8 +130,7 @@ class TestAdminEvents:
         db_session.commit()
         event_id = event.id
 
-        client.cookies.set("admin_session", admin_session)
-        response = client.delete(f"/api/admin/events/{event_id}")
+        response = admin_client.delete(f"/api/admin/events/{event_id}")
         assert response.status_code == 200
         assert response.json()["success"] is True
 
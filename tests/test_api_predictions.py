@@ -3,18 +3,18 @@
 import pytest
 from datetime import datetime, timezone
 from fastapi.testclient import TestClient
+from database import db as db_module
 from database.models import User, Prediction, PredictedWinner, WinMethod
-from api.auth import create_access_token
+
+# Telegram auth time for the users these tests create
+NOW = datetime.now(timezone.utc)
 
 
 class TestCreatePrediction:
     """Tests for creating predictions."""
 
-    def test_create_prediction_success(self, client: TestClient, sample_fight, sample_user):
+    def test_create_prediction_success(self, client: TestClient, sample_fight, user_headers):
         """Test creating a prediction successfully."""
-        # Create auth token for user
-        token = create_access_token(sample_user.id, sample_user.telegram_id)
-        
         response = client.post(
             "/api/predictions",
             json={
@@ -23,7 +23,7 @@ class TestCreatePrediction:
                 "win_method": "ko_tko",
                 "confidence": 4,
             },
-            headers={"Authorization": f"Bearer {token}"}
+            headers=user_headers
         )
         assert response.status_code == 201
         data = response.json()
@@ -43,20 +43,12 @@ class TestCreatePrediction:
         )
         assert response.status_code == 401
 
-    def test_create_duplicate_prediction(self, client: TestClient, sample_fight, sample_user, db_session):
+    def test_create_duplicate_prediction(self, client: TestClient, sample_fight, user_headers, make_prediction):
         """Test that duplicate predictions are rejected."""
         # Create existing prediction
-        prediction = Prediction(
-            user_id=sample_user.id,
-            fight_id=sample_fight.id,
-            predicted_winner=PredictedWinner.FIGHTER1,
-            win_method=WinMethod.KO_TKO,
-        )
-        db_session.add(prediction)
-        db_session.commit()
+        make_prediction(PredictedWinner.FIGHTER1, WinMethod.KO_TKO)
 
         # Try to create another
-        token = create_access_token(sample_user.id, sample_user.telegram_id)
         response = client.post(
             "/api/predictions",
             json={
@@ -64,14 +56,13 @@ class TestCreatePrediction:
                 "predicted_winner": "fighter2",
                 "win_method": "submission",
             },
-            headers={"Authorization": f"Bearer {token}"}
+            headers=user_headers
         )
         assert response.status_code == 409
         assert "already" in response.json()["detail"].lower()
 
-    def test_create_prediction_invalid_fight(self, client: TestClient, sample_user):
+    def test_create_prediction_invalid_fight(self, client: TestClient, user_headers):
         """Test creating prediction for non-existent fight."""
-        token = create_access_token(sample_user.id, sample_user.telegram_id)
         response = client.post(
             "/api/predictions",
             json={
@@ -79,7 +70,7 @@ class TestCreatePrediction:
                 "predicted_winner": "fighter1",
                 "win_method": "ko_tko",
             },
-            headers={"Authorization": f"Bearer {token}"}
+            headers=user_headers
         )
         assert response.status_code == 404
 
@@ -87,104 +78,178 @@ class TestCreatePrediction:
 class TestGetPredictions:
     """Tests for getting predictions."""
 
-    def test_get_fight_predictions(self, client: TestClient, sample_fight, sample_user, db_session):
+    def test_get_fight_predictions(self, client: TestClient, sample_fight, make_prediction):
         """Test getting all predictions for a fight."""
         # Create some predictions
-        prediction = Prediction(
-            user_id=sample_user.id,
-            fight_id=sample_fight.id,
-            predicted_winner=PredictedWinner.FIGHTER1,
-            win_method=WinMethod.DECISION,
-        )
-        db_session.add(prediction)
-        db_session.commit()
+        make_prediction(PredictedWinner.FIGHTER1, WinMethod.DECISION)
 
         response = client.get(f"/api/predictions/fight/{sample_fight.id}")
         assert response.status_code == 200
         data = response.json()
         assert len(data) >= 1
 
-    def test_get_prediction_stats(self, client: TestClient, sample_fight, db_session):
-        """Test getting prediction statistics."""
-        # Create a user and predictions
-        user1 = User(
-            telegram_id=111111,
-            first_name="User1",
-            auth_date=datetime.now(timezone.utc),
-        )
-        user2 = User(
-            telegram_id=222222,
-            first_name="User2",
-            auth_date=datetime.now(timezone.utc),
-        )
-        db_session.add(user1)
-        db_session.add(user2)
+    def test_get_fight_predictions_same_second_newest_first(self, client: TestClient, sample_fight, db_session):
+        """Test that predictions stamped in the same second are listed newest (highest id) first."""
+        users = [User(telegram_id=300000 + i, first_name=f"User{i}", auth_date=NOW) for i in range(3)]
+        db_session.add_all(users)
+        db_session.flush()
+
+        created_at = NOW.replace(microsecond=0)
+        predictions = [
+            Prediction(
+                user_id=user.id,
+                fight_id=sample_fight.id,
+                predicted_winner=PredictedWinner.FIGHTER1,
+                win_method=WinMethod.DECISION,
+                created_at=created_at,
+            )
+            for user in users
+        ]
+        db_session.add_all(predictions)
         db_session.commit()
 
-        pred1 = Prediction(
-            user_id=user1.id,
-            fight_id=sample_fight.id,
-            predicted_winner=PredictedWinner.FIGHTER1,
-            win_method=WinMethod.KO_TKO,
-        )
-        pred2 = Prediction(
-            user_id=user2.id,
-            fight_id=sample_fight.id,
-            predicted_winner=PredictedWinner.FIGHTER2,
-            win_method=WinMethod.SUBMISSION,
+        response = client.get(f"/api/predictions/fight/{sample_fight.id}")
+        assert response.status_code == 200
+        assert [p["id"] for p in response.json()] == sorted((p.id for p in predictions), reverse=True)
+
+    @pytest.mark.parametrize(
+        "picks, expected",
+        [
+            (
+                [(PredictedWinner.FIGHTER1, WinMethod.KO_TKO), (PredictedWinner.FIGHTER2, WinMethod.SUBMISSION)],
+                (50.0, 50.0),
+            ),
+            (
+                [
+                    (PredictedWinner.FIGHTER1, WinMethod.KO_TKO),
+                    (PredictedWinner.FIGHTER1, WinMethod.KO_TKO),
+                    (PredictedWinner.FIGHTER2, WinMethod.SUBMISSION),
+                ],
+                (66.7, 33.3),
+            ),
+            ([(PredictedWinner.FIGHTER1, WinMethod.DECISION)], (100.0, 0.0)),
+            (
+                [
+                    (PredictedWinner.FIGHTER1, WinMethod.DECISION),
+                    (PredictedWinner.FIGHTER2, WinMethod.KO_TKO),
+                    (PredictedWinner.FIGHTER2, WinMethod.SUBMISSION),
+                    (PredictedWinner.FIGHTER2, WinMethod.DECISION),
+                ],
+                (25.0, 75.0),
+            ),
+        ],
+        ids=["even_split", "two_to_one", "one_sided", "one_to_three"],
+    )
+    def test_get_prediction_stats(self, client: TestClient, sample_fight, db_session, picks, expected):
+        """Test getting prediction statistics."""
+        # One user per prediction (a user predicts a fight once)
+        users = [
+            User(telegram_id=100000 + i, first_name=f"User{i}", auth_date=NOW)
+            for i in range(len(picks))
+        ]
+        db_session.add_all(users)
+        db_session.flush()
+
+        db_session.add_all(
+            Prediction(
+                user_id=user.id,
+                fight_id=sample_fight.id,
+                predicted_winner=winner,
+                win_method=method,
+            )
+            for user, (winner, method) in zip(users, picks)
         )
-        db_session.add(pred1)
-        db_session.add(pred2)
         db_session.commit()
 
+        fighter1_picks = sum(winner == PredictedWinner.FIGHTER1 for winner, _ in picks)
         response = client.get(f"/api/predictions/fight/{sample_fight.id}/stats")
         assert response.status_code == 200
         data = response.json()
-        assert data["total_predictions"] == 2
-        assert data["fighter1_picks"] == 1
-        assert data["fighter2_picks"] == 1
-        assert data["fighter1_percentage"] == 50.0
-        assert data["fighter2_percentage"] == 50.0
+        assert data["total_predictions"] == len(picks)
+        assert data["fighter1_picks"] == fighter1_picks
+        assert data["fighter2_picks"] == len(picks) - fighter1_picks
+        assert (data["fighter1_percentage"], data["fighter2_percentage"]) == expected
 
-    def test_get_my_predictions(self, client: TestClient, sample_fight, sample_user, db_session):
+    def test_get_my_predictions(self, client: TestClient, user_headers, make_prediction):
         """Test getting current user's predictions."""
         # Create prediction
-        prediction = Prediction(
-            user_id=sample_user.id,
-            fight_id=sample_fight.id,
-            predicted_winner=PredictedWinner.FIGHTER1,
-            win_method=WinMethod.DECISION,
-        )
-        db_session.add(prediction)
-        db_session.commit()
+        make_prediction(PredictedWinner.FIGHTER1, WinMethod.DECISION)
 
-        token = create_access_token(sample_user.id, sample_user.telegram_id)
         response = client.get(
             "/api/predictions/mine",
-            headers={"Authorization": f"Bearer {token}"}
+            headers=user_headers
         )
         assert response.status_code == 200
         data = response.json()
         assert len(data) >= 1
 
-    def test_get_my_fight_prediction(self, client: TestClient, sample_fight, sample_user, db_session):
+    def test_get_my_fight_prediction(self, client: TestClient, sample_fight, user_headers, make_prediction):
         """Test getting user's prediction for specific fight."""
-        prediction = Prediction(
-            user_id=sample_user.id,
-            fight_id=sample_fight.id,
-            predicted_winner=PredictedWinner.FIGHTER2,
-            win_method=WinMethod.SUBMISSION,
-        )
-        db_session.add(prediction)
-        db_session.commit()
+        make_prediction(PredictedWinner.FIGHTER2, WinMethod.SUBMISSION)
 
-        token = create_access_token(sample_user.id, sample_user.telegram_id)
         response = client.get(
             f"/api/predictions/mine/fight/{sample_fight.id}",
-            headers={"Authorization": f"Bearer {token}"}
+            headers=user_headers
         )
         assert response.status_code == 200
         data = response.json()
         assert data["predicted_winner"] == "fighter2"
         assert data["win_method"] == "submission"
 
+    def test_prediction_stats_refresh_after_new_prediction(self, client: TestClient, sample_fight, user_headers):
+        """Test that cached stats are invalidated when a prediction is created."""
+        response = client.get(f"/api/predictions/fight/{sample_fight.id}/stats")
+        assert response.status_code == 200
+        assert response.json()["total_predictions"] == 0
+
+        response = client.post(
+            "/api/predictions",
+            json={
+                "fight_id": sample_fight.id,
+                "predicted_winner": "fighter2",
+                "win_method": "decision",
+            },
+            headers=user_headers
+        )
+        assert response.status_code == 201
+
+        response = client.get(f"/api/predictions/fight/{sample_fight.id}/stats")
+        data = response.json()
+        assert data["total_predictions"] == 1
+        assert data["fighter2_picks"] == 1
+
+
+class TestStatsCache:
+    """Tests for the in-process stats cache."""
+
+    def test_invalidated_on_commit_not_flush(self, test_db, sample_fight, sample_user):
+        """Test that a new prediction drops cached stats only once it is committed."""
+        with test_db.get_session() as session:
+            test_db.get_fight_prediction_stats(session, sample_fight.id)
+
+            test_db.create_prediction(
+                session, sample_user.id, sample_fight.id, PredictedWinner.FIGHTER1, WinMethod.KO_TKO,
+            )
+            assert test_db._get_cached_stats("predictions", sample_fight.id) is not None
+
+            session.commit()
+            assert test_db._get_cached_stats("predictions", sample_fight.id) is None
+            assert test_db.get_fight_prediction_stats(session, sample_fight.id)["total_predictions"] == 1
+
+    def test_size_is_bounded(self, test_db, monkeypatch):
+        """Test that the oldest entries are evicted past STATS_CACHE_MAX_ENTRIES."""
+        monkeypatch.setattr(db_module, "STATS_CACHE_MAX_ENTRIES", 2)
+        for fight_id in range(1, 4):
+            test_db._set_cached_stats("predictions", fight_id, {"total_predictions": fight_id})
+
+        assert test_db._get_cached_stats("predictions", 1) is None
+        assert test_db._get_cached_stats("predictions", 3) == {"total_predictions": 3}
+        assert len(test_db._stats_cache) == 2
+
+    def test_expired_entries_evicted_on_insert(self, test_db):
+        """Test that expired entries are dropped without being read again."""
+        test_db._set_cached_stats("predictions", 1, {"total_predictions": 1})
+        test_db._stats_cache[("predictions", 1)] = (0.0, {"total_predictions": 1})
+        test_db._set_cached_stats("predictions", 2, {"total_predictions": 2})
+
+        assert list(test_db._stats_cache) == [("predictions", 2)]
@@ -0,0 +1,104 @@
+"""Tests for Scorecards API endpoints."""
+
+from fastapi.testclient import TestClient
+
+
+class TestCreateScorecard:
+    """Tests for creating scorecards."""
+
+    def test_create_scorecard_stores_totals(self, client: TestClient, sample_fight, user_headers):
+        """Test that totals and winner are computed when the scorecard is created."""
+        round_scores = [
+            {"round_number": 1, "fighter1_score": 10, "fighter2_score": 9},
+            {"round_number": 2, "fighter1_score": 9, "fighter2_score": 10},
+            {"round_number": 3, "fighter1_score": 9, "fighter2_score": 10},
+            {"round_number": 4, "fighter1_score": 10, "fighter2_score": 9},
+            {"round_number": 5, "fighter1_score": 8, "fighter2_score": 10},
+        ]
+        response = client.post(
+            "/api/scorecards",
+            json={"fight_id": sample_fight.id, "round_scores": round_scores},
+            headers=user_headers
+        )
+        assert response.status_code == 201
+        data = response.json()
+        assert data["total_fighter1"] == 46
+        assert data["total_fighter2"] == 48
+        assert data["winner"] == "fighter2"
+
+        response = client.get(f"/api/scorecards/fight/{sample_fight.id}/stats")
+        assert response.status_code == 200
+        stats = response.json()
+        assert stats["total_scorecards"] == 1
+        assert stats["fighter2_wins"] == 1
+        assert stats["average_total_fighter1"] == 46.0
+        assert stats["rounds"]["5"]["average_fighter1"] == 8.0
+
+    def test_create_scorecard_wrong_round_count(self, client: TestClient, sample_fight, user_headers):
+        """Test that a scorecard must cover every scheduled round."""
+        response = client.post(
+            "/api/scorecards",
+            json={
+                "fight_id": sample_fight.id,
+                "round_scores": [{"round_number": 1, "fighter1_score": 10, "fighter2_score": 9}],
+            },
+            headers=user_headers
+        )
+        assert response.status_code == 400
+
+    def test_create_duplicate_scorecard(self, client: TestClient, sample_fight, user_headers):
+        """Test that duplicate scorecards are rejected."""
+        payload = {
+            "fight_id": sample_fight.id,
+            "round_scores": [
+                {"round_number": n, "fighter1_score": 10, "fighter2_score": 9}
+                for n in range(1, 6)
+            ],
+        }
+        assert client.post("/api/scorecards", json=payload, headers=user_headers).status_code == 201
+
+        response = client.post("/api/scorecards", json=payload, headers=user_headers)
+        assert response.status_code == 409
+        assert "already" in response.json()["detail"].lower()
+
+
+class TestGetScorecards:
+    """Tests for listing scorecards."""
+
+    def _submit(self, client: TestClient, fight_id: int, user_headers: dict):
+        return client.post(
+            "/api/scorecards",
+            json={
+                "fight_id": fight_id,
+                "round_scores": [
+                    {"round_number": n, "fighter1_score": 10, "fighter2_score": 9}
+                    for n in range(1, 6)
+                ],
+            },
+            headers=user_headers
+        )
+
+    def test_get_fight_scorecards(self, client: TestClient, sample_fight, sample_user, user_headers):
+        """Test listing scorecards for a fight includes rounds and user."""
+        assert self._submit(client, sample_fight.id, user_headers).status_code == 201
+
+        response = client.get(f"/api/scorecards/fight/{sample_fight.id}")
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert len(data[0]["round_scores"]) == 5
+        assert data[0]["user"]["id"] == sample_user.id
+
+    def test_get_my_scorecards(self, client: TestClient, sample_fight, user_headers):
+        """Test listing the current user's scorecards includes fight details."""
+        assert self._submit(client, sample_fight.id, user_headers).status_code == 201
+
+        response = client.get(
+            "/api/scorecards/mine",
+            headers=user_headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["fight"]["fighter1"]["name"] == sample_fight.fighter1.name
+        assert data[0]["fight"]["event_name"] is not None
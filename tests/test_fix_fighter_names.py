@@ -0,0 +1,80 @@
+"""Tests for fighter name cleaning."""
+
+import re
+
+import pytest
+
+from fix_fighter_names import (
+    ARTIFACT_PATTERNS, MAX_STRATEGY_ROUNDS,
+    apply_strategies, clean_fighter_name, clean_fighter_names,
+)
+from fix_fighter_names_all import STRATEGIES
+from fix_fighter_names_v2 import extract_fighter_names
+
+
+def sequential_clean(name: str) -> str:
+    """Clean a name with one re.sub pass per artifact pattern, in list order."""
+    original = name
+    for pattern in ARTIFACT_PATTERNS:
+        name = re.sub(pattern, '', name, flags=re.IGNORECASE)
+    name = ' '.join(name.split())
+    return name if len(name) >= 3 else original
+
+
+# Artifacts that overlap each other, where the order of removal matters
+OVERLAPPING_NAMES = [
+    "John Doe Straight Right Hand",
+    "John Doe Straight Left Hand",
+    "Straight Right Hand John Doe",
+    "John Doe Straight Right Hook",
+    "John Doe Straight Left Hook",
+    "John Doe Straight Right",
+    "John Doe Right Hand Straight",
+    "Flying Knee to the Body John Doe",
+    "John Doe Knee to the Body Shot",
+    "John Doe Elbows from Back Mount",
+    "No KO Contest Ivan",
+]
+
+
+class TestCleanFighterName:
+    """Tests for the fused artifact regex."""
+
+    @pytest.mark.parametrize("name", OVERLAPPING_NAMES)
+    def test_matches_sequential_passes(self, name: str):
+        """Test that overlapping artifacts are removed as by one pass per pattern."""
+        assert clean_fighter_name(name) == sequential_clean(name)
+
+    def test_straight_right_hand(self):
+        """Test that no part of an overlapping compound artifact is left behind."""
+        assert clean_fighter_name("John Doe Straight Right Hand") == "John Doe"
+        assert clean_fighter_name("John Doe Straight Left Hand") == "John Doe"
+
+    @pytest.mark.parametrize("name", ["John Doe TKO/KO", "TKO/KO John Doe", "John TKO/KO Doe"])
+    def test_tko_ko_removed_whole(self, name: str):
+        """Test that TKO/KO leaves no "/" behind (the per-pattern passes did)."""
+        assert sequential_clean(name) != "John Doe"
+        assert clean_fighter_name(name) == "John Doe"
+
+    def test_batch_matches_single(self):
+        """Test that the batch cleaner gives the same names as the single one."""
+        assert clean_fighter_names(OVERLAPPING_NAMES) == [
+            clean_fighter_name(name) for name in OVERLAPPING_NAMES
+        ]
+
+
+class TestApplyStrategies:
+    """Tests for running cleaning strategies over a batch of names."""
+
+    def test_single_strategy_runs_once(self):
+        """Test that one strategy is applied once, as the standalone script does."""
+        assert apply_strategies([clean_fighter_names], ["No KO Contest Ivan"]) == ["No Contest Ivan"]
+
+    def test_one_round_matches_scripts_in_turn(self):
+        """Test that one round equals running each strategy's script in turn."""
+        names = ["No KO Contest Ivan"]
+        assert apply_strategies(STRATEGIES, names) == extract_fighter_names(clean_fighter_names(names))
+
+    def test_rounds_repeat_until_unchanged(self):
+        """Test that extra rounds keep cleaning what the first round uncovered."""
+        assert apply_strategies(STRATEGIES, ["No KO Contest Ivan"], rounds=MAX_STRATEGY_ROUNDS) == ["Ivan"]
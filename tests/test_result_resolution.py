@@ -1,13 +1,12 @@
 """Tests for fight result resolution logic."""
 
 import pytest
-from datetime import datetime, timezone
 from sqlalchemy.orm import Session
 
 from database.models import (
-    Fight, FightResult, Prediction, Scorecard, RoundScore,
+    FightResult, Scorecard, RoundScore,
     OfficialScorecard, OfficialRoundScore,
-    User, PredictedWinner, WinMethod, FightWinner,
+    PredictedWinner, WinMethod, FightWinner,
 )
 from api.services.result_resolution import (
     resolve_predictions,
@@ -19,24 +18,29 @@ from api.services.result_resolution import (
 class TestResolvePredictions:
     """Tests for prediction resolution."""
 
-    def test_correct_prediction_winner_and_method(self, db_session: Session, sample_fight, sample_user):
-        """Test that correct winner + method prediction is marked correct."""
+    @pytest.mark.parametrize(
+        "predicted_method, winner, method, expected",
+        [
+            (WinMethod.KO_TKO, FightWinner.FIGHTER1, WinMethod.KO_TKO, True),
+            (WinMethod.KO_TKO, FightWinner.FIGHTER2, WinMethod.KO_TKO, False),
+            (WinMethod.KO_TKO, FightWinner.FIGHTER1, WinMethod.SUBMISSION, False),
+            (WinMethod.DECISION, FightWinner.DRAW, WinMethod.DECISION, False),
+        ],
+        ids=["correct_winner_and_method", "wrong_winner", "wrong_method", "draw_marks_all_incorrect"],
+    )
+    def test_resolve_prediction(
+        self, db_session: Session, sample_fight, make_prediction,
+        predicted_method, winner, method, expected,
+    ):
+        """Test that a fighter1 prediction is marked correct only on a matching result."""
         # Create prediction
-        prediction = Prediction(
-            user_id=sample_user.id,
-            fight_id=sample_fight.id,
-            predicted_winner=PredictedWinner.FIGHTER1,
-            win_method=WinMethod.KO_TKO,
-        )
-        db_session.add(prediction)
-        db_session.commit()
+        prediction = make_prediction(PredictedWinner.FIGHTER1, predicted_method, commit=False)
 
         # Create fight result
         result = FightResult(
             fight_id=sample_fight.id,
-            winner=FightWinner.FIGHTER1,
-            method=WinMethod.KO_TKO,
-            finish_round=2,
+            winner=winner,
+            method=method,
         )
         db_session.add(result)
         db_session.commit()
@@ -46,81 +50,9 @@ class TestResolvePredictions:
         
         assert count == 1
         db_session.refresh(prediction)
-        assert prediction.is_correct is True
+        assert prediction.is_correct is expected
         assert prediction.resolved_at is not None
 
-    def test_wrong_winner_prediction(self, db_session: Session, sample_fight, sample_user):
-        """Test that wrong winner prediction is marked incorrect."""
-        prediction = Prediction(
-            user_id=sample_user.id,
-            fight_id=sample_fight.id,
-            predicted_winner=PredictedWinner.FIGHTER1,
-            win_method=WinMethod.KO_TKO,
-        )
-        db_session.add(prediction)
-        db_session.commit()
-
-        result = FightResult(
-            fight_id=sample_fight.id,
-            winner=FightWinner.FIGHTER2,  # Different winner
-            method=WinMethod.KO_TKO,
-        )
-        db_session.add(result)
-        db_session.commit()
-
-        resolve_predictions(db_session, sample_fight.id, result)
-        
-        db_session.refresh(prediction)
-        assert prediction.is_correct is False
-
-    def test_wrong_method_prediction(self, db_session: Session, sample_fight, sample_user):
-        """Test that wrong method prediction is marked incorrect."""
-        prediction = Prediction(
-            user_id=sample_user.id,
-            fight_id=sample_fight.id,
-            predicted_winner=PredictedWinner.FIGHTER1,
-            win_method=WinMethod.KO_TKO,
-        )
-        db_session.add(prediction)
-        db_session.commit()
-
-        result = FightResult(
-            fight_id=sample_fight.id,
-            winner=FightWinner.FIGHTER1,  # Correct winner
-            method=WinMethod.SUBMISSION,  # Different method
-        )
-        db_session.add(result)
-        db_session.commit()
-
-        resolve_predictions(db_session, sample_fight.id, result)
-        
-        db_session.refresh(prediction)
-        assert prediction.is_correct is False
-
-    def test_draw_result_marks_all_incorrect(self, db_session: Session, sample_fight, sample_user):
-        """Test that draw result marks all predictions incorrect."""
-        prediction = Prediction(
-            user_id=sample_user.id,
-            fight_id=sample_fight.id,
-            predicted_winner=PredictedWinner.FIGHTER1,
-            win_method=WinMethod.DECISION,
-        )
-        db_session.add(prediction)
-        db_session.commit()
-
-        result = FightResult(
-            fight_id=sample_fight.id,
-            winner=FightWinner.DRAW,
-            method=WinMethod.DECISION,
-        )
-        db_session.add(result)
-        db_session.commit()
-
-        resolve_predictions(db_session, sample_fight.id, result)
-        
-        db_session.refresh(prediction)
-        assert prediction.is_correct is False
-
 
 class TestResolveScorecards:
     """Tests for scorecard resolution."""
@@ -133,7 +65,7 @@ class TestResolveScorecards:
             fight_id=sample_fight.id,
         )
         db_session.add(scorecard)
-        db_session.commit()
+        db_session.flush()
 
         round_score = RoundScore(
             scorecard_id=scorecard.id,
@@ -142,7 +74,7 @@ class TestResolveScorecards:
             fighter2_score=9,
         )
         db_session.add(round_score)
-        db_session.commit()
+        db_session.flush()
 
         # Create fight result with official scorecard
         result = FightResult(
@@ -151,14 +83,14 @@ class TestResolveScorecards:
             method=WinMethod.DECISION,
         )
         db_session.add(result)
-        db_session.commit()
+        db_session.flush()
 
         official = OfficialScorecard(
             fight_result_id=result.id,
             judge_name="Judge 1",
         )
         db_session.add(official)
-        db_session.commit()
+        db_session.flush()
 
         official_round = OfficialRoundScore(
             official_scorecard_id=official.id,
@@ -186,7 +118,7 @@ class TestResolveScorecards:
             fight_id=sample_fight.id,
         )
         db_session.add(scorecard)
-        db_session.commit()
+        db_session.flush()
 
         round_score = RoundScore(
             scorecard_id=scorecard.id,
@@ -195,7 +127,7 @@ class TestResolveScorecards:
             fighter2_score=9,
         )
         db_session.add(round_score)
-        db_session.commit()
+        db_session.flush()
 
         result = FightResult(
             fight_id=sample_fight.id,
@@ -203,14 +135,14 @@ class TestResolveScorecards:
             method=WinMethod.DECISION,
         )
         db_session.add(result)
-        db_session.commit()
+        db_session.flush()
 
         official = OfficialScorecard(
             fight_result_id=result.id,
             judge_name="Judge 1",
         )
         db_session.add(official)
-        db_session.commit()
+        db_session.flush()
 
         # Different score
         official_round = OfficialRoundScore(
@@ -231,17 +163,10 @@ class TestResolveScorecards:
 class TestFullResolution:
     """Tests for complete fight result resolution."""
 
-    def test_resolve_fight_result_marks_resolved(self, db_session: Session, sample_fight, sample_user):
+    def test_resolve_fight_result_marks_resolved(self, db_session: Session, sample_fight, make_prediction):
         """Test that resolve_fight_result marks result as resolved."""
         # Create prediction
-        prediction = Prediction(
-            user_id=sample_user.id,
-            fight_id=sample_fight.id,
-            predicted_winner=PredictedWinner.FIGHTER1,
-            win_method=WinMethod.KO_TKO,
-        )
-        db_session.add(prediction)
-        db_session.commit()
+        make_prediction(PredictedWinner.FIGHTER1, WinMethod.KO_TKO)
 
         # Create result
         result = FightResult(